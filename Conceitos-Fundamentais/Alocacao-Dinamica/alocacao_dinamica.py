@@ -8,6 +8,10 @@ de estruturas que crescem conforme necessário.
 Autores: Alef Khatab
 '''
 
+from itertools import islice
+
+from pool_de_nos import Node, NodePool, REPR_LIMIT, bounded_str
+
 # 1. Lista dinâmica
 class DynamicList:
     def __init__(self):
@@ -29,48 +33,117 @@ class DynamicList:
     def size(self):
         return len(self.items)
     
+    def __len__(self):
+        return len(self.items)
+    
+    def __iter__(self):
+        return iter(self.items)  # Iterador da própria lista, sem cópia
+    
+    def __reversed__(self):
+        return reversed(self.items)
+    
+    def view(self, start=0, stop=None):
+        return islice(self.items, start, stop)  # Fatia preguiçosa, sem copiar os itens
+    
     def __str__(self):
-        return str(self.items)
+        return bounded_str(self.items, len(self.items))  # No máximo REPR_LIMIT itens
+    
+    def __repr__(self):
+        return f"DynamicList(tamanho={len(self.items)}, itens={self})"
 
 # 2. Lista encadeada - exemplo clássico de estrutura com alocação dinâmica
-class Node:
-    def __init__(self, data):
-        self.data = data
-        self.next = None  # Referência para o próximo nó
-
+# Os nós (Node) e a reserva opcional de nós (NodePool) estão em pool_de_nos.py
 class LinkedList:
-    def __init__(self):
+    # doubly=True guarda também o nó anterior em cada nó (remoção por referência em O(1));
+    # indexed=True mantém um dicionário valor -> nós, como um LinkedHashMap (implica doubly)
+    def __init__(self, pool=None, doubly=False, indexed=False):
         self.head = None  # Início da lista
+        self.tail = None  # Fim da lista: append não precisa percorrer os nós
         self.size = 0
+        self.pool = pool  # Reserva de nós opcional: nós removidos são reaproveitados
+        self.new_node = Node if pool is None else pool.acquire
+        self.doubly = doubly or indexed
+        self.index = {} if indexed else None  # Nós de cada valor, na ordem da lista
     
     def append(self, data):
-        new_node = Node(data)  # Aloca dinamicamente um novo nó
+        new_node = self.new_node(data)  # Aloca dinamicamente (ou reaproveita) um nó
         
         if not self.head:  # Se a lista estiver vazia
             self.head = new_node
         else:
-            current = self.head
-            # Navega até o último nó
-            while current.next:
-                current = current.next
-            current.next = new_node  # Liga o último nó ao novo
+            self.tail.next = new_node  # Liga o último nó ao novo, sem percorrer a lista
+            if self.doubly:
+                new_node.prev = self.tail
+        self.tail = new_node
         
+        if self.index is not None:
+            self.index.setdefault(data, []).append(new_node)
         self.size += 1
+        return new_node  # Referência para remove_node
     
     def prepend(self, data):
-        new_node = Node(data)  # Aloca dinamicamente um novo nó
+        new_node = self.new_node(data)  # Aloca dinamicamente (ou reaproveita) um nó
         new_node.next = self.head  # Novo nó aponta para o antigo head
+        if self.head is None:
+            self.tail = new_node
+        elif self.doubly:
+            self.head.prev = new_node
         self.head = new_node  # Atualiza o head
+        
+        if self.index is not None:
+            self.index.setdefault(data, []).insert(0, new_node)
         self.size += 1
+        return new_node
+    
+    def remove_node(self, node):
+        # Remove um nó retornado por append/prepend: O(1) se duplamente encadeada
+        if self.doubly:
+            previous = node.prev
+        else:
+            previous = None
+            current = self.head
+            while current is not node:  # Lista simples: procura o nó anterior
+                previous = current
+                current = current.next
+        
+        if previous is None:
+            self.head = node.next
+        else:
+            previous.next = node.next
+        if node.next is None:
+            self.tail = previous
+        elif self.doubly:
+            node.next.prev = previous
+        
+        data = node.data
+        if self.index is not None:
+            nodes = self.index[data]
+            nodes.remove(node)
+            if not nodes:
+                del self.index[data]
+        self.size -= 1
+        self._release(node)
+        return data
+    
+    def pop_back(self):
+        if not self.head:
+            raise IndexError("Pop from an empty list")
+        return self.remove_node(self.tail)  # O(1) se duplamente encadeada
     
     def delete(self, data):
         if not self.head:  # Se a lista estiver vazia
             return False
         
+        # Com índice: o primeiro nó com o valor é encontrado sem percorrer a lista
+        if self.index is not None:
+            if data not in self.index:
+                return False
+            self.remove_node(self.index[data][0])
+            return True
+        
         # Caso especial: o nó a ser removido é o head
         if self.head.data == data:
-            self.head = self.head.next  # O head passa a ser o próximo nó
-            self.size -= 1
+            self.remove_node(self.head)
             return True
         
         # Caso geral: busca o nó a ser removido
@@ -80,22 +153,56 @@ class LinkedList:
         
         # Se encontrou o nó
         if current.next:
-            current.next = current.next.next  # Pula o nó a ser removido
+            removed = current.next
+            current.next = removed.next  # Pula o nó a ser removido
+            if removed.next is None:
+                self.tail = current
+            elif self.doubly:
+                removed.next.prev = current
             self.size -= 1
+            self._release(removed)
             return True
         
         return False  # Nó não encontrado
     
+    def _release(self, node):
+        if self.pool is not None:
+            self.pool.release(node)  # Devolve o nó à reserva em vez de descartá-lo
+    
     def get_size(self):
         return self.size
     
-    def __str__(self):
-        values = []
+    def __len__(self):
+        return self.size
+    
+    def __iter__(self):
         current = self.head
-        while current:
-            values.append(str(current.data))
+        while current:  # Gerador: um nó por vez, sem copiar a lista
+            yield current.data
             current = current.next
+    
+    def __reversed__(self):
+        if not self.doubly:
+            values = list(self)  # Lista simples: os nós só apontam para frente
+            values.reverse()
+            yield from values
+            return
+        current = self.tail
+        while current:
+            yield current.data
+            current = current.prev
+    
+    def view(self, start=0, stop=None):
+        return islice(self, start, stop)
+    
+    def __str__(self):
+        values = [str(data) for data in islice(self, REPR_LIMIT)]  # No máximo REPR_LIMIT nós
+        if self.size > REPR_LIMIT:
+            values.append("...")
         return " -> ".join(values)
+    
+    def __repr__(self):
+        return f"LinkedList(tamanho={self.size}, itens={bounded_str(self, self.size)})"
 
 # 3. Matriz dinâmica
 class DynamicMatrix:
@@ -183,6 +290,35 @@ def main():
     print(f"Lista encadeada após delete(20): {linked_list}")
     print(f"Tamanho da lista encadeada: {linked_list.get_size()}")
     
+    # Reaproveitando nós removidos com uma reserva (pool)
+    pool = NodePool()
+    pooled_list = LinkedList(pool)
+    pooled_list.append("x")
+    pooled_list.append("y")
+    pooled_list.delete("x")
+    pooled_list.prepend("z")  # Usa o nó liberado por delete("x")
+    print(f"Lista com reserva de nós: {pooled_list} ({pool})")
+    
+    # Lista duplamente encadeada e indexada por valor
+    registry = LinkedList(indexed=True)
+    for name in ("ana", "bia", "caio"):
+        registry.append(name)
+    handle = registry.append("davi")
+    registry.delete("bia")  # Encontrado pelo índice, sem percorrer a lista
+    registry.remove_node(handle)  # Removido pela referência retornada por append
+    print(f"Lista indexada após delete('bia') e remove_node: {registry}")
+    print(f"pop_back(): {registry.pop_back()}, restante: {registry}")
+    
+    # Percorrendo as estruturas sem copiá-las
+    print(f"Estudantes em ordem inversa: {list(reversed(students))}")
+    numbers = LinkedList(doubly=True)
+    for i in range(100000):
+        numbers.append(i)
+    print(f"Soma percorrendo a lista encadeada: {sum(numbers)}")
+    print(f"Três últimos nós: {list(islice(reversed(numbers), 3))}")
+    print(f"Nós 10 a 12: {list(numbers.view(10, 13))}")
+    print(f"Lista encadeada com {len(numbers)} nós: {numbers}")
+    
     # Usando matriz dinâmica
     print("\n--- Matriz Dinâmica ---")
     matrix = DynamicMatrix()
@@ -0,0 +1,136 @@
+'''
+Nós Encadeados e Reserva de Nós (Pool)
+
+Este arquivo define o nó compartilhado pelas estruturas encadeadas do repositório
+(LinkedStack em pilha.py e as classes LinkedList) e uma reserva limitada de nós
+liberados (freelist). Em vez de alocar um nó novo a cada inserção e descartá-lo a
+cada remoção, as estruturas podem devolver os nós à reserva e reaproveitá-los,
+ilustrando como alocadores de memória evitam chamadas repetidas ao sistema.
+Também define bounded_str e print_joined, usadas pelas estruturas lineares para
+exibir seus itens sem montar uma cópia da estrutura inteira.
+
+Autor: Alef Khatab
+'''
+
+from itertools import islice
+import sys
+
+REPR_LIMIT = 20  # Máximo de itens exibidos por __str__ e __repr__ das estruturas
+
+def bounded_str(items, size, limit=REPR_LIMIT, reverse=False):
+    '''
+    Retorna uma string no formato de lista com no máximo limit itens do iterável
+    items (que tem size itens), indicando os itens omitidos com "...".
+    Com reverse=True, os itens lidos são exibidos em ordem inversa e "..." vem
+    primeiro (usado pelas pilhas, que exibem o topo à direita).
+    Tempo: O(limit), sem percorrer o restante da estrutura
+    '''
+    shown = [repr(item) for item in islice(items, limit)]
+    if reverse:
+        shown.reverse()
+    if size > limit:
+        shown.insert(0 if reverse else len(shown), "...")
+    return "[" + ", ".join(shown) + "]"
+
+def print_joined(items, separator=" -> ", batch=1024):
+    '''
+    Imprime os itens separados por separator, convertendo e escrevendo batch itens
+    por vez, sem montar a string inteira na memória
+    Tempo: O(n), com O(batch) de memória extra
+    '''
+    items = iter(items)
+    prefix = ""
+    while chunk := [str(item) for item in islice(items, batch)]:
+        sys.stdout.write(prefix + separator.join(chunk))
+        prefix = separator
+    sys.stdout.write("\n")
+
+class Node:
+    '''
+    Nó de uma estrutura encadeada.
+    __slots__ elimina o dicionário de atributos de cada nó, reduzindo a memória
+    ocupada e acelerando o acesso a data, next e prev.
+    '''
+    __slots__ = ("data", "next", "prev")
+    
+    def __init__(self, data):
+        self.data = data  # Dado armazenado no nó
+        self.next = None  # Referência para o próximo nó
+        self.prev = None  # Referência para o nó anterior (só nas listas duplamente encadeadas)
+
+class NodePool:
+    '''
+    Reserva limitada de nós liberados, mantida como uma lista encadeada pelos
+    próprios campos next dos nós (freelist). Registra acertos (nós reaproveitados),
+    faltas (nós alocados) e o maior tamanho atingido pela reserva.
+    '''
+    def __init__(self, capacity=1024):
+        self.capacity = capacity  # Máximo de nós guardados; o excedente fica para o coletor de lixo
+        self.free_head = None  # Primeiro nó livre
+        self.free_count = 0  # Número de nós livres
+        self.hits = 0  # Nós entregues a partir da reserva
+        self.misses = 0  # Nós alocados porque a reserva estava vazia
+        self.peak = 0  # Maior número de nós livres ao mesmo tempo
+    
+    def acquire(self, data):
+        '''
+        Retorna um nó com o dado informado, reaproveitando um nó livre se houver
+        Tempo: O(1)
+        '''
+        node = self.free_head
+        if node is None:
+            self.misses += 1
+            return Node(data)
+        self.free_head = node.next
+        self.free_count -= 1
+        self.hits += 1
+        node.data = data
+        node.next = None
+        return node
+    
+    def release(self, node):
+        '''
+        Devolve um nó que não pertence mais a nenhuma estrutura
+        Tempo: O(1)
+        '''
+        node.data = None  # Não mantém o dado vivo enquanto o nó está na reserva
+        node.prev = None
+        if self.free_count >= self.capacity:
+            node.next = None
+            return
+        node.next = self.free_head
+        self.free_head = node
+        self.free_count += 1
+        if self.free_count > self.peak:
+            self.peak = self.free_count
+    
+    def stats(self):
+        '''
+        Retorna as estatísticas da reserva
+        '''
+        return {"hits": self.hits, "misses": self.misses, "peak": self.peak, "free": self.free_count}
+    
+    def __str__(self):
+        return (f"NodePool(livres={self.free_count}/{self.capacity}, acertos={self.hits}, "
+                f"faltas={self.misses}, pico={self.peak})")
+
+# Demonstração de uso
+def main():
+    print("\n=== Reserva de Nós (Pool) ===\n")
+    
+    pool = NodePool(capacity=2)
+    first = pool.acquire("A")
+    second = pool.acquire("B")
+    third = pool.acquire("C")
+    print(f"Três nós alocados: {pool}")
+    
+    for node in (first, second, third):
+        pool.release(node)
+    print(f"Três nós liberados (capacidade 2): {pool}")
+    
+    reused = pool.acquire("D")
+    print(f"Nó reaproveitado contém {reused.data!r}: {pool}")
+    print(f"Estatísticas: {pool.stats()}")
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,17 @@ ilustará o conceito de alocação estática através de estruturas de tamanho f
 Autores: Alef Khatab 
 '''
 
+from array import array
+from itertools import repeat
+import operator
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional
+    np = None
+
 # 1. Variáveis globais (alocação estática)
 MAX_STUDENTS = 30
 COURSE_NAME = "Estruturas de Dados"
@@ -43,27 +54,179 @@ class FixedSizeArray:
     def __str__(self):
         return str([self.array[i] for i in range(self.count)])
 
-# 3. Matriz estática (bidimensional)
+# 3. Matriz estática (bidimensional) em um bloco contíguo de memória
+INTEGER_TYPECODES = "bBhHiIlLqQ"  # Códigos do módulo array para inteiros
+
 class StaticMatrix:
-    def __init__(self, rows, cols):
+    '''
+    Matriz de tamanho fixo armazenada em um único bloco contíguo, linha após linha
+    (row-major): o elemento (row, col) fica na posição row * cols + col.
+    typecode segue os códigos do módulo array ('d' = float de 8 bytes, o padrão, que
+    aceita inteiros e floats; 'q' = inteiro de 8 bytes, ...). Com use_numpy=None, o bloco
+    é um array NumPy quando a biblioteca estiver instalada, e add, scale, transpose e
+    matmul são vetorizadas.
+    
+    Mudança em relação à versão com listas de listas: o atributo matrix não existe mais
+    (os elementos ficam em data, acessíveis por get_value, row e column) e os valores
+    precisam ser números compatíveis com typecode.
+    '''
+    def __init__(self, rows, cols, typecode='d', use_numpy=None):
         self.rows = rows
         self.cols = cols
-        # Cria uma matriz rows x cols preenchida com zeros
-        self.matrix = [[0 for _ in range(cols)] for _ in range(rows)]
+        self.typecode = typecode  # Tipo dos elementos
+        self.use_numpy = np is not None if use_numpy is None else use_numpy
+        if self.use_numpy:
+            if np is None:
+                raise ImportError("NumPy is not installed")
+            self.data = np.zeros(rows * cols, dtype=typecode)  # Bloco contíguo zerado
+        else:
+            self.data = array(typecode, [0]) * (rows * cols)  # Bloco contíguo zerado
+    
+    @classmethod
+    def from_rows(cls, rows, typecode='d', use_numpy=None):
+        '''
+        Cria uma matriz a partir de uma sequência de linhas de mesmo tamanho
+        '''
+        rows = [list(row) for row in rows]
+        matrix = cls(len(rows), len(rows[0]) if rows else 0, typecode, use_numpy)
+        for i, row in enumerate(rows):
+            if len(row) != matrix.cols:
+                raise ValueError("All rows must have the same length")
+            matrix.data[i * matrix.cols:(i + 1) * matrix.cols] = array(typecode, row)
+        return matrix
+    
+    def _with_data(self, rows, cols, data):
+        '''Nova matriz rows x cols que usa o bloco data já preenchido, sem copiá-lo'''
+        matrix = StaticMatrix.__new__(StaticMatrix)
+        matrix.rows = rows
+        matrix.cols = cols
+        matrix.typecode = data.dtype.char if self.use_numpy else data.typecode
+        matrix.use_numpy = self.use_numpy
+        matrix.data = data
+        return matrix
     
     def set_value(self, row, col, value):
-        if row < 0 or row >= self.rows or col < 0 or col >= self.cols:
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
             raise IndexError("Índice fora dos limites da matriz!")
-        self.matrix[row][col] = value
+        self.data[row * self.cols + col] = value
     
     def get_value(self, row, col):
-        if row < 0 or row >= self.rows or col < 0 or col >= self.cols:
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
             raise IndexError("Índice fora dos limites da matriz!")
-        return self.matrix[row][col]
+        return self.data[row * self.cols + col]
+    
+    def fill(self, value):
+        '''
+        Atribui value a todos os elementos, dobrando o trecho preenchido a cada cópia
+        de bloco (O(log n) cópias em código C, sem arrays temporários)
+        Tempo: O(n)
+        '''
+        if self.use_numpy:
+            self.data.fill(value)
+            return
+        size = len(self.data)
+        if size == 0:
+            return
+        view = memoryview(self.data)
+        self.data[0] = value
+        filled = 1
+        while filled < size:
+            count = min(filled, size - filled)
+            view[filled:filled + count] = view[:count]
+            filled += count
+    
+    def row(self, index):
+        '''
+        Retorna a linha index como uma memoryview sobre o bloco, sem cópia:
+        escritas na view alteram a matriz
+        Tempo: O(1)
+        '''
+        if not 0 <= index < self.rows:
+            raise IndexError("Índice de linha fora dos limites!")
+        return memoryview(self.data)[index * self.cols:(index + 1) * self.cols]
+    
+    def column(self, index):
+        '''
+        Retorna a coluna index como uma memoryview com passo cols sobre o bloco, sem cópia
+        Tempo: O(1)
+        '''
+        if not 0 <= index < self.cols:
+            raise IndexError("Índice de coluna fora dos limites!")
+        return memoryview(self.data)[index::self.cols]
+    
+    def _check_same_shape(self, other):
+        if (self.rows, self.cols) != (other.rows, other.cols):
+            raise ValueError("Matrix dimensions do not match")
+    
+    def add(self, other):
+        '''
+        Retorna uma nova matriz com a soma elemento a elemento
+        Tempo: O(n), em um único laço em código C (ou vetorizado com NumPy)
+        '''
+        self._check_same_shape(other)
+        if self.use_numpy:
+            return self._with_data(self.rows, self.cols, self.data + other.data)
+        typecode = self.typecode if self.typecode == other.typecode else 'd'
+        return self._with_data(self.rows, self.cols, array(typecode, map(operator.add, self.data, other.data)))
+    
+    def scale(self, factor):
+        '''
+        Retorna uma nova matriz com todos os elementos multiplicados por factor
+        (uma matriz de inteiros escalada por um float passa a ser de floats)
+        Tempo: O(n), em um único laço em código C (ou vetorizado com NumPy)
+        '''
+        if self.use_numpy:
+            return self._with_data(self.rows, self.cols, self.data * factor)
+        typecode = self.typecode
+        if typecode in INTEGER_TYPECODES and not isinstance(factor, int):
+            typecode = 'd'
+        return self._with_data(self.rows, self.cols, array(typecode, map(operator.mul, self.data, repeat(factor))))
+    
+    def transpose(self):
+        '''
+        Retorna uma nova matriz transposta (cols x rows), copiando cada coluna
+        (uma view com passo) para uma linha do resultado
+        Tempo: O(n), com cols cópias de bloco em código C
+        '''
+        if self.use_numpy:
+            grid = self.data.reshape(self.rows, self.cols)
+            return self._with_data(self.cols, self.rows, np.ascontiguousarray(grid.T).ravel())
+        data = array(self.typecode, [0]) * len(self.data)
+        target = memoryview(data)
+        for j in range(self.cols):
+            target[j * self.rows:(j + 1) * self.rows] = self.column(j)
+        return self._with_data(self.cols, self.rows, data)
+    
+    def matmul(self, other):
+        '''
+        Retorna o produto matricial self x other.
+        Com NumPy, usa a multiplicação otimizada (BLAS). Sem NumPy, transpõe other para
+        que cada coluna fique contígua e calcula cada elemento como um produto escalar
+        com sum(map(mul, ...)), sem laços Python por multiplicação (ainda O(n^3) operações
+        com objetos Python: segundos para 1000 x 1000, contra milissegundos com NumPy).
+        Tempo: O(rows * cols * other.cols)
+        '''
+        if self.cols != other.rows:
+            raise ValueError("Matrix dimensions do not match for multiplication")
+        if self.use_numpy:
+            product = self.data.reshape(self.rows, self.cols) @ other.data.reshape(other.rows, other.cols)
+            return self._with_data(self.rows, other.cols, product.ravel())
+        
+        # Colunas e linhas como listas: os valores já estão convertidos em objetos
+        # Python e map não cria um objeto novo a cada leitura do array
+        columns = other.transpose()
+        column_lists = [columns.row(j).tolist() for j in range(other.cols)]
+        typecode = self.typecode if self.typecode == other.typecode else 'd'
+        data = array(typecode)
+        mul = operator.mul
+        for i in range(self.rows):
+            row = self.row(i).tolist()
+            data.extend([sum(map(mul, row, column)) for column in column_lists])
+        return self._with_data(self.rows, other.cols, data)
     
     def print_matrix(self):
-        for row in self.matrix:
-            print(row)
+        for i in range(self.rows):
+            print(self.row(i).tolist())
 
 # Demonstração de uso
 def main():
@@ -97,7 +260,7 @@ def main():
     
     # Usando matriz estática
     print("\n--- Matriz Estática ---")
-    grades = StaticMatrix(3, 4)  # Matriz 3x4 para notas
+    grades = StaticMatrix(3, 4, typecode='q')  # Matriz 3x4 de notas inteiras
     
     # Preenchendo algumas notas
     grades.set_value(0, 0, 85)
@@ -123,6 +286,72 @@ def main():
         value = grades.get_value(3, 2)
     except IndexError as e:
         print(f"\nErro: {e}")
+    
+    # Operações em bloco sobre o armazenamento contíguo
+    print(f"\nNotas do aluno 2 (linha, sem cópia): {grades.row(1).tolist()}")
+    print(f"Notas da avaliação 3 (coluna, sem cópia): {grades.column(2).tolist()}")
+    bonus = StaticMatrix(3, 4, typecode='q')
+    bonus.fill(2)
+    print("\nNotas com 2 pontos de bônus (add):")
+    grades.add(bonus).print_matrix()
+    print("\nMetade das notas (scale):")
+    grades.scale(0.5).print_matrix()
+    print("\nMatriz transposta (4 avaliações x 3 alunos):")
+    grades.transpose().print_matrix()
+    
+    weights = StaticMatrix.from_rows([[0.2], [0.3], [0.2], [0.3]], typecode='d')
+    averages = grades.matmul(weights)  # Média ponderada de cada aluno
+    print(f"\nMédias ponderadas (matmul com os pesos): {[round(value, 1) for value in averages.column(0).tolist()]}")
+    print(f"NumPy em uso? {grades.use_numpy}")
+
+def _naive_matmul(a, b):
+    '''Produto de matrizes como listas de listas, com três laços Python'''
+    n, m, p = len(a), len(b), len(b[0])
+    result = [[0.0] * p for _ in range(n)]
+    for i in range(n):
+        for j in range(p):
+            total = 0.0
+            for k in range(m):
+                total += a[i][k] * b[k][j]
+            result[i][j] = total
+    return result
+
+def benchmark(sizes=(100, 300, 1000), naive_limit=300):
+    '''
+    Compara o produto de matrizes n x n entre listas de listas (três laços Python)
+    e StaticMatrix.matmul, além da memória por elemento.
+    '''
+    print(f"\n=== Produto de matrizes n x n (NumPy em uso: {np is not None}) ===\n")
+    for n in sizes:
+        a = StaticMatrix(n, n, 'd')
+        b = StaticMatrix(n, n, 'd')
+        a.fill(1.5)
+        b.fill(0.5)
+        line = f"n = {n:>5}:"
+        if n <= naive_limit:
+            rows_a = [a.row(i).tolist() for i in range(n)]
+            rows_b = [b.row(i).tolist() for i in range(n)]
+            start = time.perf_counter()
+            _naive_matmul(rows_a, rows_b)
+            line += f"  listas de listas {time.perf_counter() - start:8.3f} s"
+        else:
+            line += "  listas de listas     (omitido)"
+        start = time.perf_counter()
+        product = a.matmul(b)
+        line += f"  StaticMatrix.matmul {time.perf_counter() - start:8.3f} s"
+        assert product.get_value(n - 1, n - 1) == 0.75 * n
+        print(line)
+    
+    n = sizes[-1]
+    boxed = [[float(j) for j in range(n)] for _ in range(n)]
+    boxed_bytes = sys.getsizeof(boxed) + sum(sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row)
+                                             for row in boxed)
+    flat = StaticMatrix(n, n, 'd', use_numpy=False)
+    print(f"\nMemória por elemento ({n} x {n} floats): listas de listas {boxed_bytes / n / n:5.1f} bytes, "
+          f"StaticMatrix {sys.getsizeof(flat.data) / n / n:5.1f} bytes")
 
 if __name__ == "__main__":
-    main()
+    if "--benchmark" in sys.argv:
+        benchmark()
+    else:
+        main()
@@ -1,43 +1,96 @@
 '''
 Implementação de Fila em Python
 
-Este arquivo demonstra duas implementações de filas: uma baseada em lista Python (dinâmica) 
-e outra implementando uma fila circular baseada em array com tamanho fixo.
+Este arquivo demonstra duas implementações de filas: uma dinâmica, sobre um buffer circular
+que cresce e encolhe conforme necessário, e outra implementando uma fila circular baseada
+em array com tamanho fixo.
 
 Autores: Alef Khatab 
 '''
 
-# Implementação 1: Fila usando lista Python (implementação dinâmica)
+from itertools import islice
+import sys
+import time
+
+REPR_LIMIT = 20  # Máximo de itens exibidos por __str__ e __repr__ das filas
+
+def bounded_str(items, size, limit=REPR_LIMIT):
+    '''
+    Retorna uma string no formato de lista com no máximo limit itens do iterável
+    items (que tem size itens), indicando os itens omitidos com "..."
+    Tempo: O(limit), sem percorrer o restante da fila
+    '''
+    shown = [repr(item) for item in islice(items, limit)]
+    if size > limit:
+        shown.append("...")
+    return "[" + ", ".join(shown) + "]"
+
+# Implementação 1: Fila dinâmica sobre um buffer circular redimensionável
 class Queue:
     '''
-    Implementação de uma fila usando lista Python.
-    Esta implementação é dinâmica (cresce conforme necessário).
+    Implementação de uma fila dinâmica (sem limite de tamanho).
+    Usa o mesmo layout circular da CircularQueue, mas dobra a capacidade quando
+    o buffer enche e a reduz à metade quando fica com 1/4 ocupado, mantendo
+    enqueue e dequeue em O(1) amortizado.
     '''
+    MIN_CAPACITY = 8  # Capacidade mínima do buffer
+    
     def __init__(self):
-        self.items = []  # Lista vazia para armazenar elementos da fila
+        self.items = [None] * Queue.MIN_CAPACITY  # Buffer circular para armazenar elementos
+        self.front = 0  # Índice do primeiro elemento
+        self.count = 0  # Número de elementos na fila
     
     def is_empty(self):
         '''
         Verifica se a fila está vazia
         Tempo: O(1)
         '''
-        return len(self.items) == 0
+        return self.count == 0
+    
+    def _resize(self, capacity):
+        '''
+        Copia os elementos, em ordem, para um novo buffer com a capacidade informada
+        Tempo: O(n), executado raramente (custo amortizado O(1) por operação)
+        '''
+        end = self.front + self.count
+        old_capacity = len(self.items)
+        if end <= old_capacity:
+            elements = self.items[self.front:end]
+        else:
+            # Os elementos dão a volta no buffer: copia os dois trechos contíguos
+            elements = self.items[self.front:] + self.items[:end - old_capacity]
+        self.items = elements + [None] * (capacity - self.count)
+        self.front = 0
     
     def enqueue(self, item):
         '''
         Adiciona um item ao final da fila
         Tempo: O(1) amortizado
         '''
-        self.items.append(item)  # Adiciona ao final da lista
+        capacity = len(self.items)
+        if self.count == capacity:
+            self._resize(2 * capacity)  # Buffer cheio: dobra a capacidade
+            capacity *= 2
+        self.items[(self.front + self.count) % capacity] = item
+        self.count += 1
     
     def dequeue(self):
         '''
         Remove e retorna o item do início da fila
-        Tempo: O(n) - devido à reorganização da lista
+        Tempo: O(1) amortizado
         '''
         if self.is_empty():
             raise IndexError("Dequeue from an empty queue")
-        return self.items.pop(0)  # Remove do início da lista
+        item = self.items[self.front]
+        self.items[self.front] = None  # Limpa a posição
+        self.front = (self.front + 1) % len(self.items)
+        self.count -= 1
+        
+        # Reduz o buffer à metade quando apenas 1/4 estiver ocupado
+        capacity = len(self.items)
+        if capacity > Queue.MIN_CAPACITY and self.count <= capacity // 4:
+            self._resize(capacity // 2)
+        return item
     
     def peek(self):
         '''
@@ -46,20 +99,56 @@ class Queue:
         '''
         if self.is_empty():
             raise IndexError("Peek from an empty queue")
-        return self.items[0]  # Retorna o primeiro elemento
+        return self.items[self.front]  # Retorna o primeiro elemento
     
     def size(self):
         '''
         Retorna o número de itens na fila
         Tempo: O(1)
         '''
-        return len(self.items)
+        return self.count
+    
+    def __len__(self):
+        return self.count
+    
+    def _items_at(self, indices):
+        '''Gerador dos itens nas posições indices, contadas a partir do início da fila'''
+        items = self.items
+        capacity = len(items)
+        front = self.front
+        for i in indices:
+            yield items[(front + i) % capacity]
+    
+    def __iter__(self):
+        '''
+        Percorre os itens do início ao fim, sem removê-los.
+        A fila não deve ser modificada durante o percurso.
+        Tempo: O(1) por item, sem memória extra
+        '''
+        return self._items_at(range(self.count))
+    
+    def __reversed__(self):
+        '''
+        Percorre os itens do fim para o início
+        '''
+        return self._items_at(range(self.count - 1, -1, -1))
+    
+    def view(self, start=None, stop=None, step=None):
+        '''
+        Visão preguiçosa de uma fatia da fila, com índices como em list[start:stop:step]
+        contados a partir do início da fila
+        Tempo: O(1) para criar a visão, O(1) por item percorrido
+        '''
+        return self._items_at(range(*slice(start, stop, step).indices(self.count)))
     
     def __str__(self):
         '''
-        Retorna uma representação em string da fila
+        Retorna uma representação em string da fila, com no máximo REPR_LIMIT itens
         '''
-        return str(self.items)
+        return bounded_str(self, self.count)
+    
+    def __repr__(self):
+        return f"Queue(tamanho={self.count}, itens={self})"
 
 # Implementação 2: Fila circular baseada em array (tamanho fixo)
 class CircularQueue:
@@ -123,6 +212,69 @@ class CircularQueue:
             raise IndexError("Peek from an empty queue")
         return self.queue[self.front]
     
+    def _write_slots(self, start, items):
+        '''
+        Copia items para o buffer a partir da posição start, dando a volta no final
+        do array se necessário (no máximo duas cópias de fatias contíguas)
+        '''
+        slots = len(self.queue)
+        first = min(len(items), slots - start)
+        self.queue[start:start + first] = items[:first]
+        if first < len(items):
+            self.queue[:len(items) - first] = items[first:]
+    
+    def _read_slots(self, start, count):
+        '''
+        Retira count itens do buffer a partir da posição start, limpando as posições
+        (no máximo duas cópias de fatias contíguas)
+        '''
+        slots = len(self.queue)
+        end = start + count
+        if end <= slots:
+            items = self.queue[start:end]
+            self.queue[start:end] = [None] * count
+        else:
+            items = self.queue[start:] + self.queue[:end - slots]
+            self.queue[start:] = [None] * (slots - start)
+            self.queue[:end - slots] = [None] * (end - slots)
+        return items
+    
+    def enqueue_many(self, items):
+        '''
+        Adiciona vários itens ao final da fila de uma só vez.
+        Lança IndexError, sem inserir nada, se não houver espaço para todos.
+        Tempo: O(k), com no máximo duas cópias de fatias
+        '''
+        if not isinstance(items, list):
+            items = list(items)
+        if self.size + len(items) > self.capacity:
+            raise IndexError("Enqueue to a full queue")
+        
+        self._write_slots(self.rear, items)
+        self.rear = (self.rear + len(items)) % self.capacity
+        self.size += len(items)
+    
+    def dequeue_many(self, n):
+        '''
+        Remove e retorna, em uma lista, até n itens do início da fila
+        Tempo: O(k), com no máximo duas cópias de fatias
+        '''
+        if n < 0:
+            raise ValueError("Number of items to dequeue must be non-negative")
+        count = min(n, self.size)
+        items = self._read_slots(self.front, count)
+        self.front = (self.front + count) % self.capacity
+        self.size -= count
+        return items
+    
+    def drain(self):
+        '''
+        Gerador que remove e produz os itens da fila até ela ficar vazia,
+        retirando-os em blocos com dequeue_many
+        '''
+        while not self.is_empty():
+            yield from self.dequeue_many(self.size)
+    
     def get_size(self):
         '''
         Retorna o número de itens na fila
@@ -130,27 +282,54 @@ class CircularQueue:
         '''
         return self.size
     
+    def __len__(self):
+        return self.size
+    
+    def _items_at(self, indices):
+        '''Gerador dos itens nas posições indices, contadas a partir do início da fila'''
+        queue = self.queue
+        slots = len(queue)
+        front = self.front
+        for i in indices:
+            yield queue[(front + i) % slots]
+    
+    def __iter__(self):
+        '''
+        Percorre os itens do início ao fim, sem removê-los (ao contrário de drain).
+        A fila não deve ser modificada durante o percurso.
+        Tempo: O(1) por item, sem memória extra
+        '''
+        return self._items_at(range(self.size))
+    
+    def __reversed__(self):
+        '''
+        Percorre os itens do fim para o início
+        '''
+        return self._items_at(range(self.size - 1, -1, -1))
+    
+    def view(self, start=None, stop=None, step=None):
+        '''
+        Visão preguiçosa de uma fatia da fila, com índices como em list[start:stop:step]
+        contados a partir do início da fila
+        Tempo: O(1) para criar a visão, O(1) por item percorrido
+        '''
+        return self._items_at(range(*slice(start, stop, step).indices(self.size)))
+    
     def __str__(self):
         '''
-        Retorna uma representação em string da fila
+        Retorna uma representação em string da fila, com no máximo REPR_LIMIT itens
         '''
-        if self.is_empty():
-            return "[]"
-        
-        result = []
-        index = self.front
-        for _ in range(self.size):
-            result.append(self.queue[index])
-            index = (index + 1) % self.capacity
-        
-        return str(result)
+        return bounded_str(self, self.size)
+    
+    def __repr__(self):
+        return f"{type(self).__name__}(tamanho={self.size}, itens={self})"
 
 # Demonstração de uso
 def main():
     print("\n=== Demonstração de Filas ===\n")
     
     # Demonstração da fila baseada em lista
-    print("--- Fila Dinâmica (baseada em lista) ---")
+    print("--- Fila Dinâmica (buffer circular redimensionável) ---")
     queue = Queue()
     
     print("Enfileirando elementos: 10, 20, 30, 40")
@@ -209,6 +388,69 @@ def main():
     circular_queue.enqueue('1')
     circular_queue.enqueue('2')
     print(f"Fila final: {circular_queue}")
+    
+    # Operações em lote
+    print("\nOperações em lote:")
+    circular_queue.dequeue_many(2)
+    circular_queue.enqueue_many(['3', '4'])
+    print(f"Após dequeue_many(2) e enqueue_many(['3', '4']): {circular_queue}")
+    print(f"Percorrendo sem remover: {list(circular_queue)}, do fim para o início: {list(reversed(circular_queue))}")
+    print(f"view(1, 3): {list(circular_queue.view(1, 3))}")
+    print(f"drain(): {list(circular_queue.drain())}")
+    print(f"Fila vazia? {circular_queue.is_empty()}")
+    
+    # Representação limitada de uma fila grande
+    large_queue = Queue()
+    for i in range(100000):
+        large_queue.enqueue(i)
+    print(f"\nrepr de uma fila com {len(large_queue)} itens: {large_queue!r}")
+
+# Comparação de desempenho
+def benchmark(sizes=(1000, 10000, 100000, 1000000, 10000000)):
+    '''
+    Mede o custo médio por operação ao encher e esvaziar a fila com n itens.
+    Com enqueue e dequeue em O(1) amortizado, o custo por operação deve ficar estável.
+    '''
+    print("\n=== Custo por operação da fila dinâmica ===\n")
+    for n in sizes:
+        queue = Queue()
+        start = time.perf_counter()
+        for i in range(n):
+            queue.enqueue(i)
+        while not queue.is_empty():
+            queue.dequeue()
+        elapsed = time.perf_counter() - start
+        print(f"{n:>10} itens: {elapsed / (2 * n) * 1e9:7.1f} ns por operação")
+
+def benchmark_batches(total=1000000, batch_sizes=(10, 100, 1000, 10000)):
+    '''
+    Compara enqueue/dequeue item a item com enqueue_many/dequeue_many em lotes.
+    '''
+    print(f"\n=== CircularQueue: {total} itens em lotes ===\n")
+    for batch in batch_sizes:
+        queue = CircularQueue(batch)
+        items = list(range(batch))
+        rounds = total // batch
+        
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for item in items:
+                queue.enqueue(item)
+            for _ in range(batch):
+                queue.dequeue()
+        single = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        for _ in range(rounds):
+            queue.enqueue_many(items)
+            queue.dequeue_many(batch)
+        bulk = time.perf_counter() - start
+        print(f"Lote {batch:>6}: item a item {single / total * 1e9:6.1f} ns/item, "
+              f"em lote {bulk / total * 1e9:5.1f} ns/item ({single / bulk:4.1f}x)")
 
 if __name__ == "__main__":
-    main()
+    if "--benchmark" in sys.argv:
+        benchmark()
+        benchmark_batches()
+    else:
+        main()
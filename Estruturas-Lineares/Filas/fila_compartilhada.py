@@ -0,0 +1,278 @@
+'''
+Fila Circular em Memória Compartilhada
+
+Este arquivo implementa uma variante da CircularQueue de fila.py cujas posições e
+cujos índices front/rear/size ficam em um bloco de multiprocessing.shared_memory.
+Produtores e consumidores em processos diferentes trocam registros de bytes de
+tamanho fixo diretamente pela memória, sem serialização (pickle) nem pipes, o que
+permite dividir o trabalho entre processos para contornar o GIL.
+
+Autor: Alef Khatab
+'''
+
+import multiprocessing
+from multiprocessing import shared_memory
+import struct
+import sys
+import time
+
+from fila import CircularQueue
+
+# Cabeçalho do bloco compartilhado: front, rear e size
+HEADER = struct.Struct("<QQQ")
+# Prefixo de cada posição: tamanho do registro armazenado
+LENGTH = struct.Struct("<I")
+
+class SharedCircularQueue(CircularQueue):
+    '''
+    Fila circular limitada compartilhada entre processos (vários produtores e
+    vários consumidores). Cada posição guarda um registro de até record_size bytes.
+    
+    Um lock protege os índices e dois semáforos contam as posições livres e os itens
+    disponíveis, de modo que put e get esperam sem consumir CPU. O objeto pode ser
+    passado como argumento de um multiprocessing.Process; o processo que o criou
+    deve chamar unlink() quando a fila não for mais usada.
+    '''
+    def __init__(self, capacity=1024, record_size=64):
+        self.capacity = capacity  # Tamanho máximo da fila
+        self.record_size = record_size  # Tamanho máximo de cada registro, em bytes
+        self.slot_size = LENGTH.size + record_size  # Bytes ocupados por posição
+        self.shm = shared_memory.SharedMemory(create=True, size=HEADER.size + capacity * self.slot_size)
+        HEADER.pack_into(self.shm.buf, 0, 0, 0, 0)
+        self.lock = multiprocessing.Lock()  # Protege o cabeçalho e as posições
+        self.free_slots = multiprocessing.Semaphore(capacity)  # Posições livres para put
+        self.available = multiprocessing.Semaphore(0)  # Itens disponíveis para get
+    
+    # Os índices da CircularQueue ficam no bloco compartilhado
+    @property
+    def front(self):
+        return HEADER.unpack_from(self.shm.buf)[0]
+    
+    @property
+    def rear(self):
+        return HEADER.unpack_from(self.shm.buf)[1]
+    
+    @property
+    def size(self):
+        return HEADER.unpack_from(self.shm.buf)[2]
+    
+    def _write(self, item):
+        '''Grava item na posição rear e avança o índice. Deve ser chamado com o lock.'''
+        buf = self.shm.buf
+        front, rear, size = HEADER.unpack_from(buf)
+        offset = HEADER.size + rear * self.slot_size
+        LENGTH.pack_into(buf, offset, len(item))
+        buf[offset + LENGTH.size:offset + LENGTH.size + len(item)] = item
+        rear += 1
+        HEADER.pack_into(buf, 0, front, 0 if rear == self.capacity else rear, size + 1)
+    
+    def _read(self, advance=True):
+        '''Lê o registro da posição front e, se advance, avança o índice. Deve ser chamado com o lock.'''
+        buf = self.shm.buf
+        front, rear, size = HEADER.unpack_from(buf)
+        offset = HEADER.size + front * self.slot_size
+        start = offset + LENGTH.size
+        item = bytes(buf[start:start + LENGTH.unpack_from(buf, offset)[0]])
+        if advance:
+            front += 1
+            HEADER.pack_into(buf, 0, 0 if front == self.capacity else front, rear, size - 1)
+        return item
+    
+    def put(self, item, block=True, timeout=None):
+        '''
+        Adiciona um registro (bytes) ao final da fila. Se a fila estiver cheia e block
+        for True, espera até haver espaço ou até o timeout (None = sem limite).
+        Lança IndexError se não houver espaço e ValueError se o registro for grande demais.
+        Tempo: O(k) para um registro de k bytes, mais o tempo de espera
+        '''
+        if len(item) > self.record_size:
+            raise ValueError(f"Record larger than {self.record_size} bytes")
+        if not self.free_slots.acquire(block, timeout):
+            raise IndexError("Put to a full queue")
+        with self.lock:
+            self._write(item)
+        self.available.release()
+    
+    def get(self, block=True, timeout=None):
+        '''
+        Remove e retorna o registro do início da fila. Se a fila estiver vazia e block
+        for True, espera até chegar um registro ou até o timeout (None = sem limite).
+        Lança IndexError se não houver registro.
+        Tempo: O(k) para um registro de k bytes, mais o tempo de espera
+        '''
+        if not self.available.acquire(block, timeout):
+            raise IndexError("Get from an empty queue")
+        with self.lock:
+            item = self._read()
+        self.free_slots.release()
+        return item
+    
+    def enqueue(self, item):
+        '''
+        Adiciona um registro sem esperar. Lança IndexError se a fila estiver cheia.
+        Tempo: O(k)
+        '''
+        self.put(item, block=False)
+    
+    def dequeue(self):
+        '''
+        Remove e retorna um registro sem esperar. Lança IndexError se a fila estiver vazia.
+        Tempo: O(k)
+        '''
+        return self.get(block=False)
+    
+    def enqueue_many(self, items):
+        '''
+        Adiciona vários registros sem esperar. Lança IndexError ao encontrar a fila
+        cheia (os registros anteriores permanecem na fila).
+        Tempo: O(total de bytes)
+        '''
+        for item in items:
+            self.put(item, block=False)
+    
+    def dequeue_many(self, n):
+        '''
+        Remove e retorna, em uma lista, até n registros sem esperar
+        Tempo: O(total de bytes)
+        '''
+        items = []
+        while len(items) < n and self.available.acquire(False):
+            with self.lock:
+                items.append(self._read())
+            self.free_slots.release()
+        return items
+    
+    def peek(self):
+        '''
+        Retorna o registro do início da fila sem removê-lo
+        Tempo: O(k)
+        '''
+        with self.lock:
+            if self.is_empty():
+                raise IndexError("Peek from an empty queue")
+            return self._read(advance=False)
+    
+    def _items_at(self, indices):
+        '''
+        Gerador dos registros nas posições indices, contadas a partir do início da
+        fila no momento da chamada. Cada registro é lido com o lock, sem copiar a fila.
+        '''
+        buf = self.shm.buf
+        front = self.front
+        for i in indices:
+            offset = HEADER.size + (front + i) % self.capacity * self.slot_size
+            start = offset + LENGTH.size
+            with self.lock:
+                item = bytes(buf[start:start + LENGTH.unpack_from(buf, offset)[0]])
+            yield item
+    
+    def close(self):
+        '''
+        Desanexa o bloco compartilhado deste processo
+        '''
+        self.shm.close()
+    
+    def unlink(self):
+        '''
+        Desanexa e libera o bloco compartilhado (no processo que criou a fila)
+        '''
+        self.shm.close()
+        self.shm.unlink()
+
+# Funções executadas nos processos filhos (no nível do módulo para funcionar com spawn)
+def _produce(buffer, count, record):
+    for _ in range(count):
+        buffer.put(record)
+
+def _consume(buffer, stop):
+    while buffer.get() != stop:
+        pass
+
+# Demonstração de uso
+def _square_worker(tasks, results):
+    while (task := tasks.get()) != b"":
+        number = int(task)
+        results.put(f"{number}^2={number * number}".encode())
+    results.put(b"")
+
+def main():
+    print("\n=== Fila Circular em Memória Compartilhada ===\n")
+    
+    queue = SharedCircularQueue(capacity=4, record_size=16)
+    try:
+        queue.enqueue(b"alfa")
+        queue.enqueue(b"beta")
+        print(f"Fila: {queue}")
+        print(f"Tamanho: {queue.get_size()}, início: {queue.peek()}")
+        print(f"Removido: {queue.dequeue()}")
+        try:
+            queue.put(b"x" * 17)
+        except ValueError as error:
+            print(f"Registro grande demais: {error}")
+    finally:
+        queue.unlink()
+    
+    print("\n--- Dois processos trabalhadores ---")
+    tasks = SharedCircularQueue(capacity=8, record_size=16)
+    results = SharedCircularQueue(capacity=8, record_size=32)
+    try:
+        workers = [multiprocessing.Process(target=_square_worker, args=(tasks, results)) for _ in range(2)]
+        for worker in workers:
+            worker.start()
+        for number in range(1, 9):
+            tasks.put(str(number).encode())
+        for _ in workers:
+            tasks.put(b"")  # Um marcador de fim por trabalhador
+        
+        answers = []
+        finished = 0
+        while finished < len(workers):
+            answer = results.get()
+            if answer == b"":
+                finished += 1
+            else:
+                answers.append(answer.decode())
+        for worker in workers:
+            worker.join()
+        print(f"Resultados: {sorted(answers, key=lambda text: int(text.split('^')[0]))}")
+    finally:
+        tasks.unlink()
+        results.unlink()
+
+def benchmark(total=200000, record_size=64, process_counts=(1, 2, 4, 8)):
+    '''
+    Compara a vazão da SharedCircularQueue com multiprocessing.Queue, com o mesmo
+    número de processos produtores e consumidores.
+    '''
+    print(f"\n=== {total} registros de {record_size} bytes ===\n")
+    record = b"x" * record_size
+    stop = b""
+    for processes in process_counts:
+        per_producer = total // processes
+        line = f"{processes} produtor(es) + {processes} consumidor(es):"
+        for label, buffer in (("SharedCircularQueue", SharedCircularQueue(1024, record_size)),
+                              ("multiprocessing.Queue", multiprocessing.Queue(1024))):
+            producers = [multiprocessing.Process(target=_produce, args=(buffer, per_producer, record))
+                         for _ in range(processes)]
+            consumers = [multiprocessing.Process(target=_consume, args=(buffer, stop))
+                         for _ in range(processes)]
+            start = time.perf_counter()
+            for process in producers + consumers:
+                process.start()
+            for process in producers:
+                process.join()
+            for _ in consumers:
+                buffer.put(stop)
+            for process in consumers:
+                process.join()
+            elapsed = time.perf_counter() - start
+            if isinstance(buffer, SharedCircularQueue):
+                buffer.unlink()
+            line += f"  {label} {per_producer * processes / elapsed / 1e3:6.1f} mil/s"
+        print(line)
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark()
+    else:
+        main()
@@ -0,0 +1,468 @@
+'''
+Filas Circulares Concorrentes
+
+Este arquivo estende a CircularQueue de fila.py para uso como buffer limitado entre
+etapas de um pipeline produtor/consumidor: uma versão bloqueante para threads (com
+variáveis de condição e timeouts), uma versão para asyncio e uma versão sem locks
+para o caso de um único produtor e um único consumidor (SPSC).
+
+Autor: Alef Khatab
+'''
+
+import asyncio
+from collections import deque
+import queue
+import sys
+import threading
+import time
+
+from fila import CircularQueue
+
+# Implementação 1: Fila circular bloqueante para threads
+class BlockingCircularQueue(CircularQueue):
+    '''
+    Fila circular limitada e segura para threads.
+    put espera enquanto a fila está cheia e get espera enquanto está vazia, o que
+    aplica contrapressão (backpressure) ao produtor mais rápido. As operações herdadas
+    de CircularQueue (enqueue, dequeue e as versões em lote) também usam o lock e
+    acordam as threads que esperam, sem esperar elas mesmas.
+    '''
+    def __init__(self, capacity=10):
+        super().__init__(capacity)
+        self.lock = threading.Lock()  # Protege o buffer e os índices
+        self.not_empty = threading.Condition(self.lock)  # Sinaliza que há itens para get
+        self.not_full = threading.Condition(self.lock)  # Sinaliza que há espaço para put
+    
+    def put(self, item, block=True, timeout=None):
+        '''
+        Adiciona um item ao final da fila. Se a fila estiver cheia e block for True,
+        espera até haver espaço ou até o timeout (None = sem limite).
+        Lança IndexError se não houver espaço ao final da espera.
+        Tempo: O(1), mais o tempo de espera
+        '''
+        with self.not_full:
+            if block and self.size == self.capacity:
+                if not self.not_full.wait_for(lambda: self.size < self.capacity, timeout):
+                    raise IndexError("Put to a full queue (timeout)")
+            super().enqueue(item)  # Lança IndexError se a fila estiver cheia
+            self.not_empty.notify()
+    
+    def get(self, block=True, timeout=None):
+        '''
+        Remove e retorna o item do início da fila. Se a fila estiver vazia e block for
+        True, espera até chegar um item ou até o timeout (None = sem limite).
+        Lança IndexError se não houver item ao final da espera.
+        Tempo: O(1), mais o tempo de espera
+        '''
+        with self.not_empty:
+            if block and self.size == 0:
+                if not self.not_empty.wait_for(lambda: self.size > 0, timeout):
+                    raise IndexError("Get from an empty queue (timeout)")
+            item = super().dequeue()  # Lança IndexError se a fila estiver vazia
+            self.not_full.notify()
+            return item
+    
+    def put_nowait(self, item):
+        '''
+        Adiciona um item sem esperar. Lança IndexError se a fila estiver cheia.
+        Tempo: O(1)
+        '''
+        self.put(item, block=False)
+    
+    def get_nowait(self):
+        '''
+        Remove e retorna um item sem esperar. Lança IndexError se a fila estiver vazia.
+        Tempo: O(1)
+        '''
+        return self.get(block=False)
+    
+    def enqueue(self, item):
+        '''
+        Adiciona um item sem esperar, como put_nowait.
+        Lança IndexError se a fila estiver cheia.
+        Tempo: O(1)
+        '''
+        self.put(item, block=False)
+    
+    def dequeue(self):
+        '''
+        Remove e retorna um item sem esperar, como get_nowait.
+        Lança IndexError se a fila estiver vazia.
+        Tempo: O(1)
+        '''
+        return self.get(block=False)
+    
+    def enqueue_many(self, items):
+        '''
+        Adiciona vários itens sem esperar, todos ou nenhum, e acorda um consumidor por item.
+        Lança IndexError se não houver espaço para todos.
+        Tempo: O(k)
+        '''
+        with self.lock:
+            before = self.size
+            super().enqueue_many(items)
+            self.not_empty.notify(self.size - before)
+    
+    def dequeue_many(self, n):
+        '''
+        Remove e retorna até n itens sem esperar e acorda um produtor por posição liberada
+        Tempo: O(k)
+        '''
+        with self.lock:
+            items = super().dequeue_many(n)
+            self.not_full.notify(len(items))
+            return items
+
+# Implementação 2: Fila circular para asyncio
+def _wake_first(waiters):
+    '''Acorda a primeira tarefa asyncio ainda à espera na deque informada'''
+    while waiters:
+        future = waiters.popleft()
+        if not future.done():
+            future.set_result(None)
+            return
+
+class AsyncCircularQueue(CircularQueue):
+    '''
+    Fila circular limitada para tarefas asyncio de um mesmo loop de eventos.
+    put e get são corrotinas que suspendem a tarefa, sem bloquear o loop, enquanto
+    a fila está cheia ou vazia. Como o loop executa uma tarefa por vez, não há locks:
+    cada operação sem await é atômica. As operações herdadas de CircularQueue
+    (enqueue, dequeue e as versões em lote) também acordam as tarefas que esperam.
+    '''
+    def __init__(self, capacity=10):
+        super().__init__(capacity)
+        self.getters = deque()  # Futures de tarefas esperando itens
+        self.putters = deque()  # Futures de tarefas esperando espaço
+    
+    async def _wait(self, waiters, deadline, message):
+        '''
+        Suspende a tarefa até ser acordada ou até o instante deadline do loop
+        (None = sem limite). O prazo é o mesmo em todas as voltas de put/get.
+        '''
+        loop = asyncio.get_running_loop()
+        timeout = None
+        if deadline is not None:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                raise IndexError(message)
+        future = loop.create_future()
+        waiters.append(future)
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise IndexError(message) from None
+    
+    @staticmethod
+    def _deadline(timeout):
+        '''Instante do loop em que o timeout esgota (None = sem limite)'''
+        return None if timeout is None else asyncio.get_running_loop().time() + timeout
+    
+    async def put(self, item, timeout=None):
+        '''
+        Adiciona um item, aguardando espaço até o timeout (None = sem limite).
+        Lança IndexError se o tempo esgotar.
+        Tempo: O(1), mais o tempo de espera
+        '''
+        deadline = self._deadline(timeout)
+        while self.is_full():
+            await self._wait(self.putters, deadline, "Put to a full queue (timeout)")
+        self.put_nowait(item)
+    
+    async def get(self, timeout=None):
+        '''
+        Remove e retorna um item, aguardando até o timeout (None = sem limite).
+        Lança IndexError se o tempo esgotar.
+        Tempo: O(1), mais o tempo de espera
+        '''
+        deadline = self._deadline(timeout)
+        while self.is_empty():
+            await self._wait(self.getters, deadline, "Get from an empty queue (timeout)")
+        return self.get_nowait()
+    
+    def enqueue(self, item):
+        '''
+        Adiciona um item sem esperar. Lança IndexError se a fila estiver cheia.
+        Tempo: O(1)
+        '''
+        super().enqueue(item)
+        _wake_first(self.getters)
+    
+    def dequeue(self):
+        '''
+        Remove e retorna um item sem esperar. Lança IndexError se a fila estiver vazia.
+        Tempo: O(1)
+        '''
+        item = super().dequeue()
+        _wake_first(self.putters)
+        return item
+    
+    put_nowait = enqueue
+    get_nowait = dequeue
+    
+    def enqueue_many(self, items):
+        '''
+        Adiciona vários itens sem esperar, todos ou nenhum, e acorda uma tarefa por item.
+        Lança IndexError se não houver espaço para todos.
+        Tempo: O(k)
+        '''
+        before = self.size
+        super().enqueue_many(items)
+        for _ in range(self.size - before):
+            _wake_first(self.getters)
+    
+    def dequeue_many(self, n):
+        '''
+        Remove e retorna até n itens sem esperar e acorda uma tarefa por posição liberada
+        Tempo: O(k)
+        '''
+        items = super().dequeue_many(n)
+        for _ in items:
+            _wake_first(self.putters)
+        return items
+
+# Implementação 3: Fila circular sem locks para um produtor e um consumidor (SPSC)
+class SPSCCircularQueue(CircularQueue):
+    '''
+    Fila circular sem locks, válida para exatamente uma thread produtora e uma
+    thread consumidora. O produtor só escreve em rear e o consumidor só escreve em
+    front; não há contador compartilhado. O buffer tem uma posição extra, de modo que
+    front == rear indica fila vazia e (rear + 1) % slots == front indica fila cheia.
+    
+    Depende da atomicidade das atribuições a atributos e a posições de lista
+    garantida pelo GIL do CPython: o produtor grava o item antes de publicar rear.
+    '''
+    def __init__(self, capacity=10):
+        self.capacity = capacity  # Tamanho máximo da fila
+        self.queue = [None] * (capacity + 1)  # Array com uma posição sempre livre
+        self.front = 0  # Índice do primeiro elemento (escrito só pelo consumidor)
+        self.rear = 0  # Índice da próxima posição disponível (escrito só pelo produtor)
+    
+    @property
+    def size(self):
+        '''Número de elementos, calculado a partir dos índices'''
+        return (self.rear - self.front) % len(self.queue)
+    
+    def is_empty(self):
+        '''
+        Verifica se a fila está vazia
+        Tempo: O(1)
+        '''
+        return self.front == self.rear
+    
+    def is_full(self):
+        '''
+        Verifica se a fila está cheia
+        Tempo: O(1)
+        '''
+        return (self.rear + 1) % len(self.queue) == self.front
+    
+    def enqueue(self, item):
+        '''
+        Adiciona um item ao final da fila (somente na thread produtora)
+        Tempo: O(1)
+        '''
+        rear = self.rear
+        next_rear = rear + 1
+        if next_rear == len(self.queue):
+            next_rear = 0
+        if next_rear == self.front:
+            raise IndexError("Enqueue to a full queue")
+        self.queue[rear] = item  # Grava o item antes de publicá-lo
+        self.rear = next_rear  # Publica o item para o consumidor
+    
+    def dequeue(self):
+        '''
+        Remove e retorna o item do início da fila (somente na thread consumidora)
+        Tempo: O(1)
+        '''
+        front = self.front
+        if front == self.rear:
+            raise IndexError("Dequeue from an empty queue")
+        item = self.queue[front]
+        self.queue[front] = None  # Limpa a posição
+        front += 1
+        self.front = 0 if front == len(self.queue) else front  # Libera a posição para o produtor
+        return item
+    
+    def enqueue_many(self, items):
+        '''
+        Adiciona vários itens de uma vez (somente na thread produtora).
+        Lança IndexError, sem inserir nada, se não houver espaço para todos.
+        Tempo: O(k), com no máximo duas cópias de fatias
+        '''
+        if not isinstance(items, list):
+            items = list(items)
+        if self.size + len(items) > self.capacity:
+            raise IndexError("Enqueue to a full queue")
+        self._write_slots(self.rear, items)
+        self.rear = (self.rear + len(items)) % len(self.queue)  # Publica o lote inteiro
+    
+    def dequeue_many(self, n):
+        '''
+        Remove e retorna até n itens do início da fila (somente na thread consumidora)
+        Tempo: O(k), com no máximo duas cópias de fatias
+        '''
+        if n < 0:
+            raise ValueError("Number of items to dequeue must be non-negative")
+        count = min(n, self.size)
+        items = self._read_slots(self.front, count)
+        self.front = (self.front + count) % len(self.queue)  # Libera as posições para o produtor
+        return items
+    
+    put_nowait = enqueue
+    get_nowait = dequeue
+    
+    def put(self, item, timeout=None):
+        '''
+        Adiciona um item, cedendo a CPU enquanto a fila estiver cheia, até o timeout
+        (None = sem limite). Lança IndexError se o tempo esgotar.
+        Tempo: O(1), mais o tempo de espera
+        '''
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return self.enqueue(item)
+            except IndexError:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise IndexError("Put to a full queue (timeout)") from None
+                time.sleep(0)  # Libera o GIL para o consumidor
+    
+    def get(self, timeout=None):
+        '''
+        Remove e retorna um item, cedendo a CPU enquanto a fila estiver vazia, até o
+        timeout (None = sem limite). Lança IndexError se o tempo esgotar.
+        Tempo: O(1), mais o tempo de espera
+        '''
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return self.dequeue()
+            except IndexError:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise IndexError("Get from an empty queue (timeout)") from None
+                time.sleep(0)  # Libera o GIL para o produtor
+    
+    def peek(self):
+        '''
+        Retorna o item do início da fila sem removê-lo (somente na thread consumidora)
+        Tempo: O(1)
+        '''
+        if self.is_empty():
+            raise IndexError("Peek from an empty queue")
+        return self.queue[self.front]
+    
+    def get_size(self):
+        '''
+        Retorna o número de itens na fila (valor aproximado se as duas threads estiverem ativas)
+        Tempo: O(1)
+        '''
+        return self.size
+
+# Demonstração de uso
+def main():
+    print("\n=== Filas Circulares Concorrentes ===\n")
+    
+    # Pipeline de três etapas ligadas por filas bloqueantes
+    print("--- Pipeline com threads (BlockingCircularQueue, capacidade 4) ---")
+    stage1 = BlockingCircularQueue(4)
+    stage2 = BlockingCircularQueue(4)
+    done = object()  # Marcador de fim de fluxo
+    
+    def producer():
+        for i in range(10):
+            stage1.put(i)
+        stage1.put(done)
+    
+    def squarer():
+        while (item := stage1.get()) is not done:
+            stage2.put(item * item)
+        stage2.put(done)
+    
+    threads = [threading.Thread(target=producer), threading.Thread(target=squarer)]
+    for thread in threads:
+        thread.start()
+    results = []
+    while (item := stage2.get()) is not done:
+        results.append(item)
+    for thread in threads:
+        thread.join()
+    print(f"Quadrados recebidos: {results}")
+    
+    print("\nTimeouts e variantes sem espera:")
+    small = BlockingCircularQueue(1)
+    small.put_nowait('A')
+    try:
+        small.put('B', timeout=0.05)
+    except IndexError as error:
+        print(f"put com fila cheia: {error}")
+    print(f"get_nowait: {small.get_nowait()}")
+    try:
+        small.get(timeout=0.05)
+    except IndexError as error:
+        print(f"get com fila vazia: {error}")
+    
+    # Produtor e consumidor como tarefas asyncio
+    print("\n--- asyncio (AsyncCircularQueue, capacidade 2) ---")
+    
+    async def demo():
+        buffer = AsyncCircularQueue(2)
+        
+        async def async_producer():
+            for letter in "ABCDEF":
+                await buffer.put(letter)
+            await buffer.put(None)
+        
+        async def async_consumer():
+            received = []
+            while (item := await buffer.get()) is not None:
+                received.append(item)
+            return received
+        
+        _, received = await asyncio.gather(async_producer(), async_consumer())
+        return received
+    
+    print(f"Recebidos: {asyncio.run(demo())}")
+    
+    # Caminho rápido sem locks
+    print("\n--- Sem locks, um produtor e um consumidor (SPSCCircularQueue) ---")
+    spsc = SPSCCircularQueue(3)
+    for letter in "XYZ":
+        spsc.put_nowait(letter)
+    print(f"Fila: {spsc}, cheia? {spsc.is_full()}")
+    print(f"Removido: {spsc.get_nowait()}")
+    spsc.put_nowait('W')
+    print(f"Fila final: {spsc}")
+
+def _spsc_throughput(buffer, n):
+    '''Tempo para uma thread produtora passar n itens a uma consumidora'''
+    def produce():
+        put = buffer.put
+        for i in range(n):
+            put(i)
+    
+    consumer_get = buffer.get
+    thread = threading.Thread(target=produce)
+    start = time.perf_counter()
+    thread.start()
+    for _ in range(n):
+        consumer_get()
+    thread.join()
+    return time.perf_counter() - start
+
+def benchmark(n=500000, capacity=1024):
+    '''
+    Compara a vazão de um produtor e um consumidor com queue.Queue da biblioteca padrão.
+    '''
+    print(f"\n=== {n} itens, um produtor e um consumidor, capacidade {capacity} ===\n")
+    for label, buffer in (("queue.Queue", queue.Queue(capacity)),
+                          ("BlockingCircularQueue", BlockingCircularQueue(capacity)),
+                          ("SPSCCircularQueue", SPSCCircularQueue(capacity))):
+        elapsed = _spsc_throughput(buffer, n)
+        print(f"{label:<22} {n / elapsed / 1e3:8.1f} mil itens/s")
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark()
+    else:
+        main()
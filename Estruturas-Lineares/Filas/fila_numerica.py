@@ -0,0 +1,217 @@
+'''
+Fila Circular Numérica
+
+Este arquivo estende a CircularQueue de fila.py para séries de números (telemetria,
+sensores, métricas). Os valores ficam em um array tipado contíguo (array.array da
+biblioteca padrão, ou um array NumPy quando a biblioteca está instalada), ocupando
+o tamanho do tipo por amostra em vez de um objeto Python por posição. O método
+window() expõe o conteúdo atual sem cópias, como no máximo duas memoryviews.
+
+Autor: Alef Khatab
+'''
+
+from array import array
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional
+    np = None
+
+from fila import CircularQueue
+
+class NumericCircularQueue(CircularQueue):
+    '''
+    Fila circular de tamanho fixo para valores numéricos de um único tipo.
+    typecode segue os códigos do módulo array ('d' = float de 8 bytes,
+    'q' = inteiro de 8 bytes, 'f', 'i', ...). Com use_numpy=None, o NumPy é usado
+    quando estiver disponível.
+    '''
+    def __init__(self, capacity=10, typecode='d', use_numpy=None):
+        self.capacity = capacity  # Tamanho máximo da fila
+        self.typecode = typecode  # Tipo dos valores armazenados
+        self.use_numpy = np is not None if use_numpy is None else use_numpy
+        if self.use_numpy:
+            if np is None:
+                raise ImportError("NumPy is not installed")
+            self.queue = np.zeros(capacity, dtype=typecode)  # Array NumPy contíguo
+            # Reduções vetorizadas; .item() converte os escalares NumPy em int/float do Python
+            self._sum = lambda segment: np.sum(segment).item()
+            self._min = lambda segment: np.min(segment).item()
+            self._max = lambda segment: np.max(segment).item()
+            self._get = self.queue.item  # Leitura de uma posição como int/float do Python
+        else:
+            self.queue = array(typecode, [0]) * capacity  # Array tipado zerado
+            self._sum, self._min, self._max = sum, min, max  # Reduções em C sobre a memoryview
+            self._get = self.queue.__getitem__  # array.array já devolve int/float do Python
+        self.front = 0  # Índice do primeiro elemento
+        self.rear = 0  # Índice da próxima posição disponível
+        self.size = 0  # Número de elementos na fila
+    
+    def dequeue(self):
+        '''
+        Remove e retorna o item do início da fila.
+        As posições de um array tipado não guardam referências, então não são limpas.
+        Tempo: O(1)
+        '''
+        if self.is_empty():
+            raise IndexError("Dequeue from an empty queue")
+        
+        item = self._get(self.front)
+        self.front = (self.front + 1) % self.capacity
+        self.size -= 1
+        return item
+    
+    def peek(self):
+        '''
+        Retorna o item do início da fila sem removê-lo
+        Tempo: O(1)
+        '''
+        if self.is_empty():
+            raise IndexError("Peek from an empty queue")
+        return self._get(self.front)
+    
+    def _items_at(self, indices):
+        '''
+        Gerador dos itens nas posições indices, contadas a partir do início da fila,
+        como int/float do Python nos dois backends (usado por __iter__, view e __str__)
+        '''
+        get = self._get
+        slots = self.capacity
+        front = self.front
+        for i in indices:
+            yield get((front + i) % slots)
+    
+    def _write_slots(self, start, items):
+        '''
+        Copia items para o buffer a partir de start (no máximo duas cópias de fatias)
+        '''
+        if not self.use_numpy:
+            items = array(self.typecode, items)  # Fatias de array.array só aceitam arrays do mesmo tipo
+        super()._write_slots(start, items)
+    
+    def _read_slots(self, start, count):
+        '''
+        Copia count itens do buffer a partir de start para um novo array do mesmo tipo
+        '''
+        first, second = self._segments(start, count)
+        if self.use_numpy:
+            return np.concatenate((first, second))  # Sempre devolve uma cópia
+        return first + second
+    
+    def _segments(self, start, count):
+        '''Fatias do buffer que cobrem count itens a partir de start'''
+        end = start + count
+        if end <= self.capacity:
+            return self.queue[start:end], self.queue[0:0]
+        return self.queue[start:], self.queue[:end - self.capacity]
+    
+    def window(self):
+        '''
+        Retorna o conteúdo atual, do mais antigo ao mais recente, como uma tupla de
+        uma ou duas memoryviews sobre o buffer, sem copiar os valores.
+        As views refletem escritas posteriores na fila.
+        Tempo: O(1)
+        '''
+        view = memoryview(self.queue)
+        end = self.front + self.size
+        if end <= self.capacity:
+            return (view[self.front:end],)
+        return view[self.front:], view[:end - self.capacity]
+    
+    def _stat_segments(self):
+        '''Segmentos não vazios da janela, para as estatísticas'''
+        if self.is_empty():
+            raise IndexError("Statistics of an empty queue")
+        return [segment for segment in self.window() if len(segment)]
+    
+    def mean(self):
+        '''
+        Média dos valores da janela
+        Tempo: O(n), executado em código C
+        '''
+        return sum(self._sum(segment) for segment in self._stat_segments()) / self.size
+    
+    def min(self):
+        '''
+        Menor valor da janela
+        Tempo: O(n), executado em código C
+        '''
+        return min(self._min(segment) for segment in self._stat_segments())
+    
+    def max(self):
+        '''
+        Maior valor da janela
+        Tempo: O(n), executado em código C
+        '''
+        return max(self._max(segment) for segment in self._stat_segments())
+    
+    def memory_per_sample(self):
+        '''
+        Bytes ocupados por posição do buffer
+        '''
+        return self.queue.itemsize
+
+# Demonstração de uso
+def main():
+    print("\n=== Fila Circular Numérica ===\n")
+    print(f"NumPy disponível? {np is not None}")
+    
+    samples = NumericCircularQueue(5, 'd')
+    print("\nEnfileirando leituras: 20.5, 21.0, 22.5, 19.0, 23.5")
+    samples.enqueue_many([20.5, 21.0, 22.5, 19.0, 23.5])
+    print(f"Fila: {samples}")
+    
+    print("\nDescartando as duas leituras mais antigas e enfileirando 24.0, 18.5")
+    samples.dequeue_many(2)
+    samples.enqueue_many([24.0, 18.5])
+    print(f"Fila: {samples}")
+    
+    segments = samples.window()
+    print(f"window(): {len(segments)} segmento(s) -> {[segment.tolist() for segment in segments]}")
+    print(f"Média: {samples.mean():.2f}, mínimo: {samples.min()}, máximo: {samples.max()}")
+    print(f"Bytes por amostra: {samples.memory_per_sample()}")
+    
+    counters = NumericCircularQueue(3, 'q')
+    for value in (10, 20, 30):
+        counters.enqueue(value)
+    print(f"\nFila de inteiros ('q'): {counters}, soma via mean: {counters.mean() * counters.get_size():.0f}")
+
+def benchmark(capacity=1000000):
+    '''
+    Compara memória e tempo das estatísticas entre a CircularQueue de objetos
+    e a NumericCircularQueue tipada.
+    '''
+    print(f"\n=== {capacity} amostras ===\n")
+    values = [i * 0.5 for i in range(capacity)]
+    
+    boxed = CircularQueue(capacity)
+    boxed.enqueue_many(values)
+    # Lista de ponteiros + um objeto float por amostra
+    boxed_bytes = sys.getsizeof(boxed.queue) + sum(sys.getsizeof(value) for value in values)
+    
+    typed = NumericCircularQueue(capacity, 'd', use_numpy=False)
+    typed.enqueue_many(values)
+    typed_bytes = sys.getsizeof(typed.queue)
+    
+    print(f"CircularQueue:        {boxed_bytes / capacity:5.1f} bytes por amostra")
+    print(f"NumericCircularQueue: {typed_bytes / capacity:5.1f} bytes por amostra")
+    
+    start = time.perf_counter()
+    items = [boxed.queue[(boxed.front + i) % boxed.capacity] for i in range(boxed.size)]
+    boxed_mean = sum(items) / len(items)
+    boxed_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    typed_mean = typed.mean()
+    typed_time = time.perf_counter() - start
+    assert boxed_mean == typed_mean
+    print(f"\nMédia percorrendo a CircularQueue: {boxed_time * 1e3:6.1f} ms")
+    print(f"NumericCircularQueue.mean():       {typed_time * 1e3:6.1f} ms")
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark()
+    else:
+        main()
@@ -0,0 +1,342 @@
+'''
+Fila Persistente em Disco
+
+Este arquivo implementa uma fila FIFO que sobrevive a reinícios do processo e não
+precisa caber na memória. Os itens são gravados em um log segmentado, somente de
+anexação (append-only), e as posições de início (head) e fim (tail) ficam em um
+pequeno arquivo de índice mapeado em memória (mmap). A política de fsync é
+configurável e, ao reabrir a fila, registros incompletos deixados por uma falha
+são descartados.
+
+Autor: Alef Khatab
+'''
+
+import mmap
+import os
+import pickle
+import shutil
+import struct
+import sys
+import tempfile
+import time
+import zlib
+
+# Formato do índice: segmento e deslocamento do início, segmento e deslocamento do fim, número de itens
+INDEX_FORMAT = struct.Struct("<QQQQQ")
+# Cabeçalho de cada registro no log: tamanho do conteúdo e CRC32 do conteúdo
+RECORD_HEADER = struct.Struct("<II")
+
+class PersistentQueue:
+    '''
+    Fila FIFO persistente com a mesma interface de Queue (enqueue, dequeue, peek,
+    size, is_empty). Os itens são serializados com pickle.
+    
+    Cada enqueue é entregue ao sistema operacional com uma única chamada write, e o
+    índice é atualizado na memória mapeada; assim, uma falha do processo não perde
+    itens. A política de fsync define o que sobrevive a uma falha do sistema:
+    fsync_every=N sincroniza a cada N operações, fsync_interval=T a cada T segundos,
+    e ambos None nunca sincronizam (exceto em sync() e close()).
+    Itens removidos depois do último fsync podem ser entregues de novo após uma
+    falha do sistema (entrega pelo menos uma vez).
+    '''
+    def __init__(self, directory, segment_size=64 * 1024 * 1024, fsync_every=None, fsync_interval=None):
+        self.directory = directory  # Diretório com os segmentos e o índice
+        self.segment_size = segment_size  # Tamanho a partir do qual um novo segmento é iniciado
+        self.fsync_every = fsync_every  # Operações entre fsyncs (None = desativado)
+        self.fsync_interval = fsync_interval  # Segundos entre fsyncs (None = desativado)
+        self.pending_ops = 0  # Operações desde o último fsync
+        self.last_sync = time.monotonic()  # Instante do último fsync
+        os.makedirs(directory, exist_ok=True)
+        
+        # Índice mapeado em memória
+        index_path = os.path.join(directory, "index")
+        self.index_fd = os.open(index_path, os.O_RDWR | os.O_CREAT, 0o644)
+        if os.fstat(self.index_fd).st_size < INDEX_FORMAT.size:
+            os.ftruncate(self.index_fd, INDEX_FORMAT.size)
+        self.index = mmap.mmap(self.index_fd, INDEX_FORMAT.size)
+        (self.head_segment, self.head_offset,
+         self.tail_segment, self.tail_offset, self.count) = INDEX_FORMAT.unpack_from(self.index)
+        
+        self._recover()
+        self.writer = os.open(self._segment_path(self.tail_segment), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self.reader = open(self._segment_path(self.head_segment), "rb")  # Leitura bufferizada do segmento inicial
+        self.reader.seek(self.head_offset)
+        self.peeked = None  # Par (item, tamanho do registro) lido por peek e ainda não removido
+    
+    def _segment_path(self, segment):
+        return os.path.join(self.directory, f"segment-{segment:08d}.log")
+    
+    def _save_index(self):
+        INDEX_FORMAT.pack_into(self.index, 0, self.head_segment, self.head_offset,
+                               self.tail_segment, self.tail_offset, self.count)
+    
+    @staticmethod
+    def _scan(path, offset):
+        '''
+        Percorre os registros válidos de um segmento a partir de offset.
+        Retorna (número de registros válidos, deslocamento após o último válido).
+        '''
+        valid = 0
+        with open(path, "rb") as segment:
+            segment.seek(offset)
+            while True:
+                header = segment.read(RECORD_HEADER.size)
+                if len(header) < RECORD_HEADER.size:
+                    break
+                length, checksum = RECORD_HEADER.unpack(header)
+                payload = segment.read(length)
+                if len(payload) < length or zlib.crc32(payload) != checksum:
+                    break  # Registro incompleto ou corrompido: fim do log válido
+                valid += 1
+                offset += RECORD_HEADER.size + length
+        return valid, offset
+    
+    def _recover(self):
+        '''
+        Reconcilia o índice com o log após uma reabertura ou falha:
+        registros gravados depois da última atualização do índice são recuperados
+        e um registro incompleto no final do log é descartado.
+        '''
+        recount = False
+        if not os.path.exists(self._segment_path(self.head_segment)):
+            # O índice em disco é anterior à remoção do segmento inicial (falha do
+            # sistema): o início passa para o primeiro segmento que ainda existe
+            later = [segment for segment in self._existing_segments() if segment > self.head_segment]
+            if later:
+                self.head_segment = later[0]
+            self.tail_segment = max(self.tail_segment, self.head_segment)
+            self.head_offset = 0
+            recount = True
+        
+        path = self._segment_path(self.tail_segment)
+        if not os.path.exists(path):
+            open(path, "wb").close()
+        if not recount and os.path.getsize(path) >= self.tail_offset:
+            # Caso comum: procura registros além do fim registrado no índice
+            extra, end = self._scan(path, self.tail_offset)
+            self.count += extra
+        else:
+            # O índice não corresponde ao log: recontagem a partir do início
+            self.count = 0
+            for segment in range(self.head_segment, self.tail_segment + 1):
+                start = self.head_offset if segment == self.head_segment else 0
+                valid, end = self._scan(self._segment_path(segment), start)
+                self.count += valid
+        self.tail_offset = end
+        os.truncate(path, end)  # Remove o registro incompleto, se houver
+        while os.path.exists(self._segment_path(self.tail_segment + 1)):
+            # Trocas de segmento que não chegaram ao índice antes da falha
+            self._adopt_segment(self.tail_segment + 1)
+        self._save_index()
+    
+    def _existing_segments(self):
+        '''Números dos segmentos presentes no diretório, em ordem'''
+        return sorted(int(name[len("segment-"):-len(".log")]) for name in os.listdir(self.directory)
+                      if name.startswith("segment-") and name.endswith(".log"))
+    
+    def _adopt_segment(self, segment):
+        '''
+        Torna segment o fim do log, recuperando os registros válidos que ele já
+        contenha e descartando um registro incompleto no seu final
+        '''
+        path = self._segment_path(segment)
+        valid = end = 0
+        if os.path.exists(path):
+            valid, end = self._scan(path, 0)
+            os.truncate(path, end)
+        self.tail_segment = segment
+        self.tail_offset = end
+        self.count += valid
+    
+    def _after_operation(self):
+        '''Aplica a política de fsync após cada enqueue ou dequeue'''
+        self.pending_ops += 1
+        if self.fsync_every is not None and self.pending_ops >= self.fsync_every:
+            self.sync()
+        elif self.fsync_interval is not None and time.monotonic() - self.last_sync >= self.fsync_interval:
+            self.sync()
+    
+    def sync(self):
+        '''
+        Grava em disco os segmentos e, depois deles, o índice
+        '''
+        os.fsync(self.writer)
+        self.index.flush()
+        self.pending_ops = 0
+        self.last_sync = time.monotonic()
+    
+    def is_empty(self):
+        '''
+        Verifica se a fila está vazia
+        Tempo: O(1)
+        '''
+        return self.count == 0
+    
+    def enqueue(self, item):
+        '''
+        Adiciona um item ao final da fila
+        Tempo: O(1), uma chamada write
+        '''
+        payload = pickle.dumps(item, pickle.HIGHEST_PROTOCOL)
+        if self.tail_offset > 0 and self.tail_offset + RECORD_HEADER.size + len(payload) > self.segment_size:
+            # Segmento cheio: continua em um novo arquivo
+            if self.fsync_every is not None or self.fsync_interval is not None:
+                os.fsync(self.writer)  # O segmento antigo sai do alcance de sync()
+            os.close(self.writer)
+            self._adopt_segment(self.tail_segment + 1)
+            self._save_index()  # O índice aponta para o novo segmento antes da primeira escrita nele
+            self.writer = os.open(self._segment_path(self.tail_segment),
+                                  os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        os.write(self.writer, RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+        self.tail_offset += RECORD_HEADER.size + len(payload)
+        self.count += 1
+        self._save_index()
+        self._after_operation()
+    
+    def _read_next(self):
+        '''Lê o próximo registro a partir do início da fila, avançando entre segmentos'''
+        header = self.reader.read(RECORD_HEADER.size)
+        if not header:
+            # Fim de um segmento já consumido: passa para o próximo e apaga o antigo
+            self.reader.close()
+            self.head_segment += 1
+            self.head_offset = 0
+            self._save_index()
+            self.index.flush()  # O índice em disco deixa de apontar para o segmento antes de apagá-lo
+            os.remove(self._segment_path(self.head_segment - 1))
+            self.reader = open(self._segment_path(self.head_segment), "rb")
+            header = self.reader.read(RECORD_HEADER.size)
+        length, _ = RECORD_HEADER.unpack(header)
+        return pickle.loads(self.reader.read(length)), RECORD_HEADER.size + length
+    
+    def dequeue(self):
+        '''
+        Remove e retorna o item do início da fila
+        Tempo: O(1)
+        '''
+        if self.is_empty():
+            raise IndexError("Dequeue from an empty queue")
+        
+        if self.peeked is not None:
+            (item, record_size), self.peeked = self.peeked, None
+        else:
+            item, record_size = self._read_next()
+        self.head_offset += record_size
+        self.count -= 1
+        self._save_index()
+        self._after_operation()
+        return item
+    
+    def peek(self):
+        '''
+        Retorna o item do início da fila sem removê-lo
+        Tempo: O(1)
+        '''
+        if self.is_empty():
+            raise IndexError("Peek from an empty queue")
+        if self.peeked is None:
+            self.peeked = self._read_next()
+        return self.peeked[0]
+    
+    def size(self):
+        '''
+        Retorna o número de itens na fila
+        Tempo: O(1)
+        '''
+        return self.count
+    
+    def close(self):
+        '''
+        Sincroniza e fecha os arquivos da fila
+        '''
+        self.sync()
+        os.close(self.writer)
+        self.reader.close()
+        self.index.close()
+        os.close(self.index_fd)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def __str__(self):
+        '''
+        Retorna uma descrição da fila (os itens ficam em disco)
+        '''
+        return (f"PersistentQueue({self.count} itens, segmentos "
+                f"{self.head_segment}..{self.tail_segment}, em '{self.directory}')")
+
+# Demonstração de uso
+def main():
+    print("\n=== Fila Persistente em Disco ===\n")
+    directory = tempfile.mkdtemp(prefix="fila_persistente_")
+    try:
+        print("--- Enfileirando e reabrindo ---")
+        with PersistentQueue(directory) as queue:
+            for item in ("A", "B", "C", {"tarefa": 4}):
+                queue.enqueue(item)
+            print(f"Removido: {queue.dequeue()}")
+            print(queue)
+        
+        with PersistentQueue(directory) as queue:
+            print(f"Após reabrir: tamanho {queue.size()}, início {queue.peek()!r}")
+        
+        print("\n--- Recuperação após falha ---")
+        pid = os.fork() if hasattr(os, "fork") else None
+        if pid == 0:
+            # Processo filho: enfileira e termina abruptamente, sem close()
+            queue = PersistentQueue(directory)
+            queue.enqueue("E")
+            queue.enqueue("F")
+            os._exit(0)
+        if pid is not None:
+            os.waitpid(pid, 0)
+            print("Processo filho enfileirou 'E' e 'F' e terminou sem fechar a fila")
+        
+        # Simula uma gravação interrompida no meio de um registro
+        queue = PersistentQueue(directory)
+        with open(queue._segment_path(queue.tail_segment), "ab") as segment:
+            segment.write(RECORD_HEADER.pack(100, 0) + b"incompleto")
+        queue.close()
+        print("Registro incompleto gravado no final do log")
+        
+        with PersistentQueue(directory) as queue:
+            items = [queue.dequeue() for _ in range(queue.size())]
+            print(f"Itens recuperados: {items}")
+    finally:
+        shutil.rmtree(directory)
+
+def benchmark(n=1000000, segment_size=16 * 1024 * 1024):
+    '''
+    Mede a vazão de enqueue e dequeue de itens pequenos com diferentes políticas de fsync.
+    '''
+    print(f"\n=== {n} itens pequenos, segmentos de {segment_size // (1024 * 1024)} MiB ===\n")
+    policies = (("nunca", {}),
+                ("a cada 10 ms", {"fsync_interval": 0.01}),
+                ("a cada 10000 ops", {"fsync_every": 10000}))
+    for label, policy in policies:
+        directory = tempfile.mkdtemp(prefix="fila_persistente_")
+        try:
+            queue = PersistentQueue(directory, segment_size=segment_size, **policy)
+            start = time.perf_counter()
+            for i in range(n):
+                queue.enqueue(i)
+            enqueue_time = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            while not queue.is_empty():
+                queue.dequeue()
+            dequeue_time = time.perf_counter() - start
+            queue.close()
+        finally:
+            shutil.rmtree(directory)
+        print(f"fsync {label:<17} enqueue {n / enqueue_time / 1e3:6.1f} mil ops/s, "
+              f"dequeue {n / dequeue_time / 1e3:6.1f} mil ops/s")
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark()
+    else:
+        main()
@@ -0,0 +1,283 @@
+'''
+Implementação de Lista Encadeada Desenrolada (Unrolled Linked List) em Python
+
+Este arquivo implementa uma variante da LinkedList de lista_encadeada.py em que cada
+nó guarda um pequeno vetor de até NODE_CAPACITY elementos, em vez de um único
+elemento. Percorrer a lista passa a seguir um ponteiro a cada bloco de elementos,
+e não a cada elemento, e o custo de memória de um nó é dividido entre vários
+elementos. Os nós são divididos quando enchem e fundidos quando ficam com menos da
+metade da capacidade.
+
+Autores: Alef Khatab
+'''
+
+from itertools import islice
+import sys
+import time
+import tracemalloc
+
+from lista_encadeada import LinkedList
+from pool_de_nos import bounded_str
+
+class UnrolledNode:
+    '''Nó de uma lista desenrolada: um vetor de elementos e a referência para o próximo nó'''
+    __slots__ = ("items", "next")
+    
+    def __init__(self, items=None):
+        self.items = [] if items is None else items  # Elementos do nó, em ordem
+        self.next = None  # Referência para o próximo nó
+
+class UnrolledLinkedList:
+    '''
+    Lista encadeada desenrolada com a mesma interface da LinkedList
+    (insert_at_beginning, insert_at_end, insert_after, delete_node, search,
+    print_list, get_size). Cada nó guarda entre node_capacity // 2 e node_capacity
+    elementos (exceto o último nó).
+    '''
+    NODE_CAPACITY = 64
+    
+    def __init__(self, node_capacity=NODE_CAPACITY):
+        if node_capacity < 2:
+            raise ValueError("Node capacity must be at least 2")
+        self.node_capacity = node_capacity  # Máximo de elementos por nó
+        self.head = None  # Primeiro nó
+        self.tail = None  # Último nó: insert_at_end não percorre a lista
+        self.size = 0  # Contador de elementos
+    
+    def is_empty(self):
+        '''Verifica se a lista está vazia'''
+        return self.head is None
+    
+    def _split(self, node):
+        '''Divide um nó cheio em dois nós com metade dos elementos cada - O(capacidade)'''
+        half = len(node.items) // 2
+        new_node = UnrolledNode(node.items[half:])
+        del node.items[half:]
+        new_node.next = node.next
+        node.next = new_node
+        if self.tail is node:
+            self.tail = new_node
+    
+    def _insert_into(self, node, index, data):
+        '''Insere data na posição index do nó e o divide se passar da capacidade'''
+        node.items.insert(index, data)
+        self.size += 1
+        if len(node.items) > self.node_capacity:
+            self._split(node)
+    
+    def insert_at_beginning(self, data):
+        '''Insere um elemento no início da lista - O(capacidade)'''
+        if self.head is None:
+            self.head = self.tail = UnrolledNode()
+        self._insert_into(self.head, 0, data)
+    
+    def insert_at_end(self, data):
+        '''Insere um elemento no final da lista - O(1) amortizado, usando tail'''
+        if self.tail is None:
+            self.head = self.tail = UnrolledNode()
+        elif len(self.tail.items) == self.node_capacity:
+            # Último nó cheio: começa um novo nó em vez de dividir, mantendo os nós cheios
+            self.tail.next = UnrolledNode()
+            self.tail = self.tail.next
+        self.tail.items.append(data)
+        self.size += 1
+    
+    def _find(self, key):
+        '''
+        Retorna (nó anterior, nó, índice no nó, posição na lista) da primeira
+        ocorrência de key, ou None. A busca dentro de cada nó é feita em código C.
+        Tempo: O(n)
+        '''
+        previous = None
+        current = self.head
+        position = 0
+        while current:
+            items = current.items
+            if key in items:
+                index = items.index(key)
+                return previous, current, index, position + index
+            position += len(items)
+            previous = current
+            current = current.next
+        return None
+    
+    def insert_after(self, prev_data, data):
+        '''Insere um elemento após o primeiro elemento igual a prev_data - O(n)'''
+        # Verifica se a lista está vazia
+        if self.is_empty():
+            print("Lista vazia, não é possível inserir após um elemento")
+            return False
+        
+        # Procura o elemento prev_data
+        found = self._find(prev_data)
+        
+        # Se não encontrou o elemento
+        if found is None:
+            print(f"Elemento {prev_data} não encontrado na lista")
+            return False
+        
+        _, node, index, _ = found
+        self._insert_into(node, index + 1, data)
+        return True
+    
+    def _rebalance(self, previous, node):
+        '''
+        Após uma remoção, garante que node tenha ao menos metade da capacidade:
+        pega elementos do próximo nó ou funde os dois. Remove o nó se ficar vazio.
+        '''
+        minimum = self.node_capacity // 2
+        if len(node.items) >= minimum:
+            return
+        following = node.next
+        if following is not None:
+            if len(node.items) + len(following.items) <= self.node_capacity:
+                # Funde o próximo nó neste
+                node.items.extend(following.items)
+                node.next = following.next
+                if self.tail is following:
+                    self.tail = node
+            else:
+                # Pega elementos do próximo nó até completar metade da capacidade
+                moved = minimum - len(node.items)
+                node.items.extend(following.items[:moved])
+                del following.items[:moved]
+        elif not node.items:
+            # Último nó vazio: remove o nó
+            if previous is None:
+                self.head = self.tail = None
+            else:
+                previous.next = None
+                self.tail = previous
+    
+    def delete_node(self, key):
+        '''Remove o primeiro elemento igual a key - O(n)'''
+        # Verifica se a lista está vazia
+        if self.is_empty():
+            print("Lista vazia, não há o que remover")
+            return False
+        
+        # Procura o elemento a ser removido
+        found = self._find(key)
+        
+        # Se não encontrou o elemento
+        if found is None:
+            print(f"Elemento {key} não encontrado na lista")
+            return False
+        
+        previous, node, index, _ = found
+        del node.items[index]
+        self.size -= 1
+        self._rebalance(previous, node)
+        return True
+    
+    def search(self, key):
+        '''Busca um elemento na lista e retorna sua posição, ou -1 - O(n)'''
+        found = self._find(key)
+        return -1 if found is None else found[3]
+    
+    def __len__(self):
+        return self.size
+    
+    def __iter__(self):
+        '''Gerador que percorre os elementos do início ao fim, um nó por vez - O(1) por elemento'''
+        current = self.head
+        while current:
+            yield from current.items
+            current = current.next
+    
+    def view(self, start=0, stop=None):
+        '''Visão preguiçosa dos elementos entre as posições start e stop, como islice'''
+        return islice(self, start, stop)
+    
+    def __repr__(self):
+        return f"UnrolledLinkedList(tamanho={self.size}, itens={bounded_str(self, self.size)})"
+    
+    def print_list(self):
+        '''Imprime todos os elementos da lista, um nó por vez, sem montar a string inteira - O(n)'''
+        if self.is_empty():
+            print("Lista vazia")
+            return
+        
+        current = self.head
+        prefix = ""
+        
+        while current:
+            sys.stdout.write(prefix + " -> ".join(map(str, current.items)))
+            prefix = " -> "
+            current = current.next
+        
+        sys.stdout.write("\n")
+    
+    def get_size(self):
+        '''Retorna o tamanho da lista - O(1)'''
+        return self.size
+    
+    def node_count(self):
+        '''Retorna o número de nós - O(n / capacidade)'''
+        count = 0
+        current = self.head
+        while current:
+            count += 1
+            current = current.next
+        return count
+
+# Demonstração de uso
+def main():
+    print("\n=== Lista Encadeada Desenrolada - Demonstração ===\n")
+    
+    # Nós com no máximo 4 elementos, para que as divisões e fusões fiquem visíveis
+    unrolled = UnrolledLinkedList(node_capacity=4)
+    
+    print("Inserindo 1..10 no final da lista:")
+    for value in range(1, 11):
+        unrolled.insert_at_end(value)
+    unrolled.print_list()
+    print(f"Elementos: {unrolled.get_size()}, nós: {unrolled.node_count()}")
+    
+    print("\nInserindo 0 no início e 5.5 após o 5:")
+    unrolled.insert_at_beginning(0)
+    unrolled.insert_after(5, 5.5)
+    unrolled.print_list()
+    
+    print("\nBuscando elementos:")
+    print(f"Posição do elemento 7: {unrolled.search(7)}")
+    print(f"Posição do elemento 42: {unrolled.search(42)}")
+    
+    print("\nRemovendo 1, 2, 3, 4 e 5 (os nós são fundidos):")
+    for value in range(1, 6):
+        unrolled.delete_node(value)
+    unrolled.print_list()
+    print(f"Elementos: {unrolled.get_size()}, nós: {unrolled.node_count()}")
+    
+    print("\nTentando remover um elemento que não existe:")
+    unrolled.delete_node(42)
+
+def benchmark(n=1000000):
+    '''
+    Compara construção, percurso (busca de um elemento ausente) e memória por
+    elemento entre a LinkedList e a UnrolledLinkedList.
+    '''
+    print(f"\n=== {n} elementos ===\n")
+    values = list(range(n))  # Criados antes da medição: a memória medida é só a da estrutura
+    for label, factory in (("LinkedList", LinkedList), ("UnrolledLinkedList", UnrolledLinkedList)):
+        tracemalloc.start()
+        start = time.perf_counter()
+        linked_list = factory()
+        for value in values:
+            linked_list.insert_at_end(value)
+        build_time = time.perf_counter() - start
+        structure_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        
+        start = time.perf_counter()
+        linked_list.search(-1)  # Percorre a lista inteira
+        traversal_time = time.perf_counter() - start
+        print(f"{label:<19} construção {build_time:5.2f} s, percurso {traversal_time * 1e3:6.1f} ms, "
+              f"{structure_bytes / n:5.1f} bytes por elemento")
+        del linked_list
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark()
+    else:
+        main()
@@ -3,61 +3,202 @@ Implementação de Lista Encadeada em Python
 
 Este arquivo demonstra a implementação e uso de uma lista encadeada simples,
 incluindo as operações básicas de inserção, remoção, busca e percurso.
+A lista mantém uma referência para o último nó, pode ser duplamente encadeada
+e, opcionalmente, indexada por valor para buscas e remoções sem percurso.
 
 Autores: Alef Khatab 
 '''
 
-class Node:
-    '''Classe que representa um nó na lista encadeada'''
-    def __init__(self, data):
-        self.data = data  # Dado armazenado no nó
-        self.next = None  # Referência para o próximo nó (inicialmente None)
+from itertools import islice
+import sys
+import time
 
-class LinkedList:
-    '''Implementação de uma lista encadeada simples'''
+# pool_de_nos fica em Conceitos-Fundamentais/Alocacao-Dinamica (execute com executar.py)
+from pool_de_nos import Node, NodePool, bounded_str, print_joined
+
+class PositionIndex:
+    '''
+    Índice de posições (estatística de ordem) dos nós de uma lista encadeada.
+    Os nós são agrupados, na ordem da lista, em blocos de até 2 * BLOCK_SIZE nós, e
+    uma árvore de Fenwick guarda os tamanhos dos blocos. A posição de um nó é a soma
+    dos tamanhos dos blocos anteriores mais o seu índice dentro do bloco.
+    '''
+    BLOCK_SIZE = 512
+    
     def __init__(self):
+        self.blocks = [[]]  # Blocos de nós consecutivos, em ordem
+        self.block_of = {}  # Mapa nó -> bloco que o contém
+        self._reindex()
+    
+    def _reindex(self):
+        '''
+        Renumera os blocos e reconstrói a árvore de Fenwick após uma divisão ou
+        remoção de bloco
+        Tempo: O(n / BLOCK_SIZE)
+        '''
+        self.block_number = {id(block): number for number, block in enumerate(self.blocks)}
+        tree = [0] * (len(self.blocks) + 1)
+        for i, block in enumerate(self.blocks, 1):
+            tree[i] += len(block)
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self.tree = tree
+    
+    def _add(self, number, delta):
+        '''Soma delta ao tamanho do bloco number na árvore de Fenwick - O(log n)'''
+        i = number + 1
+        tree = self.tree
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+    
+    def insert(self, node, after):
+        '''
+        Registra node logo após o nó after (None = no início da lista)
+        Tempo: O(BLOCK_SIZE + log n) amortizado
+        '''
+        if after is None:
+            block = self.blocks[0]
+            block.insert(0, node)
+        else:
+            block = self.block_of[after]
+            if block[-1] is after:
+                block.append(node)  # Caso comum: inserção no final
+            else:
+                block.insert(block.index(after) + 1, node)
+        self.block_of[node] = block
+        
+        if len(block) > 2 * self.BLOCK_SIZE:
+            # Divide o bloco cheio em dois
+            number = self.block_number[id(block)]
+            second = block[self.BLOCK_SIZE:]
+            del block[self.BLOCK_SIZE:]
+            self.blocks.insert(number + 1, second)
+            for moved in second:
+                self.block_of[moved] = second
+            self._reindex()
+        else:
+            self._add(self.block_number[id(block)], 1)
+    
+    def remove(self, node):
+        '''
+        Remove o registro de node
+        Tempo: O(BLOCK_SIZE + log n) amortizado
+        '''
+        block = self.block_of.pop(node)
+        block.remove(node)
+        number = self.block_number[id(block)]
+        if not block and len(self.blocks) > 1:
+            del self.blocks[number]
+            self._reindex()
+        else:
+            self._add(number, -1)
+    
+    def rank(self, node):
+        '''
+        Retorna a posição de node na lista (a partir de 0)
+        Tempo: O(BLOCK_SIZE + log n)
+        '''
+        block = self.block_of[node]
+        i = self.block_number[id(block)]
+        position = 0
+        while i > 0:
+            position += self.tree[i]
+            i -= i & -i
+        return position + block.index(node)
+
+class LinkedList:
+    '''
+    Implementação de uma lista encadeada simples (opcionalmente com uma NodePool).
+    
+    Com doubly=True, cada nó também aponta para o anterior, o que torna pop_back e a
+    remoção de um nó a partir da sua referência O(1). Com indexed=True (que implica
+    doubly=True), um dicionário valor -> nós e um PositionIndex são mantidos a cada
+    inserção e remoção: search, delete_node e insert_after deixam de percorrer a
+    lista. Nesse modo os valores precisam ser hashable.
+    '''
+    def __init__(self, pool=None, doubly=False, indexed=False):
         self.head = None  # Referência para o primeiro nó (inicialmente None)
+        self.tail = None  # Referência para o último nó (inicialmente None)
         self.size = 0     # Contador de elementos
+        self.pool = pool  # Reserva de nós opcional
+        self.new_node = Node if pool is None else pool.acquire  # Cria ou reaproveita um nó
+        self.doubly = doubly or indexed  # Mantém as referências prev dos nós
+        self.index = {} if indexed else None  # Mapa valor -> nós com esse valor
+        self.positions = PositionIndex() if indexed else None  # Posições dos nós
     
     def is_empty(self):
         '''Verifica se a lista está vazia'''
         return self.head is None
     
-    def insert_at_beginning(self, data):
-        '''Insere um novo nó no início da lista - O(1)'''
-        new_node = Node(data)  # Cria um novo nó
-        new_node.next = self.head  # O novo nó aponta para o antigo head
-        self.head = new_node  # O head agora é o novo nó
+    def _link_after(self, previous, data):
+        '''
+        Cria um nó com data e o liga após previous (None = no início da lista),
+        atualizando tail, as referências prev e os índices - O(1)
+        '''
+        new_node = self.new_node(data)  # Cria (ou reaproveita) um nó
+        following = self.head if previous is None else previous.next
+        new_node.next = following
+        if previous is None:
+            self.head = new_node  # O head agora é o novo nó
+        else:
+            previous.next = new_node
+        if following is None:
+            self.tail = new_node  # O novo nó é o último
+        if self.doubly:
+            new_node.prev = previous
+            if following is not None:
+                following.prev = new_node
+        
+        if self.index is not None:
+            self.index.setdefault(data, []).append(new_node)
+            self.positions.insert(new_node, previous)
         self.size += 1  # Incrementa o contador
+        return new_node
+    
+    def insert_at_beginning(self, data):
+        '''Insere um novo nó no início da lista e o retorna - O(1)'''
+        return self._link_after(None, data)
     
     def insert_at_end(self, data):
-        '''Insere um novo nó no final da lista - O(n)'''
-        new_node = Node(data)  # Cria um novo nó
-        
-        # Se a lista estiver vazia, o novo nó se torna o head
-        if self.is_empty():
-            self.head = new_node
-        else:
-            # Percorre a lista até o último nó
-            current = self.head
-            while current.next:
-                current = current.next
-            # Faz o último nó apontar para o novo nó
-            current.next = new_node
+        '''Insere um novo nó no final da lista e o retorna - O(1), usando tail'''
+        return self._link_after(self.tail, data)
+    
+    def insert_after_node(self, node, data):
+        '''Insere um novo nó após o nó informado (referência retornada por uma inserção) - O(1)'''
+        return self._link_after(node, data)
+    
+    def _find(self, key):
+        '''
+        Retorna o primeiro nó com valor igual a key, ou None.
+        O(1) com índice (mais O(k log n) se houver k nós com o mesmo valor); O(n) sem índice.
+        '''
+        if self.index is not None:
+            nodes = self.index.get(key)
+            if not nodes:
+                return None
+            if len(nodes) == 1:
+                return nodes[0]
+            return min(nodes, key=self.positions.rank)
         
-        self.size += 1  # Incrementa o contador
+        current = self.head
+        while current and current.data != key:
+            current = current.next
+        return current
     
     def insert_after(self, prev_data, data):
-        '''Insere um novo nó após o nó que contém prev_data - O(n)'''
+        '''
+        Insere um novo nó após o nó que contém prev_data e retorna o novo nó
+        (ou False se prev_data não existir) - O(n), ou O(1) com índice
+        '''
         # Verifica se a lista está vazia
         if self.is_empty():
             print("Lista vazia, não é possível inserir após um elemento")
             return False
         
         # Procura o nó contendo prev_data
-        current = self.head
-        while current and current.data != prev_data:
-            current = current.next
+        current = self._find(prev_data)
         
         # Se não encontrou o nó
         if not current:
@@ -65,33 +206,68 @@ class LinkedList:
             return False
         
         # Cria o novo nó e o insere após o nó encontrado
-        new_node = Node(data)
-        new_node.next = current.next
-        current.next = new_node
+        return self._link_after(current, data)
+    
+    def _predecessor(self, node):
+        '''Retorna o nó anterior a node - O(1) duplamente encadeada, O(n) simples'''
+        if self.doubly:
+            return node.prev
+        previous = None
+        current = self.head
+        while current is not node:
+            if current is None:
+                raise ValueError("node not in list")
+            previous = current
+            current = current.next
+        return previous
+    
+    def remove_node(self, node):
+        '''
+        Remove o nó informado (referência retornada por uma inserção) e retorna o seu dado.
+        O(1) em lista duplamente encadeada; O(n) em lista simples (busca do anterior).
+        Na lista simples, lança ValueError se o nó não pertencer à lista.
+        '''
+        previous = self._predecessor(node)
+        following = node.next
+        if previous is None:
+            self.head = following
+        else:
+            previous.next = following
+        if following is None:
+            self.tail = previous
+        elif self.doubly:
+            following.prev = previous
         
-        self.size += 1  # Incrementa o contador
-        return True
+        data = node.data
+        if self.index is not None:
+            nodes = self.index[data]
+            if len(nodes) == 1:
+                del self.index[data]
+            else:
+                nodes.remove(node)
+            self.positions.remove(node)
+        self.size -= 1
+        self._release(node)
+        return data
+    
+    def pop_back(self):
+        '''
+        Remove e retorna o último elemento da lista.
+        O(1) em lista duplamente encadeada; O(n) em lista simples.
+        '''
+        if self.is_empty():
+            raise IndexError("Pop from an empty list")
+        return self.remove_node(self.tail)
     
     def delete_node(self, key):
-        '''Remove o primeiro nó com valor igual a key - O(n)'''
+        '''Remove o primeiro nó com valor igual a key - O(n), ou O(1) com índice'''
         # Verifica se a lista está vazia
         if self.is_empty():
             print("Lista vazia, não há o que remover")
             return False
         
-        # Caso especial: remover o head
-        if self.head.data == key:
-            self.head = self.head.next
-            self.size -= 1
-            return True
-        
-        # Procura o nó a ser removido, mantendo referência ao anterior
-        previous = self.head
-        current = self.head.next
-        
-        while current and current.data != key:
-            previous = current
-            current = current.next
+        # Procura o nó a ser removido
+        current = self._find(key)
         
         # Se não encontrou o nó
         if not current:
@@ -99,12 +275,20 @@ class LinkedList:
             return False
         
         # Remove o nó (faz o anterior apontar para o próximo do atual)
-        previous.next = current.next
-        self.size -= 1
+        self.remove_node(current)
         return True
     
+    def _release(self, node):
+        '''Devolve um nó removido à reserva, se houver uma'''
+        if self.pool is not None:
+            self.pool.release(node)
+    
     def search(self, key):
-        '''Busca um elemento na lista - O(n)'''
+        '''Busca um elemento na lista - O(n), ou O(log n) com índice (estatística de ordem)'''
+        if self.index is not None:
+            node = self._find(key)
+            return -1 if node is None else self.positions.rank(node)
+        
         current = self.head
         position = 0
         
@@ -116,20 +300,46 @@ class LinkedList:
         
         return -1  # Retorna -1 se o elemento não foi encontrado
     
+    def __len__(self):
+        return self.size
+    
+    def __iter__(self):
+        '''Gerador que percorre os elementos do início ao fim - O(1) por elemento, sem memória extra'''
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
+    
+    def __reversed__(self):
+        '''
+        Percorre os elementos do fim para o início: segue as referências prev a partir
+        de tail em lista duplamente encadeada; em lista simples, guarda os elementos
+        em uma lista (O(n) de memória)
+        '''
+        if not self.doubly:
+            elements = list(self)
+            elements.reverse()
+            yield from elements
+            return
+        current = self.tail
+        while current:
+            yield current.data
+            current = current.prev
+    
+    def view(self, start=0, stop=None):
+        '''Visão preguiçosa dos elementos entre as posições start e stop, como islice'''
+        return islice(self, start, stop)
+    
+    def __repr__(self):
+        return f"LinkedList(tamanho={self.size}, itens={bounded_str(self, self.size)})"
+    
     def print_list(self):
-        '''Imprime todos os elementos da lista - O(n)'''
+        '''Imprime todos os elementos da lista, em blocos, sem montar a string inteira - O(n)'''
         if self.is_empty():
             print("Lista vazia")
             return
         
-        current = self.head
-        elements = []
-        
-        while current:
-            elements.append(str(current.data))
-            current = current.next
-        
-        print(" -> ".join(elements))
+        print_joined(self)
     
     def get_size(self):
         '''Retorna o tamanho da lista - O(1)'''
@@ -175,6 +385,79 @@ def main():
     
     print("\nTentando remover um elemento que não existe:")
     linked_list.delete_node(10)
+    
+    print("\nLista com reserva de nós (NodePool):")
+    pool = NodePool(capacity=8)
+    pooled_list = LinkedList(pool)
+    for value in range(4):
+        pooled_list.insert_at_end(value)
+    pooled_list.delete_node(0)
+    pooled_list.delete_node(1)
+    pooled_list.insert_at_beginning(10)  # Reaproveita um dos nós removidos
+    pooled_list.print_list()
+    print(pool)
+    
+    print("\nLista duplamente encadeada com referências para os nós:")
+    doubly_list = LinkedList(doubly=True)
+    first = doubly_list.insert_at_end('A')
+    middle = doubly_list.insert_after_node(first, 'B')
+    doubly_list.insert_at_end('C')
+    doubly_list.print_list()
+    print(f"Removendo o nó de 'B' pela referência: {doubly_list.remove_node(middle)}")
+    print(f"pop_back(): {doubly_list.pop_back()}")
+    doubly_list.print_list()
+    
+    print("\nLista indexada por valor (registro ordenado):")
+    registry = LinkedList(indexed=True)
+    for name in ("ana", "bia", "caio", "davi"):
+        registry.insert_at_end(name)
+    registry.insert_after("bia", "beto")
+    registry.print_list()
+    print(f"Posição de 'caio': {registry.search('caio')}")
+    registry.delete_node("ana")
+    print(f"Após remover 'ana', posição de 'caio': {registry.search('caio')}")
+    
+    print("\nPercorrendo a lista sem cópias:")
+    print(f"Do início ao fim: {list(registry)}, do fim ao início: {list(reversed(registry))}")
+    print(f"view(1, 3): {list(registry.view(1, 3))}")
+    large_list = LinkedList()
+    for i in range(100000):
+        large_list.insert_at_end(i)
+    print(f"repr de uma lista com {len(large_list)} elementos: {large_list!r}")
+
+# Comparação de desempenho
+def benchmark(sizes=(10000, 100000, 1000000)):
+    '''
+    Mede o custo por elemento de construir a lista com insert_at_end (linear
+    graças ao tail) e o custo de search com e sem índice.
+    '''
+    print("\n=== Construção com insert_at_end ===\n")
+    for n in sizes:
+        line = f"{n:>8} elementos:"
+        for label, options in (("simples", {}), ("dupla", {"doubly": True}), ("indexada", {"indexed": True})):
+            linked_list = LinkedList(**options)
+            start = time.perf_counter()
+            for i in range(n):
+                linked_list.insert_at_end(i)
+            elapsed = time.perf_counter() - start
+            line += f"  {label} {elapsed / n * 1e9:6.0f} ns/elemento"
+        print(line)
+    
+    n = sizes[-1]
+    print(f"\n=== search em uma lista de {n} elementos ===\n")
+    for label, options in (("sem índice", {}), ("com índice", {"indexed": True})):
+        linked_list = LinkedList(**options)
+        for i in range(n):
+            linked_list.insert_at_end(i)
+        keys = range(n // 2, n, n // 20)
+        start = time.perf_counter()
+        for key in keys:
+            linked_list.search(key)
+        elapsed = time.perf_counter() - start
+        print(f"{label}: {elapsed / len(keys) * 1e6:10.1f} us por busca")
 
 if __name__ == "__main__":
-    main()
+    if "--benchmark" in sys.argv:
+        benchmark()
+    else:
+        main()
@@ -0,0 +1,334 @@
+'''
+Implementação de Lista Encadeada Ordenada com Skip List em Python
+
+Este arquivo implementa uma versão ordenada da LinkedList de lista_encadeada.py
+construída como uma skip list: além do encadeamento comum (nível 0), cada nó
+participa, com probabilidade P, de um nível a mais de "atalhos" que pulam vários
+nós. A busca desce pelos níveis, do mais alto ao mais baixo, e custa O(log n)
+esperado, assim como a inserção e a remoção. Cada atalho também guarda quantos nós
+ele pula (largura), o que permite calcular a posição de um elemento (rank) e achar
+o elemento de uma posição (select) em O(log n).
+
+Autores: Alef Khatab
+'''
+
+import bisect
+from itertools import islice
+from random import random, randrange
+import sys
+import time
+
+# pool_de_nos fica em Conceitos-Fundamentais/Alocacao-Dinamica (execute com executar.py)
+from pool_de_nos import bounded_str, print_joined
+
+class SkipNode:
+    '''Nó de uma skip list: o dado, o próximo nó de cada nível e a largura de cada atalho'''
+    __slots__ = ("data", "next", "width")
+    
+    def __init__(self, data, level):
+        self.data = data  # Dado armazenado no nó
+        self.next = [None] * level  # next[i] = próximo nó no nível i
+        self.width = [0] * level  # width[i] = nós percorridos no nível 0 ao seguir next[i]
+
+class SortedLinkedList:
+    '''
+    Lista encadeada mantida em ordem crescente (skip list indexável).
+    Elementos repetidos são permitidos e ficam após os iguais já inseridos.
+    Os elementos precisam ser comparáveis entre si com <.
+    '''
+    MAX_LEVEL = 32  # Suficiente para 4^32 elementos com P = 0.25
+    P = 0.25  # Probabilidade de um nó subir mais um nível
+    
+    def __init__(self):
+        self.head = SkipNode(None, self.MAX_LEVEL)  # Sentinela antes do primeiro elemento
+        self.level = 0  # Número de níveis em uso
+        self.size = 0  # Contador de elementos
+    
+    @classmethod
+    def from_sorted(cls, values):
+        '''
+        Constrói a lista a partir de valores já em ordem crescente, sem buscas
+        Tempo: O(n)
+        '''
+        sorted_list = cls()
+        last = [sorted_list.head] * cls.MAX_LEVEL  # Último nó de cada nível
+        last_position = [0] * cls.MAX_LEVEL  # Posição desse nó (a sentinela está em 0)
+        position = 0
+        previous = None
+        for value in values:
+            if position and value < previous:
+                raise ValueError("Values must be in ascending order")
+            previous = value
+            position += 1
+            level = sorted_list._random_level()
+            node = SkipNode(value, level)
+            for i in range(level):
+                last[i].next[i] = node
+                last[i].width[i] = position - last_position[i]
+                last[i] = node
+                last_position[i] = position
+            if level > sorted_list.level:
+                sorted_list.level = level
+        
+        # Atalhos que terminam no fim da lista
+        for i in range(sorted_list.level):
+            last[i].width[i] = position + 1 - last_position[i]
+        sorted_list.size = position
+        return sorted_list
+    
+    def is_empty(self):
+        '''Verifica se a lista está vazia'''
+        return self.size == 0
+    
+    def _random_level(self):
+        '''Sorteia o número de níveis de um novo nó (distribuição geométrica)'''
+        level = 1
+        while level < self.MAX_LEVEL and random() < self.P:
+            level += 1
+        return level
+    
+    def insert(self, data):
+        '''
+        Insere um elemento na sua posição ordenada e retorna o novo nó
+        Tempo: O(log n) esperado
+        '''
+        update = [None] * self.MAX_LEVEL  # Último nó antes da posição, em cada nível
+        steps = [0] * self.MAX_LEVEL  # Nós percorridos no nível 0 em cada nível
+        node = self.head
+        for i in reversed(range(self.level)):
+            while (following := node.next[i]) is not None and not data < following.data:
+                steps[i] += node.width[i]
+                node = following
+            update[i] = node
+        
+        level = self._random_level()
+        if level > self.level:
+            # Níveis novos: o atalho da sentinela ia até o fim da lista
+            for i in range(self.level, level):
+                update[i] = self.head
+                self.head.width[i] = self.size + 1
+            self.level = level
+        
+        new_node = SkipNode(data, level)
+        distance = 0  # Nós entre update[i] e o novo nó
+        for i in range(level):
+            previous = update[i]
+            new_node.next[i] = previous.next[i]
+            previous.next[i] = new_node
+            new_node.width[i] = previous.width[i] - distance
+            previous.width[i] = distance + 1
+            distance += steps[i]
+        for i in range(level, self.level):
+            update[i].width[i] += 1  # Atalhos que passam por cima do novo nó
+        
+        self.size += 1
+        return new_node
+    
+    def _predecessors(self, key):
+        '''
+        Retorna, para cada nível, o último nó com dado menor que key, e o número
+        de elementos menores que key
+        '''
+        update = [None] * self.level
+        position = 0
+        node = self.head
+        for i in reversed(range(self.level)):
+            while (following := node.next[i]) is not None and following.data < key:
+                position += node.width[i]
+                node = following
+            update[i] = node
+        return update, position
+    
+    def delete_node(self, key):
+        '''
+        Remove o primeiro elemento igual a key
+        Tempo: O(log n) esperado
+        '''
+        # Verifica se a lista está vazia
+        if self.is_empty():
+            print("Lista vazia, não há o que remover")
+            return False
+        
+        update, _ = self._predecessors(key)
+        target = update[0].next[0]
+        
+        # Se não encontrou o elemento
+        if target is None or target.data != key:
+            print(f"Elemento {key} não encontrado na lista")
+            return False
+        
+        for i in range(self.level):
+            if update[i].next[i] is target:
+                update[i].next[i] = target.next[i]
+                update[i].width[i] += target.width[i] - 1
+            else:
+                update[i].width[i] -= 1
+        while self.level > 0 and self.head.next[self.level - 1] is None:
+            self.level -= 1  # Descarta níveis que ficaram vazios
+        self.size -= 1
+        return True
+    
+    def rank(self, key):
+        '''
+        Retorna o número de elementos menores que key
+        Tempo: O(log n) esperado
+        '''
+        return self._predecessors(key)[1]
+    
+    def search(self, key):
+        '''
+        Busca um elemento e retorna a posição da sua primeira ocorrência, ou -1
+        Tempo: O(log n) esperado
+        '''
+        update, position = self._predecessors(key)
+        if not update:
+            return -1
+        candidate = update[0].next[0]
+        if candidate is not None and candidate.data == key:
+            return position
+        return -1
+    
+    def select(self, index):
+        '''
+        Retorna o elemento da posição index (a partir de 0)
+        Tempo: O(log n) esperado
+        '''
+        if index < 0 or index >= self.size:
+            raise IndexError("Índice fora dos limites!")
+        return self._node_at(index).data
+    
+    def _node_at(self, index):
+        '''Retorna o nó da posição index, descendo pelos atalhos - O(log n) esperado'''
+        remaining = index + 1  # Nós a percorrer a partir da sentinela
+        node = self.head
+        for i in reversed(range(self.level)):
+            while node.next[i] is not None and node.width[i] <= remaining:
+                remaining -= node.width[i]
+                node = node.next[i]
+        return node
+    
+    def range(self, lo, hi):
+        '''
+        Percorre, em ordem, os elementos x com lo <= x < hi
+        Tempo: O(log n + k) esperado para k elementos
+        '''
+        if self.is_empty():
+            return
+        update, _ = self._predecessors(lo)
+        node = update[0].next[0]
+        while node is not None and node.data < hi:
+            yield node.data
+            node = node.next[0]
+    
+    def __len__(self):
+        return self.size
+    
+    def __iter__(self):
+        '''Percorre os elementos em ordem crescente pelo nível 0 - O(1) por elemento'''
+        return self._iter_from(self.head.next[0])
+    
+    def view(self, start=0, stop=None):
+        '''
+        Visão preguiçosa dos elementos entre as posições start e stop.
+        O primeiro elemento é localizado pelos atalhos, como em select.
+        Tempo: O(log n) esperado para criar a visão, O(1) por elemento
+        '''
+        if start < 0 or (stop is not None and stop < 0):
+            raise ValueError("Indices for view() must be non-negative")
+        if start >= self.size:
+            return iter(())
+        return islice(self._iter_from(self._node_at(start)), None if stop is None else max(stop - start, 0))
+    
+    @staticmethod
+    def _iter_from(node):
+        '''Gerador dos elementos a partir de node (inclusive), pelo nível 0'''
+        while node:
+            yield node.data
+            node = node.next[0]
+    
+    def __repr__(self):
+        return f"SortedLinkedList(tamanho={self.size}, itens={bounded_str(self, self.size)})"
+    
+    def print_list(self):
+        '''Imprime todos os elementos da lista, em blocos, sem montar a string inteira - O(n)'''
+        if self.is_empty():
+            print("Lista vazia")
+            return
+        
+        print_joined(self)
+    
+    def get_size(self):
+        '''Retorna o tamanho da lista - O(1)'''
+        return self.size
+
+# Demonstração de uso
+def main():
+    print("\n=== Lista Encadeada Ordenada (Skip List) - Demonstração ===\n")
+    
+    sorted_list = SortedLinkedList()
+    
+    print("Inserindo 42, 7, 19, 3, 25, 7 (a lista se mantém ordenada):")
+    for value in (42, 7, 19, 3, 25, 7):
+        sorted_list.insert(value)
+    sorted_list.print_list()  # Deve imprimir: 3 -> 7 -> 7 -> 19 -> 25 -> 42
+    
+    print("\nBuscando elementos:")
+    print(f"Posição do elemento 19: {sorted_list.search(19)}")
+    print(f"Posição do elemento 20: {sorted_list.search(20)}")
+    
+    print("\nConsultas de ordem:")
+    print(f"Elementos menores que 20 (rank): {sorted_list.rank(20)}")
+    print(f"Elemento da posição 4 (select): {sorted_list.select(4)}")
+    print(f"Elementos no intervalo [7, 25): {list(sorted_list.range(7, 25))}")
+    
+    print("\nRemovendo 7 e 42:")
+    sorted_list.delete_node(7)
+    sorted_list.delete_node(42)
+    sorted_list.print_list()
+    print(f"Tamanho da lista: {sorted_list.get_size()}")
+    
+    print("\nTentando remover um elemento que não existe:")
+    sorted_list.delete_node(100)
+    
+    print("\nConstrução linear a partir de valores ordenados:")
+    squares = SortedLinkedList.from_sorted(i * i for i in range(1, 11))
+    squares.print_list()
+    print(f"Quadrados em [10, 50): {list(squares.range(10, 50))}")
+
+def benchmark(sizes=(10000, 1000000, 10000000), inserts=1000):
+    '''
+    Compara o custo de inserções ordenadas em uma SortedLinkedList e com
+    bisect.insort em uma lista Python, ambas já contendo n elementos.
+    '''
+    print(f"\n=== {inserts} inserções aleatórias em uma estrutura com n elementos ===\n")
+    for n in sizes:
+        values = [randrange(2 * n) * 2 + 1 for _ in range(inserts)]  # Ímpares entre os pares
+        
+        plain = list(range(0, 2 * n, 2))
+        start = time.perf_counter()
+        for value in values:
+            bisect.insort(plain, value)
+        bisect_time = time.perf_counter() - start
+        del plain
+        
+        sorted_list = SortedLinkedList.from_sorted(range(0, 2 * n, 2))
+        start = time.perf_counter()
+        for value in values:
+            sorted_list.insert(value)
+        skip_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        for value in values:
+            sorted_list.rank(value)
+        rank_time = time.perf_counter() - start
+        del sorted_list
+        
+        print(f"n = {n:>8}: bisect.insort {bisect_time / inserts * 1e6:8.1f} us, "
+              f"SortedLinkedList.insert {skip_time / inserts * 1e6:6.1f} us, "
+              f"rank {rank_time / inserts * 1e6:6.1f} us")
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark()
+    else:
+        main()
@@ -1,12 +1,27 @@
 '''
 Implementação de Pilha em Python
 
-Este arquivo demonstra duas implementações de pilhas: uma baseada em lista Python
-e outra baseada em uma lista encadeada.
+Este arquivo demonstra três implementações de pilhas: uma baseada em lista Python,
+outra baseada em uma lista encadeada e uma pilha tipada baseada em array.array.
 
 Autores: Alef Khatab e Kaynã Barbosa de Miranda
 '''
 
+from array import array
+from collections import namedtuple
+import copy
+import decimal
+import io
+from itertools import islice
+import multiprocessing
+import re
+import sys
+import time
+import tracemalloc
+
+# pool_de_nos fica em Conceitos-Fundamentais/Alocacao-Dinamica (execute com executar.py)
+from pool_de_nos import Node, NodePool, bounded_str
+
 # Implementação 1: Pilha usando lista Python
 class Stack:
     '''
@@ -55,30 +70,51 @@ class Stack:
         '''
         return len(self.items)
     
+    def __len__(self):
+        return len(self.items)
+    
+    def __iter__(self):
+        '''
+        Percorre os itens do topo para a base (ordem de desempilhamento), sem removê-los
+        Tempo: O(1) por item, sem memória extra
+        '''
+        return reversed(self.items)
+    
+    def __reversed__(self):
+        '''
+        Percorre os itens da base para o topo
+        '''
+        return iter(self.items)
+    
+    def view(self, start=0, stop=None):
+        '''
+        Visão preguiçosa dos itens entre as posições start e stop, contadas a partir do topo
+        '''
+        return islice(reversed(self.items), start, stop)
+    
     def __str__(self):
         '''
-        Retorna uma representação em string da pilha
+        Retorna uma representação em string da pilha (a base à esquerda),
+        com no máximo REPR_LIMIT itens a partir do topo
         '''
-        return str(self.items)
-
-# Implementação 2: Pilha usando lista encadeada
-class Node:
-    '''
-    Classe que representa um nó na implementação de lista encadeada
-    '''
-    def __init__(self, data):
-        self.data = data  # Dado armazenado no nó
-        self.next = None  # Referência para o próximo nó
+        return bounded_str(self, len(self), reverse=True)
+    
+    def __repr__(self):
+        return f"Stack(tamanho={len(self)}, itens={self})"
 
+# Implementação 2: Pilha usando lista encadeada (nós de pool_de_nos.Node)
 class LinkedStack:
     '''
     Implementação de uma pilha usando lista encadeada.
     Esta implementação é útil quando o tamanho da pilha é imprevisível
     ou quando precisa evitar realocar arrays.
+    Com uma NodePool, os nós removidos são reaproveitados nas próximas inserções.
     '''
-    def __init__(self):
+    def __init__(self, pool=None):
         self.top = None  # Referência para o topo da pilha
         self.size_count = 0  # Contador de elementos
+        self.pool = pool  # Reserva de nós opcional
+        self.new_node = Node if pool is None else pool.acquire  # Cria ou reaproveita um nó
     
     def is_empty(self):
         '''
@@ -92,7 +128,7 @@ class LinkedStack:
         Adiciona um item ao topo da pilha
         Tempo: O(1)
         '''
-        new_node = Node(item)  # Cria um novo nó
+        new_node = self.new_node(item)  # Cria (ou reaproveita) um nó
         new_node.next = self.top  # O novo nó aponta para o antigo topo
         self.top = new_node  # O topo agora é o novo nó
         self.size_count += 1  # Incrementa o contador
@@ -105,9 +141,12 @@ class LinkedStack:
         if self.is_empty():
             raise IndexError("Pop from an empty stack")
         
-        item = self.top.data  # Armazena o dado do topo
-        self.top = self.top.next  # O topo passa a ser o próximo nó
+        node = self.top
+        item = node.data  # Armazena o dado do topo
+        self.top = node.next  # O topo passa a ser o próximo nó
         self.size_count -= 1  # Decrementa o contador
+        if self.pool is not None:
+            self.pool.release(node)  # Devolve o nó à reserva
         return item
     
     def peek(self):
@@ -126,26 +165,386 @@ class LinkedStack:
         '''
         return self.size_count
     
+    def __len__(self):
+        return self.size_count
+    
+    def __iter__(self):
+        '''
+        Gerador que percorre os itens do topo para a base, seguindo os nós
+        Tempo: O(1) por item, sem memória extra
+        '''
+        current = self.top
+        while current:
+            yield current.data
+            current = current.next
+    
+    def __reversed__(self):
+        '''
+        Percorre os itens da base para o topo.
+        Os nós só apontam para baixo, então os itens são guardados em uma lista: O(n) de memória.
+        '''
+        items = list(self)
+        items.reverse()
+        return iter(items)
+    
+    def view(self, start=0, stop=None):
+        '''
+        Visão preguiçosa dos itens entre as posições start e stop, contadas a partir do topo
+        '''
+        return islice(self, start, stop)
+    
     def __str__(self):
         '''
-        Retorna uma representação em string da pilha
+        Retorna uma representação em string da pilha (a base à esquerda),
+        com no máximo REPR_LIMIT itens a partir do topo
+        '''
+        return bounded_str(self, self.size_count, reverse=True)
+    
+    def __repr__(self):
+        return f"{type(self).__name__}(tamanho={self.size_count}, itens={self})"
+
+# Implementação 3: Pilha tipada usando array.array
+class ArrayStack:
+    '''
+    Implementação de uma pilha tipada usando array.array.
+    Os valores ficam lado a lado na memória, sem um objeto Python por item, e as
+    operações em lote são executadas em código C. typecode segue os códigos do
+    módulo array ('q' = inteiro de 8 bytes, 'B' = byte sem sinal, 'd' = float, ...).
+    '''
+    def __init__(self, typecode='q'):
+        self.items = array(typecode)  # Array tipado vazio para armazenar elementos
+    
+    def is_empty(self):
+        '''
+        Verifica se a pilha está vazia
+        Tempo: O(1)
+        '''
+        return len(self.items) == 0
+    
+    def push(self, item):
+        '''
+        Adiciona um item ao topo da pilha
+        Tempo: O(1) amortizado
+        '''
+        self.items.append(item)
+    
+    def push_many(self, items):
+        '''
+        Adiciona vários itens de uma vez; o último item fica no topo
+        Tempo: O(k) amortizado
+        '''
+        self.items.extend(items)
+    
+    def pop(self):
+        '''
+        Remove e retorna o item do topo da pilha
+        Tempo: O(1) amortizado
         '''
         if self.is_empty():
-            return "[]"
-        
+            raise IndexError("Pop from an empty stack")
+        return self.items.pop()
+    
+    def pop_many(self, n):
+        '''
+        Remove os n itens do topo e os retorna em um array, na ordem em que
+        seriam desempilhados (o topo primeiro)
+        Tempo: O(k)
+        '''
+        if n < 0:
+            raise ValueError("Number of items to pop must be non-negative")
+        if n > len(self.items):
+            raise IndexError("Pop from an empty stack")
+        if n == 0:
+            return array(self.items.typecode)
+        popped = self.items[-n:]
+        del self.items[-n:]
+        popped.reverse()
+        return popped
+    
+    def drain_reversed(self):
+        '''
+        Esvazia a pilha e retorna uma memoryview com todos os itens na ordem de
+        desempilhamento (do topo para a base), sem copiá-los
+        Tempo: O(1)
+        '''
+        items, self.items = self.items, array(self.items.typecode)
+        return memoryview(items)[::-1]
+    
+    def peek(self):
+        '''
+        Retorna o item do topo da pilha sem removê-lo
+        Tempo: O(1)
+        '''
+        if self.is_empty():
+            raise IndexError("Peek from an empty stack")
+        return self.items[-1]
+    
+    def size(self):
+        '''
+        Retorna o número de itens na pilha
+        Tempo: O(1)
+        '''
+        return len(self.items)
+    
+    def __len__(self):
+        return len(self.items)
+    
+    def __iter__(self):
+        '''
+        Percorre os itens do topo para a base (ordem de desempilhamento), sem removê-los
+        '''
+        return reversed(self.items)
+    
+    def __reversed__(self):
+        '''
+        Percorre os itens da base para o topo
+        '''
+        return iter(self.items)
+    
+    def view(self, start=0, stop=None):
+        '''
+        Visão preguiçosa dos itens entre as posições start e stop, contadas a partir do topo
+        '''
+        return islice(reversed(self.items), start, stop)
+    
+    def __str__(self):
+        '''
+        Retorna uma representação em string da pilha (a base à esquerda),
+        com no máximo REPR_LIMIT itens a partir do topo
+        '''
+        return bounded_str(self, len(self.items), reverse=True)
+    
+    def __repr__(self):
+        return f"ArrayStack(tamanho={len(self.items)}, itens={self})"
+
+# Implementação 4: Pilha persistente (imutável) com compartilhamento estrutural
+class PersistentStack:
+    '''
+    Implementação de uma pilha imutável sobre a mesma cadeia de nós da LinkedStack.
+    push e pop não alteram a pilha: retornam uma nova versão que compartilha com a
+    anterior todos os nós abaixo do topo. Cada versão continua válida e funciona
+    como um snapshot em O(1) de tempo e memória (útil para desfazer e backtracking).
+    Os nós nunca são modificados depois de criados, por isso não usam NodePool.
+    '''
+    __slots__ = ("top", "size_count")
+    
+    def __init__(self, top=None, size_count=0):
+        self.top = top  # Nó do topo (compartilhado com outras versões)
+        self.size_count = size_count  # Número de itens desta versão
+    
+    @classmethod
+    def from_iterable(cls, items):
+        '''
+        Cria uma pilha empilhando os itens em ordem (o último fica no topo)
+        Tempo: O(k)
+        '''
+        stack = cls()
+        for item in items:
+            stack = stack.push(item)
+        return stack
+    
+    def is_empty(self):
+        '''
+        Verifica se a pilha está vazia
+        Tempo: O(1)
+        '''
+        return self.top is None
+    
+    def push(self, item):
+        '''
+        Retorna uma nova pilha com item no topo; esta pilha não muda
+        Tempo: O(1), um nó novo
+        '''
+        node = Node(item)
+        node.next = self.top  # O restante da pilha é compartilhado, não copiado
+        return PersistentStack(node, self.size_count + 1)
+    
+    def pop(self):
+        '''
+        Retorna uma nova pilha sem o item do topo (use peek para lê-lo); esta pilha não muda
+        Tempo: O(1), sem alocar nós
+        '''
+        if self.is_empty():
+            raise IndexError("Pop from an empty stack")
+        return PersistentStack(self.top.next, self.size_count - 1)
+    
+    def peek(self):
+        '''
+        Retorna o item do topo da pilha
+        Tempo: O(1)
+        '''
+        if self.is_empty():
+            raise IndexError("Peek from an empty stack")
+        return self.top.data
+    
+    def size(self):
+        '''
+        Retorna o número de itens na pilha
+        Tempo: O(1)
+        '''
+        return self.size_count
+    
+    def __len__(self):
+        return self.size_count
+    
+    def __iter__(self):
+        '''
+        Gerador que percorre os itens do topo para a base
+        Tempo: O(1) por item, sem memória extra
+        '''
         current = self.top
-        items = []
-        
-        # Percorre a lista encadeada e adiciona elementos em uma lista
         while current:
-            items.append(current.data)
+            yield current.data
             current = current.next
-        
-        # Inverte a lista para mostrar o fundo da pilha à esquerda
-        items.reverse()  
-        return str(items)
+    
+    def __reversed__(self):
+        '''
+        Percorre os itens da base para o topo (guarda os itens em uma lista: O(n) de memória)
+        '''
+        items = list(self)
+        items.reverse()
+        return iter(items)
+    
+    def view(self, start=0, stop=None):
+        '''
+        Visão preguiçosa dos itens entre as posições start e stop, contadas a partir do topo
+        '''
+        return islice(self, start, stop)
+    
+    def __str__(self):
+        '''
+        Retorna uma representação em string da pilha (a base à esquerda),
+        com no máximo REPR_LIMIT itens a partir do topo
+        '''
+        return bounded_str(self, self.size_count, reverse=True)
+    
+    def __repr__(self):
+        return f"PersistentStack(tamanho={self.size_count}, itens={self})"
 
 # Exemplo de caso de uso: Verificador de parênteses balanceados
+CLOSING = {'(': ')', '[': ']', '{': '}'}  # Fechamento esperado para cada abertura
+# Classe de caracteres dos símbolos: a expressão regular pula em bloco, em código C,
+# todos os outros caracteres
+TEXT_PATTERN = re.compile(r"[()\[\]{}]")
+BYTES_PATTERN = re.compile(TEXT_PATTERN.pattern.encode())
+
+# Primeiro erro encontrado: posição (em caracteres ou bytes), linha (a partir de 1),
+# símbolo encontrado (None no fim da entrada) e fechamento esperado (None se nada estava aberto)
+Mismatch = namedtuple("Mismatch", ["offset", "line", "found", "expected"])
+
+def _chunks(source, chunk_size):
+    '''
+    Divide a entrada em blocos, produzindo (bloco, posição inicial, linha inicial).
+    source pode ser uma string, bytes, um arquivo (texto ou binário) ou um iterador de blocos.
+    '''
+    if isinstance(source, (str, bytes)):
+        blocks = (source[i:i + chunk_size] for i in range(0, len(source), chunk_size))
+    elif hasattr(source, "read"):
+        blocks = iter(lambda: source.read(chunk_size), source.read(0))
+    else:
+        blocks = source
+    offset = 0
+    line = 1
+    for block in blocks:
+        yield block, offset, line
+        offset += len(block)
+        line += block.count(b"\n" if isinstance(block, bytes) else "\n")
+    yield None, offset, line  # Marca o fim da entrada
+
+def _summarize_chunk(args):
+    '''
+    Resume um bloco independentemente dos demais. Os pares que fecham dentro do
+    bloco são descartados, restando:
+    - os fechamentos sem par, no início, como (símbolo, posição, linha) globais;
+    - um eventual erro dentro do bloco (Mismatch);
+    - os fechamentos esperados pelas aberturas sem par, no final, como uma string.
+    '''
+    chunk, offset, line = args
+    if chunk is None:
+        return None, None, "", offset, line
+    if isinstance(chunk, bytes):
+        pattern, newline = BYTES_PATTERN, b"\n"
+        symbols = b"".join(pattern.findall(chunk)).decode("ascii")
+    else:
+        pattern, newline = TEXT_PATTERN, "\n"
+        symbols = "".join(pattern.findall(chunk))  # Só os símbolos, extraídos em C
+    
+    expected = []  # Pilha com o fechamento esperado por cada abertura sem par
+    unmatched = []  # Índices (em symbols) dos fechamentos sem par
+    error = None  # Índice do fechamento errado, se houver
+    for index, char in enumerate(symbols):
+        closing = CLOSING.get(char)
+        if closing is not None:
+            expected.append(closing)
+        elif not expected:
+            unmatched.append(index)
+        elif expected[-1] == char:
+            expected.pop()
+        else:
+            error = index
+            break
+    
+    # Posição e linha só são calculadas para os símbolos que podem ser relatados
+    wanted = unmatched + ([error] if error is not None else [])
+    located = []
+    if wanted:
+        last = 0
+        matches = pattern.finditer(chunk)
+        consumed = 0  # Símbolos já percorridos em matches
+        for index in wanted:
+            position = next(islice(matches, index - consumed, None)).start()
+            consumed = index + 1
+            line += chunk.count(newline, last, position)
+            last = position
+            located.append((symbols[index], offset + position, line))
+    closers = located[:len(unmatched)]
+    if error is not None:
+        char, position, error_line = located[-1]
+        error = Mismatch(position, error_line, char, expected[-1])
+    return closers, error, "".join(expected), None, None
+
+def _merge_summaries(summaries):
+    '''
+    Junta os resumos dos blocos, em ordem, usando uma pilha dos fechamentos esperados.
+    Retorna o primeiro Mismatch ou None se a entrada estiver balanceada.
+    '''
+    stack = Stack()
+    for closers, error, expected, end_offset, end_line in summaries:
+        if closers is None:
+            # Fim da entrada: qualquer abertura restante ficou sem fechamento
+            return None if stack.is_empty() else Mismatch(end_offset, end_line, None, stack.peek())
+        for char, offset, line in closers:
+            if stack.is_empty():
+                return Mismatch(offset, line, char, None)
+            if stack.peek() != char:
+                return Mismatch(offset, line, char, stack.peek())
+            stack.pop()
+        if error is not None:
+            return error
+        for char in expected:
+            stack.push(char)
+
+def check_balanced(source, chunk_size=1 << 20, workers=None):
+    '''
+    Verifica, em fluxo, se os parênteses, colchetes e chaves estão balanceados.
+    A entrada é lida em blocos de chunk_size (nunca inteira na memória); com
+    workers, os blocos são resumidos em paralelo por processos e os resumos são
+    juntados em ordem.
+    
+    Args:
+        source: Uma string, bytes, um arquivo aberto ou um iterador de blocos
+        chunk_size (int): Tamanho de cada bloco lido
+        workers (int): Número de processos para resumir os blocos (None = sequencial)
+    
+    Returns:
+        Mismatch: O primeiro erro (posição, linha, símbolo encontrado e esperado), ou None
+    '''
+    chunks = _chunks(source, chunk_size)
+    if not workers:
+        return _merge_summaries(map(_summarize_chunk, chunks))
+    with multiprocessing.Pool(workers) as pool:
+        return _merge_summaries(pool.imap(_summarize_chunk, chunks))
+
 def is_balanced(expression):
     '''
     Verifica se os parênteses, colchetes e chaves em uma expressão estão balanceados.
@@ -156,21 +555,121 @@ def is_balanced(expression):
     Returns:
         bool: True se os símbolos estão balanceados, False caso contrário
     '''
-    stack = Stack()
-    opening = "({["
-    closing = ")}]"
-    pairs = {')': '(', '}': '{', ']': '['}
+    return check_balanced(expression) is None
+
+# Exemplo de caso de uso: Conversor de bases
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+DIGIT_TABLE = bytes.maketrans(bytes(range(len(DIGITS))), DIGITS.encode())  # Valor do dígito -> caractere
+LEAF_DIGITS = 64  # Tamanho dos blocos convertidos pelo algoritmo clássico com pilha
+DECIMAL_LEAF_BITS = 3000  # Tamanho dos blocos convertidos diretamente para Decimal
+
+def _small_to_digits(n, base, width, stack):
+    '''
+    Algoritmo clássico: empilha os restos das divisões sucessivas pela base e
+    desempilha todos de uma vez. Retorna os valores dos dígitos, com zeros à
+    esquerda até completar width dígitos.
+    '''
+    while n > 0:
+        n, remainder = divmod(n, base)
+        stack.push(remainder)  # Empilha o resto (dígito menos significativo primeiro)
+    if width > stack.size():
+        stack.push_many(bytes(width - stack.size()))  # Zeros à esquerda ficam no topo
+    return bytes(stack.drain_reversed())  # Desempilha: o dígito mais significativo sai primeiro
+
+def _split_bits(n, bits, digits, pad, stack, chunks):
+    '''
+    Converte n, com até digits dígitos de bits bits cada, para uma base potência de 2.
+    As metades são separadas por deslocamento de bits, sem divisões.
+    '''
+    if digits <= LEAF_DIGITS:
+        chunks.append(_small_to_digits(n, 1 << bits, digits if pad else 0, stack))
+        return
+    low_digits = digits // 2
+    high = n >> (low_digits * bits)
+    if high or pad:
+        _split_bits(high, bits, digits - low_digits, pad, stack, chunks)
+        pad = True  # A metade inferior precisa de todos os seus dígitos
+    _split_bits(n & ((1 << (low_digits * bits)) - 1), bits, low_digits, pad, stack, chunks)
+
+def _split_powers(n, base, level, pad, powers, stack, chunks):
+    '''
+    Converte n < powers[level] ** 2 dividindo-o por powers[level] = base ** (LEAF_DIGITS * 2 ** level).
+    '''
+    if level < 0:
+        chunks.append(_small_to_digits(n, base, LEAF_DIGITS if pad else 0, stack))
+        return
+    if not pad and n < powers[level]:
+        _split_powers(n, base, level - 1, False, powers, stack, chunks)
+        return
+    high, low = divmod(n, powers[level])
+    _split_powers(high, base, level - 1, pad, powers, stack, chunks)
+    _split_powers(low, base, level - 1, True, powers, stack, chunks)
+
+def _to_decimal_string(n):
+    '''
+    Converte n para base 10 separando metades binárias (deslocamentos) e
+    recombinando-as com o módulo decimal, cuja multiplicação de números grandes é
+    quase linear. A conversão final de Decimal para string é linear.
+    '''
+    context = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN)
+    powers = {}  # Cache de 2 ** k em Decimal
+    
+    def convert(n, bits):
+        if bits <= DECIMAL_LEAF_BITS:
+            return decimal.Decimal(n)
+        low_bits = bits // 2
+        high = n >> low_bits
+        low = n - (high << low_bits)
+        if low_bits not in powers:
+            powers[low_bits] = context.power(2, low_bits)
+        return context.add(context.multiply(convert(high, bits - low_bits), powers[low_bits]),
+                           convert(low, low_bits))
+    
+    return str(convert(n, n.bit_length()))
+
+def to_base(n, base):
+    '''
+    Converte um inteiro para uma base entre 2 e 36 usando uma pilha.
     
-    for char in expression:
-        if char in opening:
-            stack.push(char)
-        elif char in closing:
-            if stack.is_empty() or stack.pop() != pairs[char]:
-                return False
+    Números com até LEAF_DIGITS dígitos usam diretamente o algoritmo clássico com
+    pilha. Números maiores são divididos recursivamente em metades, e a pilha só
+    converte blocos de LEAF_DIGITS dígitos:
+    - bases potência de 2: metades separadas por deslocamento de bits, O(n log n);
+    - base 10: metades recombinadas com o módulo decimal, quase linear;
+    - demais bases: divmod por potências da base (a divisão do CPython é quadrática,
+      mas executada em C).
+    
+    Args:
+        n (int): O número a ser convertido
+        base (int): A base de destino
     
-    return stack.is_empty()  # A pilha deve estar vazia se todos os símbolos estiverem balanceados
+    Returns:
+        str: A representação do número na base, com dígitos 0-9 e A-Z
+    '''
+    if not 2 <= base <= len(DIGITS):
+        raise ValueError(f"Base must be between 2 and {len(DIGITS)}")
+    if n < 0:
+        return "-" + to_base(-n, base)
+    if n == 0:
+        return "0"
+    
+    stack = ArrayStack('B')  # Pilha de valores de dígitos
+    if n < base ** LEAF_DIGITS:
+        chunks = [_small_to_digits(n, base, 0, stack)]
+    elif base == 10:
+        return _to_decimal_string(n)
+    elif base & (base - 1) == 0:
+        bits = base.bit_length() - 1
+        chunks = []
+        _split_bits(n, bits, -(-n.bit_length() // bits), False, stack, chunks)
+    else:
+        powers = [base ** LEAF_DIGITS]
+        while powers[-1] * powers[-1] <= n:
+            powers.append(powers[-1] * powers[-1])
+        chunks = []
+        _split_powers(n, base, len(powers) - 1, False, powers, stack, chunks)
+    return b"".join(chunks).translate(DIGIT_TABLE).decode("ascii")
 
-# Exemplo de caso de uso: Conversor de decimal para binário
 def decimal_to_binary(decimal_num):
     '''
     Converte um número decimal para binário usando uma pilha.
@@ -181,21 +680,7 @@ def decimal_to_binary(decimal_num):
     Returns:
         str: A representação binária do número
     '''
-    if decimal_num == 0:
-        return "0"
-    
-    stack = Stack()
-    
-    while decimal_num > 0:
-        remainder = decimal_num % 2  # Pega o resto da divisão por 2
-        stack.push(remainder)        # Empilha o resto
-        decimal_num //= 2            # Divide por 2 (divisão inteira)
-    
-    binary = ""
-    while not stack.is_empty():
-        binary += str(stack.pop())  # Desempilha e concatena os dígitos
-    
-    return binary
+    return to_base(decimal_num, 2)
 
 # Demonstração de uso
 def main():
@@ -239,6 +724,17 @@ def main():
     print(f"Removido: {linked_stack.pop()}")
     print(f"Pilha após remoções: {linked_stack}")
     
+    # Percurso preguiçoso e representação limitada
+    print("\n--- Percurso sem Cópias ---")
+    linked_stack.push('E')
+    print(f"Do topo para a base: {list(linked_stack)}, da base para o topo: {list(reversed(linked_stack))}")
+    large_stack = LinkedStack()
+    for i in range(100000):
+        large_stack.push(i)
+    print(f"Três itens abaixo do topo: {list(large_stack.view(1, 4))}")
+    print(f"Soma percorrendo a pilha: {sum(large_stack)}")
+    print(f"repr de uma pilha com {len(large_stack)} itens: {large_stack!r}")
+    
     # Demonstração do verificador de parênteses balanceados
     print("\n--- Verificador de Parênteses Balanceados ---")
     expressions = [
@@ -252,6 +748,10 @@ def main():
         result = is_balanced(expr)
         print(f"'{expr}' está balanceado? {result}")
     
+    # Verificação em fluxo, com a posição do primeiro erro
+    source = io.StringIO("def f(x):\n    return [x * (x + 1)}\n")
+    print(f"Erro em arquivo de código: {check_balanced(source, chunk_size=8)}")
+    
     # Demonstração do conversor decimal para binário
     print("\n--- Conversor Decimal para Binário ---")
     decimals = [10, 42, 255, 128, 0]
@@ -259,6 +759,176 @@ def main():
     for num in decimals:
         binary = decimal_to_binary(num)
         print(f"Decimal {num} em binário: {binary}")
+    
+    # Demonstração da pilha tipada
+    print("\n--- Pilha Tipada (array.array) ---")
+    array_stack = ArrayStack('q')
+    array_stack.push_many([1, 2, 3, 4, 5])
+    print(f"Pilha após push_many([1, 2, 3, 4, 5]): {array_stack}")
+    print(f"pop_many(2): {array_stack.pop_many(2).tolist()}")
+    print(f"drain_reversed(): {array_stack.drain_reversed().tolist()}")
+    print(f"Pilha vazia? {array_stack.is_empty()}")
+    
+    # Demonstração da pilha persistente
+    print("\n--- Pilha Persistente (imutável) ---")
+    empty = PersistentStack()
+    version_1 = empty.push('a').push('b')
+    version_2 = version_1.push('c')  # Compartilha os nós de 'a' e 'b' com version_1
+    version_3 = version_2.pop().push('d')  # Ramo alternativo a partir de version_1
+    print(f"v1: {version_1}, v2: {version_2}, v3: {version_3}, vazia: {empty}")
+    print(f"v2 e v3 compartilham o restante? {version_2.top.next is version_3.top.next}")
+    
+    # Histórico de desfazer: cada versão é um snapshot de O(1)
+    history = [PersistentStack()]
+    for action in ("abrir", "editar", "salvar", "fechar"):
+        history.append(history[-1].push(action))
+    history.pop()  # Desfaz "fechar"
+    print(f"Após desfazer: {history[-1]} (topo: {history[-1].peek()})")
+    
+    # Backtracking: caminhos de 3 passos com soma 4, cada ramo estende o caminho do pai
+    solutions = []
+    pending = [PersistentStack()]
+    while pending:
+        path = pending.pop()
+        if len(path) == 3:
+            if sum(path) == 4:
+                solutions.append(list(reversed(path)))
+            continue
+        for step in (0, 1, 2):
+            pending.append(path.push(step))
+    print(f"Caminhos de 3 passos (0, 1 ou 2) com soma 4: {sorted(solutions)}")
+    
+    # Demonstração do conversor de bases
+    print("\n--- Conversor de Bases ---")
+    for num, base in [(255, 16), (255, 8), (2024, 3), (-42, 2), (10 ** 30, 36)]:
+        print(f"{num} na base {base}: {to_base(num, base)}")
+
+# Comparação de desempenho
+def benchmark_pool(rounds=2000, batch=1000):
+    '''
+    Compara a LinkedStack com e sem reserva de nós em uma carga de muitas
+    inserções e remoções (churn): vazão e pico de memória medido com tracemalloc.
+    '''
+    print(f"\n=== LinkedStack: {rounds} rodadas de {batch} push + {batch} pop ===\n")
+    for label, pool in (("sem reserva", None), ("com reserva", NodePool(capacity=batch))):
+        stack = LinkedStack(pool)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for i in range(batch):
+                stack.push(i)
+            for _ in range(batch):
+                stack.pop()
+        elapsed = time.perf_counter() - start
+        
+        stack = LinkedStack(NodePool(capacity=batch) if pool is not None else None)
+        tracemalloc.start()
+        for _ in range(20):
+            for i in range(batch):
+                stack.push(i)
+            for _ in range(batch):
+                stack.pop()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{label}: {2 * rounds * batch / elapsed / 1e6:5.2f} M operações/s, "
+              f"pico de memória {peak / 1024:6.1f} KiB")
+        if pool is not None:
+            print(f"  {pool}")
+
+def benchmark_persistent(depth=20, history=2000):
+    '''
+    Compara a PersistentStack com cópias profundas (copy.deepcopy) de uma Stack em
+    uma busca com backtracking que explora 2^depth ramos, e mede a memória de um
+    histórico de desfazer com uma versão guardada por operação.
+    '''
+    print(f"\n=== Backtracking: {1 << depth} ramos de profundidade {depth} ===\n")
+    start = time.perf_counter()
+    leaves = 0
+    pending = [PersistentStack()]
+    while pending:
+        path = pending.pop()
+        if path.size_count == depth:
+            leaves += path.top.data
+            continue
+        pending.append(path.push(0))  # Cada ramo compartilha o caminho do pai
+        pending.append(path.push(1))
+    persistent_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    copied_leaves = 0
+    pending = [Stack()]
+    while pending:
+        path = pending.pop()
+        if path.size() == depth:
+            copied_leaves += path.peek()
+            continue
+        branch = copy.deepcopy(path)  # Um dos ramos precisa da sua própria cópia
+        branch.push(0)
+        path.push(1)  # O outro ramo reaproveita a pilha do pai
+        pending.append(branch)
+        pending.append(path)
+    copy_time = time.perf_counter() - start
+    assert leaves == copied_leaves
+    print(f"PersistentStack:          {persistent_time:6.2f} s")
+    print(f"Stack + copy.deepcopy:    {copy_time:6.2f} s")
+    
+    print(f"\n=== Histórico de desfazer com {history} versões ===\n")
+    tracemalloc.start()
+    versions = [PersistentStack()]
+    for i in range(history):
+        versions.append(versions[-1].push(i))
+    persistent_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del versions
+    
+    tracemalloc.start()
+    versions = [Stack()]
+    for i in range(history):
+        version = copy.deepcopy(versions[-1])
+        version.push(i)
+        versions.append(version)
+    copy_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del versions
+    print(f"PersistentStack:          {persistent_bytes / history:8.0f} bytes por versão")
+    print(f"Stack + copy.deepcopy:    {copy_bytes / history:8.0f} bytes por versão")
+
+def benchmark_balanced(copies=200000, worker_counts=(None, 2, 4)):
+    '''
+    Mede a vazão de check_balanced em um texto grande, sequencial e em paralelo.
+    '''
+    text = '{"id": 1, "tags": ["a", "b"], "pos": {"x": [1, 2, (3)], "y": null}}\n' * copies
+    print(f"\n=== check_balanced em {len(text) / 1e6:.1f} MB ===\n")
+    for workers in worker_counts:
+        start = time.perf_counter()
+        result = check_balanced(text, workers=workers)
+        elapsed = time.perf_counter() - start
+        label = "sequencial" if workers is None else f"{workers} processos"
+        print(f"{label:<12} {len(text) / elapsed / 1e6:6.1f} MB/s (resultado: {result})")
+
+def benchmark(digit_counts=(10000, 100000, 1000000)):
+    '''
+    Mede o tempo de to_base para inteiros com milhões de dígitos.
+    '''
+    print("\n=== Conversão de inteiros grandes com to_base ===\n")
+    if hasattr(sys, "set_int_max_str_digits"):
+        sys.set_int_max_str_digits(0)  # Permite comparar com str() sem limite de dígitos
+    for digits in digit_counts:
+        n = 7 ** int(digits / 0.845)  # Aproximadamente digits dígitos decimais
+        line = f"{len(str(n)):>8} dígitos decimais:"
+        for base in (2, 16, 10):
+            start = time.perf_counter()
+            to_base(n, base)
+            line += f"  base {base:>2} {time.perf_counter() - start:6.2f} s"
+        start = time.perf_counter()
+        str(n)
+        line += f"  (str() {time.perf_counter() - start:6.2f} s)"
+        print(line)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if "--benchmark" in sys.argv:
+        benchmark()
+        benchmark_balanced()
+        benchmark_pool()
+        benchmark_persistent()
+    else:
+        main()
\ No newline at end of file
@@ -0,0 +1,36 @@
+'''
+Executor dos Arquivos do Repositório
+
+Os módulos compartilhados (como pool_de_nos, com o nó, a reserva de nós e as funções
+de exibição usadas pelas pilhas e listas) ficam em Conceitos-Fundamentais/Alocacao-Dinamica.
+Este script os coloca no caminho de importação e executa o arquivo informado como
+programa principal, repassando os demais argumentos:
+
+    python executar.py Estruturas-Lineares/Pilhas/pilha.py --benchmark
+
+Equivale a definir PYTHONPATH=Conceitos-Fundamentais/Alocacao-Dinamica.
+
+Autor: Alef Khatab
+'''
+
+import os
+import runpy
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SHARED_DIRECTORIES = [os.path.join(ROOT, "Conceitos-Fundamentais", "Alocacao-Dinamica")]
+
+def main():
+    if len(sys.argv) < 2:
+        print(f"Uso: python {os.path.basename(__file__)} <arquivo.py> [argumentos...]")
+        return 2
+    path = os.path.abspath(sys.argv[1])
+    sys.argv = sys.argv[1:]  # O arquivo executado vê os próprios argumentos
+    # Como em "python arquivo.py": a pasta do arquivo vem primeiro no caminho
+    sys.path[0] = os.path.dirname(path)
+    sys.path[1:1] = [directory for directory in SHARED_DIRECTORIES if directory not in sys.path]
+    runpy.run_path(path, run_name="__main__")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
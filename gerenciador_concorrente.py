@@ -0,0 +1,362 @@
+'''
+Gerenciador de Processos Concorrente
+
+Este arquivo estende o ProcessManager de solucao_problema_pratico.py para ser usado
+por várias threads produtoras e consumidoras ao mesmo tempo, e também por tarefas asyncio.
+Cada estrutura tem o seu próprio lock (bloqueio de granularidade fina), o escalonamento
+espera em uma variável de condição quando não há processos prontos, e há um slot de
+execução por núcleo simulado.
+
+Autor: Alef Khatab
+'''
+
+import asyncio
+from collections import deque
+import sys
+import threading
+import time
+
+from solucao_problema_pratico import BLOCKED, NEW, RUNNING, TERMINATED, Process, ProcessManager
+
+def _resolve(future):
+    '''Acorda uma tarefa asyncio que espera por processos prontos'''
+    if not future.done():
+        future.set_result(None)
+
+class ConcurrentProcessManager(ProcessManager):
+    '''
+    ProcessManager seguro para threads, com um slot de execução por núcleo.
+    
+    Locks, sempre adquiridos nesta ordem para evitar deadlocks:
+    process_lock (tabela de processos) -> blocked_lock (filas de bloqueados)
+    -> ready_lock (escalonador) -> running_lock (slots dos núcleos, nunca segura outro lock).
+    O destino de eventos configurado também precisa ser seguro para threads
+    (NullEventSink e LoggerEventSink são).
+    '''
+    def __init__(self, cores=1, **kwargs):
+        self.running = [None] * cores  # Processo em execução em cada núcleo
+        self.running_cores = {}  # Mapa pid -> núcleo onde o processo executa
+        super().__init__(**kwargs)
+        self.process_lock = threading.Lock()  # Protege all_processes, a tabela colunar e a geração de PIDs
+        self.blocked_lock = threading.RLock()  # Protege as filas de bloqueados
+        self.ready_lock = threading.RLock()  # Protege o escalonador (fila de prontos)
+        self.ready_condition = threading.Condition(self.ready_lock)  # Sinaliza novos processos prontos
+        self.running_lock = threading.Lock()  # Protege os slots dos núcleos
+        self.async_waiters = deque()  # Pares (loop, future) de tarefas asyncio esperando processos
+        self.closed = False  # Após close(), consumidores param quando a fila esvazia
+    
+    # running_process (da classe base) corresponde ao slot do núcleo 0
+    @property
+    def running_process(self):
+        return self.running[0]
+    
+    @running_process.setter
+    def running_process(self, process):
+        self.running[0] = process
+    
+    def _notify(self, n):
+        '''
+        Acorda até n consumidores (threads e tarefas asyncio). Deve ser chamado com ready_lock.
+        '''
+        self.ready_condition.notify(n)
+        for _ in range(min(n, len(self.async_waiters))):
+            loop, future = self.async_waiters.popleft()
+            loop.call_soon_threadsafe(_resolve, future)
+    
+    def create_process(self, name, priority=0):
+        '''
+        Cria um novo processo e o coloca na fila de processos prontos.
+        '''
+        with self.process_lock:
+            process = Process(name, priority, creation_time=self.clock())
+            self.all_processes[process.pid] = process
+        self.event_sink.record(process.pid, None, NEW)
+        self.set_process_ready(process)
+        return process
+    
+    def create_processes(self, specs):
+        '''
+        Cria vários processos de uma vez e acorda os consumidores em espera.
+        '''
+        with self.process_lock, self.ready_condition:
+            processes = super().create_processes(specs)
+            self._notify(len(processes))
+        return processes
+    
+    def set_process_ready(self, process):
+        '''
+        Coloca o processo na fila de prontos e acorda um consumidor em espera.
+        '''
+        with self.ready_condition:
+            super().set_process_ready(process)
+            self._notify(1)
+    
+    def _try_schedule(self, core):
+        '''
+        Coloca o próximo processo pronto no núcleo informado, sem esperar.
+        Deve ser chamado com ready_lock.
+        '''
+        if not self.ready_queue or self.running[core] is not None:
+            return None
+        process = self.ready_queue.pop()
+        self._transition(process, RUNNING)
+        with self.running_lock:
+            self.running[core] = process
+            self.running_cores[process.pid] = core
+        return process
+    
+    def schedule_next_process(self, core=0, timeout=None):
+        '''
+        Seleciona o próximo processo para o núcleo informado. Se não houver processos
+        prontos, espera até que algum chegue ou até o timeout (None = sem limite).
+        Retorna None se o tempo esgotar, se o núcleo estiver ocupado ou após close().
+        '''
+        with self.ready_condition:
+            if self.running[core] is not None:
+                return None
+            self.ready_condition.wait_for(lambda: self.ready_queue or self.closed, timeout)
+            return self._try_schedule(core)
+    
+    async def next_ready(self, core=0):
+        '''
+        Versão asyncio de schedule_next_process: aguarda sem bloquear o loop de eventos.
+        Retorna None se o núcleo estiver ocupado ou após close() com a fila vazia.
+        '''
+        loop = asyncio.get_running_loop()
+        while True:
+            with self.ready_condition:
+                process = self._try_schedule(core)
+                if process is not None or self.closed or self.running[core] is not None:
+                    return process
+                future = loop.create_future()
+                self.async_waiters.append((loop, future))
+            await future
+    
+    def preempt_process(self, core=0):
+        '''
+        Devolve à fila de prontos o processo em execução no núcleo informado.
+        '''
+        with self.ready_condition:
+            with self.running_lock:
+                process = self.running[core]
+                if process is None:
+                    return None
+                self.running[core] = None
+                del self.running_cores[process.pid]
+            self.set_process_ready(process)
+        return process
+    
+    def tick(self):
+        '''
+        Interrupção de relógio para todos os núcleos. Retorna o número de preempções.
+        '''
+        preempted = 0
+        with self.ready_condition:
+            now = self.clock()
+            self.ready_queue.tick(now)
+            for core, process in enumerate(self.running):
+                if process is None:
+                    continue
+                quantum = self.ready_queue.quantum(process)
+                if quantum is not None and now - process.last_transition >= quantum:
+                    self.preempt_process(core)
+                    preempted += 1
+        return preempted
+    
+    def block_process(self, pid, reason="I/O Operation"):
+        '''
+        Bloqueia um processo em execução (em qualquer núcleo).
+        '''
+        with self.blocked_lock, self.ready_lock:
+            with self.running_lock:
+                core = self.running_cores.pop(pid, None)
+                if core is None:
+                    return False
+                process = self.running[core]
+                self.running[core] = None
+            self._add_blocked(process, reason)
+        return True
+    
+    def unblock_process(self):
+        with self.blocked_lock:
+            return super().unblock_process()
+    
+    def unblock_by_reason(self, reason, n=1):
+        with self.blocked_lock:
+            return super().unblock_by_reason(reason, n)
+    
+    def terminate_process(self, pid=None, core=0):
+        '''
+        Termina um processo. Se pid for None, termina o processo em execução no núcleo informado.
+        '''
+        with self.process_lock, self.blocked_lock, self.ready_lock:
+            with self.running_lock:
+                process = self.running[core] if pid is None else self.all_processes.get(pid)
+                if process is None:
+                    return False
+                slot = self.running_cores.pop(process.pid, None)
+                if slot is not None:
+                    self.running[slot] = None
+            
+            if process.pid in self.ready_queue:
+                self.ready_queue.remove(process.pid)
+            if process.state == BLOCKED:
+                # O processo vira uma lápide na fila de bloqueados (ver ProcessManager)
+                self.blocked_counts[process.block_reason] -= 1
+                self.blocked_count -= 1
+                self._transition(process, TERMINATED)
+                self._compact_blocked_queue(process.block_reason)
+            else:
+                self._transition(process, TERMINATED)
+            self._archive(process)
+        return True
+    
+    def schedule_batch(self, k):
+        with self.ready_lock:
+            return super().schedule_batch(k)
+    
+    def change_priority(self, pid, new_priority):
+        with self.process_lock, self.ready_lock:
+            return super().change_priority(pid, new_priority)
+    
+    def get_process_info(self, pid):
+        with self.process_lock:
+            return super().get_process_info(pid)
+    
+    def list_all_processes(self):
+        with self.process_lock:
+            super().list_all_processes()
+    
+    def list_ready_processes(self):
+        with self.ready_lock:
+            super().list_ready_processes()
+    
+    def list_blocked_processes(self):
+        with self.blocked_lock:
+            super().list_blocked_processes()
+    
+    def close(self):
+        '''
+        Encerra o gerenciador: consumidores em espera são acordados e, quando a fila
+        de prontos esvaziar, schedule_next_process e next_ready passam a retornar None.
+        '''
+        with self.ready_condition:
+            self.closed = True
+            self.ready_condition.notify_all()
+            self._notify(len(self.async_waiters))
+
+# Demonstração de uso
+def main():
+    print("\n=== Gerenciador de Processos Concorrente ===\n")
+    
+    # Threads produtoras e consumidoras (um consumidor por núcleo)
+    print("--- Threads: 4 produtoras, 2 núcleos ---")
+    manager = ConcurrentProcessManager(cores=2)
+    executed = [0, 0]
+    
+    def produce(name):
+        for i in range(5):
+            manager.create_process(f"{name}-{i}", priority=i)
+    
+    def consume(core):
+        while True:
+            process = manager.schedule_next_process(core=core, timeout=1.0)
+            if process is None:
+                return
+            executed[core] += 1
+            manager.terminate_process(core=core)
+    
+    consumers = [threading.Thread(target=consume, args=(core,)) for core in range(2)]
+    producers = [threading.Thread(target=produce, args=(f"Produtor{i}",)) for i in range(4)]
+    for thread in consumers + producers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+    manager.close()
+    for thread in consumers:
+        thread.join()
+    print(f"Processos executados por núcleo: {executed}")
+    
+    # Tarefas asyncio aguardando processos prontos, uma por núcleo
+    print("\n--- asyncio: consumidores aguardando com next_ready() ---")
+    slice_time = 0.05  # Tempo simulado de execução de cada processo
+    
+    async def demo():
+        async_manager = ConcurrentProcessManager(cores=2)
+        
+        async def consumer(core):
+            names = []
+            while True:
+                process = await async_manager.next_ready(core)
+                if process is None:
+                    return names
+                names.append(process.name)
+                # O processo ocupa o núcleo enquanto executa; a tarefa cede o loop e o
+                # consumidor do outro núcleo despacha o próximo processo nesse meio-tempo
+                await asyncio.sleep(slice_time)
+                async_manager.terminate_process(core=core)
+        
+        tasks = [asyncio.create_task(consumer(core)) for core in range(2)]
+        await asyncio.sleep(0)  # Deixa os consumidores começarem a esperar
+        # Uma thread externa produz processos enquanto as tarefas aguardam
+        producer = threading.Thread(
+            target=lambda: async_manager.create_processes((f"Tarefa {i}", i) for i in range(6)))
+        producer.start()
+        await asyncio.to_thread(producer.join)
+        async_manager.close()
+        return await asyncio.gather(*tasks)
+    
+    start = time.perf_counter()
+    results = asyncio.run(demo())
+    elapsed = time.perf_counter() - start
+    for core, names in enumerate(results):
+        print(f"Núcleo {core}: {names}")
+    print(f"6 processos de {slice_time * 1e3:.0f} ms em {elapsed * 1e3:.0f} ms "
+          f"(em série seriam {6 * slice_time * 1e3:.0f} ms)")
+
+def benchmark(total=200000, cores=4, producer_counts=(1, 2, 4, 8, 16)):
+    '''
+    Mede a vazão (criação + escalonamento + término) com vários produtores
+    disputando os locks, comparando com o ProcessManager sem threads.
+    '''
+    print(f"\n=== {total} processos, {cores} núcleos consumidores ===\n")
+    
+    manager = ProcessManager(archive_terminated=True)
+    start = time.perf_counter()
+    for i in range(total):
+        manager.create_process("p", i % 8)
+        manager.schedule_next_process()
+        manager.terminate_process()
+    elapsed = time.perf_counter() - start
+    print(f"ProcessManager (1 thread):  {total / elapsed / 1e3:7.1f} mil processos/s")
+    
+    for producers in producer_counts:
+        manager = ConcurrentProcessManager(cores=cores, archive_terminated=True)
+        per_producer = total // producers
+        
+        def produce():
+            for i in range(per_producer):
+                manager.create_process("p", i % 8)
+        
+        def consume(core):
+            while manager.schedule_next_process(core=core) is not None:
+                manager.terminate_process(core=core)
+        
+        consumers = [threading.Thread(target=consume, args=(core,)) for core in range(cores)]
+        threads = [threading.Thread(target=produce) for _ in range(producers)]
+        start = time.perf_counter()
+        for thread in consumers + threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        manager.close()
+        for thread in consumers:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        print(f"{producers:2d} produtoras:              {per_producer * producers / elapsed / 1e3:7.1f} mil processos/s")
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark()
+    else:
+        main()
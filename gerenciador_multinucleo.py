@@ -0,0 +1,417 @@
+'''
+Gerenciador de Processos Multinúcleo
+
+Este arquivo estende o ProcessManager de solucao_problema_pratico.py para N núcleos.
+Cada núcleo tem a sua própria fila de execução local; um núcleo ocioso rouba trabalho
+da fila mais cheia (work stealing), os processos podem ter afinidade de CPU e cada
+núcleo mantém contadores de utilização, despachos e roubos.
+
+Autor: Alef Khatab
+'''
+
+import random
+import sys
+import time
+
+from solucao_problema_pratico import (BLOCKED, NEW, READY, RUNNING, SCHEDULERS, TERMINATED,
+                                      ManualClock, Process, ProcessManager)
+
+class MultiCoreProcessManager(ProcessManager):
+    '''
+    ProcessManager com uma fila de execução local por núcleo.
+    
+    - Um processo que fica pronto volta para o último núcleo em que executou
+      (aproveitando a cache), se a afinidade permitir; processos novos vão para
+      a fila mais curta entre os núcleos permitidos.
+    - Um núcleo com a fila local vazia rouba o processo do topo da fila mais cheia
+      que possa executar nele.
+    '''
+    def __init__(self, cores=2, scheduler="priority", **kwargs):
+        self.running = [None] * cores  # Processo em execução em cada núcleo
+        super().__init__(**kwargs)
+        make_scheduler = SCHEDULERS[scheduler] if isinstance(scheduler, str) else scheduler
+        self.cores = cores
+        self.run_queues = [make_scheduler() for _ in range(cores)]  # Fila local de cada núcleo
+        self.ready_queue = None  # Substituída pelas filas locais
+        self.running_cores = {}  # Mapa pid -> núcleo onde o processo executa
+        self.home_core = {}  # Mapa pid -> núcleo da última fila/execução do processo
+        self.affinity = {}  # Mapa pid -> núcleos permitidos (ausente = qualquer núcleo)
+        self.start_time = self.clock()  # Início da contagem de utilização
+        self.busy_time = [0.0] * cores  # Tempo ocupado de cada núcleo
+        self.dispatches = [0] * cores  # Processos despachados em cada núcleo
+        self.steals = [0] * cores  # Processos roubados de outras filas por cada núcleo
+    
+    # running_process (da classe base) corresponde ao núcleo 0
+    @property
+    def running_process(self):
+        return self.running[0]
+    
+    @running_process.setter
+    def running_process(self, process):
+        self.running[0] = process
+    
+    def _queue_of(self, pid):
+        return self.run_queues[self.home_core[pid]]
+    
+    def ready_count(self):
+        '''
+        Total de processos prontos em todas as filas locais
+        '''
+        return sum(len(queue) for queue in self.run_queues)
+    
+    def create_process(self, name, priority=0, affinity=None):
+        '''
+        Cria um novo processo, opcionalmente restrito aos núcleos em affinity,
+        e o coloca na fila de prontos de um núcleo.
+        '''
+        if affinity is not None:
+            affinity = self._check_affinity(affinity)  # Valida antes de criar o processo
+        process = Process(name, priority, creation_time=self.clock())
+        self.all_processes[process.pid] = process
+        self.event_sink.record(process.pid, None, NEW)
+        if affinity is not None:
+            self.affinity[process.pid] = affinity
+        self.set_process_ready(process)
+        return process
+    
+    def create_processes(self, specs):
+        '''
+        Cria vários processos (sem afinidade) distribuindo-os entre as filas dos núcleos,
+        com um único heapify por fila.
+        '''
+        now = self.clock()
+        record = self.event_sink.record
+        batches = [[] for _ in range(self.cores)]
+        processes = []
+        for index, (name, priority) in enumerate(specs):
+            process = Process(name, priority, creation_time=now)
+            self.all_processes[process.pid] = process
+            record(process.pid, None, NEW)
+            record(process.pid, NEW, READY)
+            process.state = READY
+            core = index % self.cores
+            self.home_core[process.pid] = core
+            batches[core].append(process)
+            processes.append(process)
+        for queue, batch in zip(self.run_queues, batches):
+            queue.push_many(batch)
+        return processes
+    
+    def set_affinity(self, pid, cores):
+        '''
+        Restringe o processo aos núcleos informados (None remove a restrição).
+        Vale a partir da próxima vez que o processo ficar pronto.
+        Lança ValueError se cores for vazio ou tiver núcleos inexistentes.
+        '''
+        if cores is None:
+            self.affinity.pop(pid, None)
+        else:
+            self.affinity[pid] = self._check_affinity(cores)
+    
+    def _check_affinity(self, cores):
+        '''
+        Retorna os núcleos da afinidade em ordem, sem repetições.
+        Lança ValueError se não houver núcleos ou se algum deles não existir.
+        '''
+        cores = tuple(sorted(set(cores)))
+        if not cores:
+            raise ValueError("Affinity must allow at least one core")
+        invalid = [core for core in cores if not (isinstance(core, int) and 0 <= core < self.cores)]
+        if invalid:
+            raise ValueError(f"Invalid cores {invalid} in affinity: valid cores are 0..{self.cores - 1}")
+        return cores
+    
+    def _choose_core(self, pid):
+        '''
+        Escolhe a fila onde um processo pronto será colocado.
+        Tempo: O(núcleos)
+        '''
+        allowed = self.affinity.get(pid, range(self.cores))
+        last = self.home_core.get(pid)
+        if last is not None and last in allowed:
+            return last
+        return min(allowed, key=lambda core: len(self.run_queues[core]))
+    
+    def set_process_ready(self, process):
+        '''
+        Define o estado de um processo como READY e o coloca na fila local de um núcleo.
+        '''
+        pid = process.pid
+        self._transition(process, READY)
+        core = self._choose_core(pid)
+        self._migrate(pid, core)
+        self.run_queues[core].push(process)
+    
+    def _migrate(self, pid, core):
+        '''
+        Torna core o núcleo do processo. Se ele vier de outro núcleo, o estado do
+        escalonador antigo (nível e tempo consumido, na MLFQ) passa para o novo.
+        '''
+        previous = self.home_core.get(pid)
+        if previous is not None and previous != core:
+            self.run_queues[core].adopt(pid, self.run_queues[previous].release(pid))
+        self.home_core[pid] = core
+    
+    def _steal(self, core):
+        '''
+        Rouba, da fila mais cheia, um processo que possa executar no núcleo informado.
+        Tempo: O(núcleos log núcleos + log n)
+        '''
+        victims = sorted((victim for victim in range(self.cores) if victim != core),
+                         key=lambda victim: len(self.run_queues[victim]), reverse=True)
+        for victim in victims:
+            queue = self.run_queues[victim]
+            if not queue:
+                break
+            allowed = self.affinity.get(queue.peek().pid)
+            if allowed is None or core in allowed:
+                process = queue.pop()
+                self.steals[core] += 1
+                return process
+        return None
+    
+    def schedule_next_process(self, core=0):
+        '''
+        Seleciona o próximo processo para o núcleo informado: primeiro da fila local,
+        depois roubando de outro núcleo. Retorna None se o núcleo estiver ocupado
+        ou se não houver processo que possa executar nele.
+        '''
+        if self.running[core] is not None:
+            return None
+        queue = self.run_queues[core]
+        process = queue.pop() if queue else self._steal(core)
+        if process is None:
+            return None
+        
+        self._migrate(process.pid, core)
+        self.running[core] = process
+        self.running_cores[process.pid] = core
+        self.dispatches[core] += 1
+        self._transition(process, RUNNING)
+        return process
+    
+    def schedule_batch(self, k=None):
+        '''
+        Despacha um processo para cada núcleo ocioso (no máximo k). Retorna os despachados.
+        '''
+        batch = []
+        for core in range(self.cores):
+            if k is not None and len(batch) >= k:
+                break
+            if self.running[core] is None:
+                process = self.schedule_next_process(core)
+                if process is not None:
+                    batch.append(process)
+        return batch
+    
+    def _release_core(self, process):
+        '''
+        Libera o núcleo onde o processo executava, contabilizando o tempo ocupado.
+        '''
+        core = self.running_cores.pop(process.pid)
+        self.running[core] = None
+        self.busy_time[core] += self.clock() - process.last_transition
+    
+    def preempt_process(self, core=0):
+        '''
+        Devolve à fila de prontos o processo em execução no núcleo informado.
+        '''
+        process = self.running[core]
+        if process is None:
+            return None
+        self._release_core(process)
+        self.set_process_ready(process)
+        return process
+    
+    def tick(self):
+        '''
+        Interrupção de relógio para todos os núcleos. Retorna o número de preempções.
+        '''
+        now = self.clock()
+        for queue in self.run_queues:
+            queue.tick(now)
+        preempted = 0
+        for core, process in enumerate(self.running):
+            if process is None:
+                continue
+            quantum = self._queue_of(process.pid).quantum(process)
+            if quantum is not None and now - process.last_transition >= quantum:
+                self.preempt_process(core)
+                preempted += 1
+        return preempted
+    
+    def block_process(self, pid, reason="I/O Operation"):
+        '''
+        Bloqueia um processo em execução (em qualquer núcleo).
+        '''
+        if pid not in self.running_cores:
+            return False
+        process = self.running[self.running_cores[pid]]
+        self._release_core(process)
+        self._add_blocked(process, reason)
+        return True
+    
+    def terminate_process(self, pid=None, core=0):
+        '''
+        Termina um processo. Se pid for None, termina o processo em execução no núcleo informado.
+        '''
+        process = self.running[core] if pid is None else self.all_processes.get(pid)
+        if process is None or process.state == TERMINATED:
+            return False
+        
+        pid = process.pid
+        if pid in self.running_cores:
+            self._release_core(process)
+        queue = self._queue_of(pid)
+        if pid in queue:
+            queue.remove(pid)
+        if process.state == BLOCKED:
+            # O processo vira uma lápide na fila de bloqueados (ver ProcessManager)
+            self.blocked_counts[process.block_reason] -= 1
+            self.blocked_count -= 1
+            self._transition(process, TERMINATED)
+            self._compact_blocked_queue(process.block_reason)
+        else:
+            self._transition(process, TERMINATED)
+        self._archive(process)
+        return True
+    
+    def _archive(self, process):
+        super()._archive(process)
+        self.affinity.pop(process.pid, None)
+        self.home_core.pop(process.pid, None)
+    
+    def change_priority(self, pid, new_priority):
+        '''
+        Altera a prioridade de um processo, reposicionando-o na fila local do seu núcleo.
+        '''
+        if pid not in self.all_processes:
+            return False
+        self.all_processes[pid].priority = new_priority
+        core = self.home_core.get(pid)  # Ausente para processos terminados
+        if core is not None and pid in self.run_queues[core]:
+            self.run_queues[core].update(pid)
+        return True
+    
+    def core_utilization(self):
+        '''
+        Fração do tempo, desde a criação do gerenciador, em que cada núcleo esteve ocupado
+        '''
+        now = self.clock()
+        elapsed = now - self.start_time
+        busy = list(self.busy_time)
+        for core, process in enumerate(self.running):
+            if process is not None:
+                busy[core] += now - process.last_transition
+        return [time_busy / elapsed if elapsed else 0.0 for time_busy in busy]
+    
+    def list_ready_processes(self):
+        '''
+        Lista os processos prontos de cada núcleo.
+        '''
+        for core, queue in enumerate(self.run_queues):
+            names = ", ".join(f"{process.name}({process.priority})" for process in queue.ordered())
+            print(f"  Núcleo {core}: {names or '(vazia)'}")
+    
+    def print_core_stats(self):
+        '''
+        Imprime utilização, despachos e roubos de cada núcleo.
+        '''
+        for core, utilization in enumerate(self.core_utilization()):
+            print(f"  Núcleo {core}: utilização {utilization * 100:5.1f}%, "
+                  f"despachos {self.dispatches[core]}, roubos {self.steals[core]}")
+
+# Demonstração de uso
+def main():
+    print("\n=== Gerenciador de Processos Multinúcleo ===\n")
+    
+    clock = ManualClock()
+    manager = MultiCoreProcessManager(cores=3, clock=clock)
+    
+    print("--- Criando processos (o Banco de Dados só pode executar no núcleo 2) ---")
+    for name, priority in (("Editor", 2), ("Navegador", 3), ("Compilador", 1), ("Terminal", 2)):
+        manager.create_process(name, priority)
+    manager.create_process("Banco de Dados", priority=5, affinity={2})
+    manager.list_ready_processes()
+    
+    print("\n--- Executando: núcleos ociosos roubam trabalho das filas mais cheias ---")
+    rng = random.Random(7)
+    while manager.ready_count() or any(manager.running):
+        for process in manager.schedule_batch():
+            print(f"  t={clock():.0f}: {process.name} no núcleo {manager.running_cores[process.pid]}")
+        clock.advance(1)
+        # Cada processo em execução termina com 50% de chance a cada unidade de tempo
+        for core, process in enumerate(manager.running):
+            if process is not None and rng.random() < 0.5:
+                manager.terminate_process(core=core)
+    
+    print("\n--- Estatísticas por núcleo ---")
+    manager.print_core_stats()
+    
+    print("\n--- MLFQ: o processo roubado leva o seu nível para o novo núcleo ---")
+    clock = ManualClock()
+    mlfq_manager = MultiCoreProcessManager(cores=2, scheduler="mlfq", clock=clock)
+    renderer = mlfq_manager.create_process("Renderizador")
+    mlfq_manager.schedule_next_process(0)
+    clock.advance(1)
+    mlfq_manager.tick()  # Esgota o quantum do nível 0 e volta à fila do núcleo 0
+    mlfq_manager.schedule_next_process(1)  # O núcleo 1 está ocioso e rouba o processo
+    thief_queue = mlfq_manager.run_queues[1]
+    print(f"  Roubado pelo núcleo 1 no nível {thief_queue.levels[renderer.pid]}, "
+          f"quantum restante {thief_queue.quantum(renderer):.1f}")
+    clock.advance(1)
+    mlfq_manager.tick()  # Sem preempção: o quantum do nível 1 é 2
+    mlfq_manager.preempt_process(1)
+    mlfq_manager.schedule_next_process(1)
+    clock.advance(1)
+    mlfq_manager.tick()  # Completa o quantum do nível 1 no núcleo 1
+    level = thief_queue.levels[renderer.pid]
+    print(f"  Após 2 unidades no núcleo 1: nível {level} ({'ok' if level == 2 else 'esperado: nível 2'})")
+
+def benchmark(core_counts=(1, 2, 4, 8, 16, 32, 64), steps=2000, load=0.9, pinned=0.1, seed=3):
+    '''
+    Simula a mesma carga relativa (load) de 1 a 64 núcleos. Uma fração dos processos
+    (pinned) só pode executar no núcleo 0, criando um ponto de contenção.
+    '''
+    print(f"\n=== Escalabilidade: carga {load:.0%}, {pinned:.0%} dos processos presos ao núcleo 0 ===\n")
+    print("núcleos  terminados  util. média  util. mín  util. máx  roubos  fila máx  tempo (s)")
+    for cores in core_counts:
+        rng = random.Random(seed)
+        clock = ManualClock()
+        manager = MultiCoreProcessManager(cores=cores, clock=clock, archive_terminated=True)
+        remaining = {}  # pid -> unidades de CPU que faltam
+        completed = 0
+        longest_queue = 0
+        arrival_rate = load * cores / 5.5  # Cada processo pede em média 5.5 unidades de CPU
+        next_arrival = rng.expovariate(arrival_rate)
+        start = time.perf_counter()
+        for step in range(steps):
+            # Chegadas de Poisson até o fim deste passo
+            while next_arrival < step + 1:
+                affinity = {0} if rng.random() < pinned else None
+                process = manager.create_process("p", rng.randrange(4), affinity=affinity)
+                remaining[process.pid] = rng.randint(1, 10)
+                next_arrival += rng.expovariate(arrival_rate)
+            manager.schedule_batch()
+            longest_queue = max(longest_queue, max(len(queue) for queue in manager.run_queues))
+            clock.advance(1)
+            for core, process in enumerate(manager.running):
+                if process is None:
+                    continue
+                remaining[process.pid] -= 1
+                if remaining[process.pid] == 0:
+                    del remaining[process.pid]
+                    manager.terminate_process(core=core)
+                    completed += 1
+                else:
+                    manager.preempt_process(core)
+        elapsed = time.perf_counter() - start
+        utilization = manager.core_utilization()
+        print(f"{cores:7d}  {completed:10d}  {sum(utilization) / cores:10.1%}  {min(utilization):9.1%}"
+              f"  {max(utilization):9.1%}  {sum(manager.steals):6d}  {longest_queue:8d}  {elapsed:9.2f}")
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark()
+    else:
+        main()
@@ -8,8 +8,16 @@ filas e filas de prioridade como estruturas de dados para gerenciamento eficient
 Autor: Alef Khatab
 '''
 
+from array import array
 import heapq
+from collections import deque, namedtuple
 from enum import Enum
+from functools import partial
+import itertools
+import logging
+import operator
+import random
+import sys
 import time
 
 # Definição dos estados de um processo
@@ -20,18 +28,32 @@ class ProcessState(Enum):
     BLOCKED = "Bloqueado"
     TERMINATED = "Terminado"
 
+# Atalhos para os estados: o acesso ProcessState.X passa pela metaclasse do Enum
+# e é bem mais lento que ler uma variável global nos caminhos críticos
+NEW, READY, RUNNING, BLOCKED, TERMINATED = ProcessState
+
+# Códigos compactos dos estados para os registros de eventos (0 = sem estado anterior)
+STATE_CODES = {state: code for code, state in enumerate(ProcessState, start=1)}
+CODE_STATES = (None,) + tuple(ProcessState)
+
 # Classe que representa um processo
 class Process:
+    # __slots__ elimina o dicionário de atributos de cada instância, reduzindo a memória por processo
+    __slots__ = ('pid', 'name', 'priority', 'state', 'creation_time', 'execution_time', 'wait_time',
+                 'last_transition', 'block_reason')
     next_pid = 1  # ID do próximo processo a ser criado
     
-    def __init__(self, name, priority=0):
+    def __init__(self, name, priority=0, creation_time=None):
         self.pid = Process.next_pid  # ID único do processo
         Process.next_pid += 1
         self.name = name  # Nome do processo
         self.priority = priority  # Prioridade (maior número = maior prioridade)
-        self.state = ProcessState.NEW  # Estado inicial: NEW
-        self.creation_time = time.time()  # Momento de criação
+        self.state = NEW  # Estado inicial: NEW
+        # Momento de criação (pode ser informado para evitar uma chamada a time.time() por processo)
+        self.creation_time = time.time() if creation_time is None else creation_time
         self.execution_time = 0  # Tempo total de execução
+        self.wait_time = 0  # Tempo total de espera na fila de prontos
+        self.last_transition = self.creation_time  # Momento da última mudança de estado
         self.block_reason = None  # Razão do bloqueio (se estiver bloqueado)
     
     def __lt__(self, other):
@@ -41,32 +63,577 @@ class Process:
     def __repr__(self):
         return f"Processo[{self.pid}, {self.name}, Prioridade={self.priority}, Estado={self.state.value}]"
 
+# Registro imutável de um processo arquivado na tabela colunar
+ProcessRecord = namedtuple('ProcessRecord', ['pid', 'priority', 'state', 'creation_time', 'execution_time'])
+
+# Tabela colunar (struct-of-arrays) para processos terminados
+class ProcessTable:
+    '''
+    Armazena processos em colunas paralelas de array (pid, prioridade, estado,
+    momento de criação e tempo de execução), usando cerca de 33 bytes por processo
+    em vez de um objeto Python completo. Os processos são materializados sob demanda
+    como ProcessRecord.
+    '''
+    def __init__(self):
+        self.pids = array('q')  # PID de cada processo
+        self.priorities = array('q')  # Prioridade
+        self.state_codes = array('b')  # Código do estado (ver STATE_CODES)
+        self.creation_times = array('d')  # Momento de criação
+        self.execution_times = array('d')  # Tempo total de execução
+    
+    def __len__(self):
+        return len(self.pids)
+    
+    def append(self, process):
+        '''
+        Arquiva um processo no final da tabela
+        Tempo: O(1) amortizado
+        '''
+        self.pids.append(process.pid)
+        self.priorities.append(process.priority)
+        self.state_codes.append(STATE_CODES[process.state])
+        self.creation_times.append(process.creation_time)
+        self.execution_times.append(process.execution_time)
+    
+    def __getitem__(self, index):
+        '''
+        Materializa a linha index como um ProcessRecord
+        Tempo: O(1)
+        '''
+        return ProcessRecord(self.pids[index], self.priorities[index],
+                             CODE_STATES[self.state_codes[index]],
+                             self.creation_times[index], self.execution_times[index])
+    
+    def find(self, pid):
+        '''
+        Busca um processo pelo PID, retornando seu registro ou None
+        Tempo: O(n), com a varredura feita em C por array.index
+        '''
+        try:
+            return self[self.pids.index(pid)]
+        except ValueError:
+            return None
+
+# Fila de prioridade indexada para os processos prontos
+SEQUENCE_BITS = 40  # Bits da ordem de chegada na chave do heap
+PID_BITS = 32  # Bits do PID na chave do heap
+SEQUENCE_MASK = (1 << SEQUENCE_BITS) - 1
+PID_MASK = (1 << PID_BITS) - 1
+
+class IndexedPriorityQueue:
+    '''
+    Fila de prioridade baseada em heap binário de chaves inteiras que codificam
+    (-prioridade, sequência de chegada, pid). Comparar inteiros é feito em C pelo heapq,
+    sem chamar Process.__lt__, e a sequência garante ordem FIFO entre processos de mesma
+    prioridade. Um mapa pid -> chave válida permite remover ou reposicionar qualquer
+    processo em O(log n) amortizado: a chave antiga vira uma lápide descartada ao chegar
+    ao topo, e o heap é compactado quando as lápides passam a ser maioria.
+    
+    Se um valor não couber na chave inteira (prioridade não inteira, como um float, ou
+    PID/sequência grandes demais), a fila passa a usar tuplas (-prioridade, sequência, pid),
+    com a mesma ordenação, a partir desse momento.
+    '''
+    def __init__(self):
+        self.heap = []  # Heap binário de chaves inteiras
+        self.entries = {}  # Mapa pid -> chave válida do processo no heap
+        self.processes = {}  # Mapa pid -> processo
+        self.sequence = itertools.count()  # Ordem de chegada (desempate FIFO)
+        self.tuple_keys = False  # True após a troca para chaves em tupla
+        self.pid_of = partial(operator.and_, PID_MASK)  # Extrai o PID de uma chave
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def __contains__(self, pid):
+        return pid in self.entries
+    
+    @staticmethod
+    def make_key(priority, sequence, pid):
+        '''
+        Codifica (-prioridade, sequência, pid) em um único inteiro com a mesma ordenação.
+        Lança ValueError se a prioridade não for inteira, se o PID não estiver em
+        [0, 2^PID_BITS) ou se a sequência não estiver em [0, 2^SEQUENCE_BITS).
+        '''
+        if not isinstance(priority, int):
+            raise ValueError(f"Integer heap keys need an integer priority, got {priority!r}")
+        if not 0 <= pid <= PID_MASK:
+            raise ValueError(f"PID {pid} does not fit in {PID_BITS} bits")
+        if not 0 <= sequence <= SEQUENCE_MASK:
+            raise ValueError(f"Sequence {sequence} does not fit in {SEQUENCE_BITS} bits")
+        return (((-priority << SEQUENCE_BITS) | sequence) << PID_BITS) | pid
+    
+    def _key(self, priority, sequence, pid):
+        '''
+        Chave do heap: inteira, ou uma tupla se a fila já usa (ou precisa passar a usar)
+        chaves em tupla
+        '''
+        if not self.tuple_keys:
+            try:
+                return self.make_key(priority, sequence, pid)
+            except ValueError:
+                self._use_tuple_keys()
+        return (-priority, sequence, pid)
+    
+    def _use_tuple_keys(self):
+        '''
+        Converte as chaves inteiras válidas em tuplas e reconstrói o heap
+        Tempo: O(n)
+        '''
+        shift = SEQUENCE_BITS + PID_BITS
+        self.entries = {pid: (key >> shift, (key >> PID_BITS) & SEQUENCE_MASK, pid)
+                        for pid, key in self.entries.items()}
+        self.heap = list(self.entries.values())
+        heapq.heapify(self.heap)
+        self.tuple_keys = True
+        self.pid_of = operator.itemgetter(2)
+    
+    def push(self, process):
+        '''
+        Insere um processo na fila
+        Tempo: O(log n)
+        '''
+        key = self._key(process.priority, next(self.sequence), process.pid)
+        self.entries[process.pid] = key
+        self.processes[process.pid] = process
+        heapq.heappush(self.heap, key)
+    
+    def push_many(self, processes):
+        '''
+        Insere vários processos de uma vez. Para lotes grandes, reconstrói o heap
+        com um único heapify em vez de várias inserções.
+        Tempo: O(n + k)
+        '''
+        processes = list(processes)
+        if len(processes) * 8 < len(self.heap):
+            # Lote pequeno em relação ao heap: inserções individuais são mais baratas
+            for process in processes:
+                self.push(process)
+            return
+        
+        for process in processes:
+            key = self._key(process.priority, next(self.sequence), process.pid)
+            self.entries[process.pid] = key
+            self.processes[process.pid] = process
+            self.heap.append(key)
+        heapq.heapify(self.heap)
+    
+    def pop(self):
+        '''
+        Remove e retorna o processo de maior prioridade (o mais antigo, em caso de empate)
+        Tempo: O(log n) amortizado
+        '''
+        self._discard_stale()
+        if not self.heap:
+            raise IndexError("Pop from an empty priority queue")
+        pid = self.pid_of(heapq.heappop(self.heap))
+        del self.entries[pid]
+        return self.processes.pop(pid)
+    
+    def peek(self):
+        '''
+        Retorna o processo de maior prioridade sem removê-lo
+        Tempo: O(1) amortizado
+        '''
+        self._discard_stale()
+        if not self.heap:
+            raise IndexError("Peek from an empty priority queue")
+        return self.processes[self.pid_of(self.heap[0])]
+    
+    def remove(self, pid):
+        '''
+        Remove e retorna o processo com o PID informado
+        Tempo: O(1) amortizado (a chave antiga é descartada depois)
+        '''
+        del self.entries[pid]
+        process = self.processes.pop(pid)
+        self._compact()
+        return process
+    
+    def update(self, pid):
+        '''
+        Reposiciona um processo no heap após a mudança da sua prioridade,
+        mantendo a sua ordem de chegada original
+        Tempo: O(log n) amortizado
+        '''
+        key = self.entries[pid]
+        sequence = key[1] if self.tuple_keys else (key >> PID_BITS) & SEQUENCE_MASK
+        key = self._key(self.processes[pid].priority, sequence, pid)
+        self.entries[pid] = key
+        heapq.heappush(self.heap, key)
+        self._compact()
+    
+    def ordered(self):
+        '''
+        Retorna os processos em ordem de prioridade, sem alterar o heap
+        Tempo: O(n log n)
+        '''
+        pid_of = self.pid_of
+        return [self.processes[pid_of(key)] for key in sorted(self.entries.values())]
+    
+    def _discard_stale(self):
+        '''
+        Descarta as lápides que estão no topo do heap.
+        '''
+        heap = self.heap
+        entries = self.entries
+        pid_of = self.pid_of
+        while heap and entries.get(pid_of(heap[0])) != heap[0]:
+            heapq.heappop(heap)
+    
+    def _compact(self):
+        '''
+        Reconstrói o heap só com as chaves válidas quando as lápides passam a ser maioria.
+        '''
+        if len(self.heap) > 2 * len(self.entries) + 32:
+            self.heap = list(self.entries.values())
+            heapq.heapify(self.heap)
+
+# Destinos (sinks) dos eventos de transição de estado dos processos
+class NullEventSink:
+    '''
+    Destino de eventos padrão: descarta todas as transições sem nenhum custo de formatação.
+    '''
+    def record(self, pid, from_state, to_state):
+        pass
+
+class RingBufferEventSink:
+    '''
+    Buffer circular pré-alocado de registros compactos (timestamp, pid, estado_origem, estado_destino).
+    Quando o buffer enche, os registros mais antigos são sobrescritos.
+    Nada é formatado até que os eventos sejam consumidos com drain().
+    '''
+    def __init__(self, capacity=65536):
+        self.capacity = capacity  # Número máximo de registros mantidos
+        self.timestamps = array('d', bytes(8 * capacity))  # Momento de cada transição
+        self.pids = array('q', bytes(8 * capacity))  # PID do processo
+        self.from_codes = array('b', bytes(capacity))  # Código do estado de origem
+        self.to_codes = array('b', bytes(capacity))  # Código do estado de destino
+        self.front = 0  # Índice do registro mais antigo
+        self.size = 0  # Número de registros armazenados
+        self.dropped = 0  # Registros sobrescritos antes de serem consumidos
+    
+    def record(self, pid, from_state, to_state):
+        '''
+        Armazena uma transição no buffer
+        Tempo: O(1)
+        '''
+        index = (self.front + self.size) % self.capacity
+        self.timestamps[index] = time.perf_counter()
+        self.pids[index] = pid
+        self.from_codes[index] = STATE_CODES[from_state] if from_state else 0
+        self.to_codes[index] = STATE_CODES[to_state]
+        if self.size < self.capacity:
+            self.size += 1
+        else:
+            # Buffer cheio: o registro mais antigo foi sobrescrito
+            self.front = (self.front + 1) % self.capacity
+            self.dropped += 1
+    
+    def drain(self):
+        '''
+        Consome os registros armazenados, do mais antigo ao mais recente,
+        retornando tuplas (timestamp, pid, estado_origem, estado_destino).
+        '''
+        while self.size > 0:
+            index = self.front
+            self.front = (self.front + 1) % self.capacity
+            self.size -= 1
+            yield (self.timestamps[index], self.pids[index],
+                   CODE_STATES[self.from_codes[index]], CODE_STATES[self.to_codes[index]])
+
+class LoggerEventSink:
+    '''
+    Adaptador que envia as transições para um logger do módulo logging.
+    A mensagem só é formatada se o nível estiver habilitado no logger.
+    '''
+    def __init__(self, logger=None, level=logging.INFO):
+        self.logger = logger or logging.getLogger(__name__)
+        self.level = level
+    
+    def record(self, pid, from_state, to_state):
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, "Processo %d: %s -> %s", pid,
+                            from_state.value if from_state else "-", to_state.value)
+
+# Escalonadores: políticas plugáveis que organizam os processos prontos
+class PriorityScheduler(IndexedPriorityQueue):
+    '''
+    Política de prioridade estrita: sempre executa o processo pronto de maior
+    prioridade, sem preempção por quantum e sem envelhecimento.
+    '''
+    def quantum(self, process):
+        '''
+        Tempo que o processo pode executar antes de ser preemptado (None = sem limite)
+        '''
+        return None
+    
+    def charge(self, process, elapsed):
+        '''
+        Contabiliza o tempo de CPU usado por um processo ao sair de execução
+        '''
+        pass
+    
+    def tick(self, now):
+        '''
+        Chamado periodicamente pelo gerenciador com o instante atual
+        '''
+        pass
+    
+    def release(self, pid):
+        '''
+        Descarta o estado mantido para um processo terminado ou que migrou
+        para outro escalonador, e o retorna (None = sem estado)
+        '''
+        return None
+    
+    def adopt(self, pid, state):
+        '''
+        Assume o estado retornado por release em outro escalonador
+        '''
+        pass
+
+class MLFQScheduler:
+    '''
+    Fila multinível com realimentação (Multi-Level Feedback Queue).
+    Cada nível é uma fila FIFO (deque) com operações O(1); o nível 0 é o mais prioritário.
+    Um processo que esgota o quantum do seu nível é rebaixado para o nível seguinte,
+    e periodicamente todos os processos voltam ao nível 0 (boost), evitando starvation.
+    '''
+    def __init__(self, levels=3, base_quantum=1.0, boost_interval=50.0):
+        self.queues = [deque() for _ in range(levels)]  # Uma fila FIFO por nível
+        self.quanta = [base_quantum * 2 ** level for level in range(levels)]  # Quantum dobra a cada nível
+        self.boost_interval = boost_interval  # Intervalo entre os boosts de prioridade
+        self.last_boost = None  # Instante do último boost
+        self.levels = {}  # Mapa pid -> nível atual do processo
+        self.used = {}  # Mapa pid -> tempo de CPU já consumido no nível atual
+        self.entries = {}  # Mapa pid -> marca da entrada válida na fila (processos prontos)
+        self.marks = itertools.count()  # Gerador das marcas das entradas
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def __contains__(self, pid):
+        return pid in self.entries
+    
+    def push(self, process):
+        '''
+        Insere um processo no final da fila do seu nível (novos processos entram no nível 0)
+        Tempo: O(1)
+        '''
+        level = self.levels.setdefault(process.pid, 0)
+        mark = next(self.marks)
+        self.entries[process.pid] = mark
+        self.queues[level].append((mark, process))
+    
+    def push_many(self, processes):
+        '''
+        Insere vários processos
+        Tempo: O(k)
+        '''
+        for process in processes:
+            self.push(process)
+    
+    def pop(self):
+        '''
+        Remove e retorna o primeiro processo do nível mais prioritário não vazio
+        Tempo: O(1) amortizado
+        '''
+        process = self.peek()
+        self.queues[self.levels[process.pid]].popleft()
+        del self.entries[process.pid]
+        return process
+    
+    def peek(self):
+        '''
+        Retorna o próximo processo a ser executado sem removê-lo
+        Tempo: O(1) amortizado
+        '''
+        for queue in self.queues:
+            # Descarta as entradas de processos removidos (remoção preguiçosa)
+            while queue and self.entries.get(queue[0][1].pid) != queue[0][0]:
+                queue.popleft()
+            if queue:
+                return queue[0][1]
+        raise IndexError("Peek from an empty scheduler")
+    
+    def remove(self, pid):
+        '''
+        Remove um processo pronto; sua entrada na fila é descartada quando alcançada
+        Tempo: O(1)
+        '''
+        del self.entries[pid]
+    
+    def update(self, pid):
+        '''
+        Mudanças de prioridade estática não afetam a MLFQ, que usa apenas o nível
+        '''
+        pass
+    
+    def ordered(self):
+        '''
+        Retorna os processos prontos na ordem em que seriam executados
+        Tempo: O(n)
+        '''
+        return [process for queue in self.queues for mark, process in queue
+                if self.entries.get(process.pid) == mark]
+    
+    def quantum(self, process):
+        '''
+        Tempo restante do quantum do processo no seu nível atual
+        '''
+        pid = process.pid
+        return self.quanta[self.levels[pid]] - self.used.get(pid, 0)
+    
+    def charge(self, process, elapsed):
+        '''
+        Contabiliza o tempo de CPU usado; ao esgotar o quantum do nível, o processo é rebaixado
+        '''
+        pid = process.pid
+        level = self.levels[pid]
+        used = self.used.get(pid, 0) + elapsed
+        # Tolerância para o arredondamento de relógios em ponto flutuante
+        if used >= self.quanta[level] * (1 - 1e-9):
+            self.levels[pid] = min(level + 1, len(self.queues) - 1)
+            used = 0
+        self.used[pid] = used
+    
+    def tick(self, now):
+        '''
+        Executa o boost de prioridade quando o intervalo configurado se esgota
+        '''
+        if self.last_boost is None:
+            self.last_boost = now
+        elif now - self.last_boost >= self.boost_interval:
+            self.boost()
+            self.last_boost = now
+    
+    def boost(self):
+        '''
+        Move todos os processos de volta ao nível 0, mantendo a ordem FIFO de cada nível
+        Tempo: O(n)
+        '''
+        top = self.queues[0]
+        for queue in self.queues[1:]:
+            top.extend(queue)
+            queue.clear()
+        for pid in self.levels:
+            self.levels[pid] = 0
+        self.used.clear()
+    
+    def release(self, pid):
+        '''
+        Descarta o nível e o tempo consumido de um processo terminado ou que migrou
+        para outro escalonador, e os retorna como (nível, tempo consumido)
+        '''
+        return self.levels.pop(pid, 0), self.used.pop(pid, 0)
+    
+    def adopt(self, pid, state):
+        '''
+        Assume o nível e o tempo consumido retornados por release em outro escalonador
+        '''
+        if state is None:
+            return
+        level, used = state
+        self.levels[pid] = min(level, len(self.queues) - 1)
+        if used:
+            self.used[pid] = used
+
+# Políticas de escalonamento disponíveis por nome
+SCHEDULERS = {
+    "priority": PriorityScheduler,
+    "mlfq": MLFQScheduler,
+}
+
+# Relógio controlado manualmente
+class ManualClock:
+    '''
+    Relógio avançado explicitamente pelo chamador, útil para demonstrações
+    e execuções reproduzíveis (substitui time.time no gerenciador).
+    '''
+    def __init__(self, start=0.0):
+        self.now = start  # Instante atual
+    
+    def __call__(self):
+        return self.now
+    
+    def advance(self, delta):
+        self.now += delta
+
 # Gerenciador de processos usando filas
 class ProcessManager:
-    def __init__(self):
-        self.all_processes = {}  # Dicionário de todos os processos por PID
-        self.ready_queue = []  # Fila de prioridade para processos prontos
-        self.blocked_queue = []  # Fila FIFO para processos bloqueados
+    def __init__(self, event_sink=None, archive_terminated=False, scheduler="priority", clock=None):
+        self.event_sink = event_sink or NullEventSink()  # Destino dos eventos de transição
+        self.clock = clock or time.time  # Fonte de tempo para a contabilização de execução e espera
+        self.all_processes = {}  # Dicionário dos processos ativos (e dos terminados, se não arquivados) por PID
+        # Se ativado, processos terminados saem de all_processes e vão para a tabela colunar
+        self.archive_terminated = archive_terminated
+        self.terminated_table = ProcessTable()
+        # Escalonador com os processos prontos: "priority" (heap indexado), "mlfq" ou uma instância
+        self.ready_queue = SCHEDULERS[scheduler]() if isinstance(scheduler, str) else scheduler
+        self.blocked_queues = {}  # Uma fila FIFO (deque) de bloqueados por razão de bloqueio
+        self.blocked_counts = {}  # Bloqueados ainda válidos por razão (sem contar os terminados)
+        self.blocked_count = 0  # Total de processos bloqueados válidos
+        self.block_sequence = itertools.count()  # Ordem global de bloqueio (para o FIFO entre razões)
         self.running_process = None  # Processo atualmente em execução
     
     def create_process(self, name, priority=0):
         '''
         Cria um novo processo e o coloca na fila de processos prontos.
         '''
-        process = Process(name, priority)
+        process = Process(name, priority, creation_time=self.clock())
         self.all_processes[process.pid] = process
-        print(f"Processo criado: {process}")
+        self.event_sink.record(process.pid, None, NEW)
         self.set_process_ready(process)
         return process
     
+    def create_processes(self, specs):
+        '''
+        Cria vários processos a partir de pares (nome, prioridade) e os coloca
+        na fila de prontos com um único heapify. Retorna a lista de processos criados.
+        '''
+        now = self.clock()  # Um único instante de criação para todo o lote
+        record = self.event_sink.record
+        processes = []
+        for name, priority in specs:
+            process = Process(name, priority, creation_time=now)
+            self.all_processes[process.pid] = process
+            record(process.pid, None, NEW)
+            record(process.pid, NEW, READY)
+            process.state = READY
+            processes.append(process)
+        
+        self.ready_queue.push_many(processes)
+        return processes
+    
+    def _transition(self, process, new_state):
+        '''
+        Altera o estado de um processo, contabiliza o tempo passado no estado anterior
+        e registra a transição no destino de eventos.
+        '''
+        now = self.clock()
+        if process.state == READY:
+            process.wait_time += now - process.last_transition
+        elif process.state == RUNNING:
+            elapsed = now - process.last_transition
+            process.execution_time += elapsed
+            self._queue_of(process.pid).charge(process, elapsed)
+        process.last_transition = now
+        self.event_sink.record(process.pid, process.state, new_state)
+        process.state = new_state
+    
+    def _queue_of(self, pid):
+        '''
+        Retorna o escalonador responsável pelo processo (há um só neste gerenciador).
+        '''
+        return self.ready_queue
+    
     def set_process_ready(self, process):
         '''
         Define o estado de um processo como READY e o adiciona à fila de prontos.
         '''
-        process.state = ProcessState.READY
-        print(f"Processo {process.pid} está pronto para execução.")
+        self._transition(process, READY)
         # Adiciona à fila de prioridade
-        heapq.heappush(self.ready_queue, process)
+        self.ready_queue.push(process)
     
     def schedule_next_process(self):
         '''
@@ -74,45 +641,118 @@ class ProcessManager:
         Retorna o processo selecionado ou None se a fila estiver vazia.
         '''
         if not self.ready_queue:
-            print("Nenhum processo pronto para execução.")
             return None
         
         # Remove e retorna o processo de maior prioridade
-        process = heapq.heappop(self.ready_queue)
+        process = self.ready_queue.pop()
         self.running_process = process
-        process.state = ProcessState.RUNNING
-        print(f"Processo {process.pid} ({process.name}) iniciou execução.")
+        self._transition(process, RUNNING)
         return process
     
+    def schedule_batch(self, k):
+        '''
+        Retira da fila de prontos os k processos de maior prioridade (ou menos, se não
+        houver tantos) e os coloca em execução, para despacho em vários núcleos.
+        Os processos do lote não ocupam running_process; devem ser terminados pelo PID.
+        Tempo: O(k log n)
+        '''
+        batch = []
+        ready_queue = self.ready_queue
+        while ready_queue and len(batch) < k:
+            process = ready_queue.pop()
+            self._transition(process, RUNNING)
+            batch.append(process)
+        return batch
+    
+    def preempt_process(self):
+        '''
+        Interrompe o processo em execução e o devolve à fila de prontos.
+        Retorna o processo preemptado ou None se não houver processo em execução.
+        '''
+        process = self.running_process
+        if process is None:
+            return None
+        self.running_process = None
+        self.set_process_ready(process)
+        return process
+    
+    def tick(self):
+        '''
+        Interrupção de relógio: permite ao escalonador executar tarefas periódicas
+        (como o boost da MLFQ) e preempta o processo em execução se o seu quantum acabou.
+        Retorna True se houve preempção.
+        '''
+        now = self.clock()
+        self.ready_queue.tick(now)
+        process = self.running_process
+        if process is not None:
+            quantum = self.ready_queue.quantum(process)
+            if quantum is not None and now - process.last_transition >= quantum:
+                self.preempt_process()
+                return True
+        return False
+    
     def block_process(self, pid, reason="I/O Operation"):
         '''
         Bloqueia um processo em execução e o move para a fila de bloqueados.
         '''
         if self.running_process and self.running_process.pid == pid:
             process = self.running_process
-            process.state = ProcessState.BLOCKED
-            process.block_reason = reason
-            self.blocked_queue.append(process)  # Adiciona à fila FIFO de bloqueados
-            print(f"Processo {process.pid} bloqueado: {reason}")
+            self._add_blocked(process, reason)
             self.running_process = None
             return True
         else:
-            print(f"Erro: Não há processo com PID {pid} em execução.")
             return False
     
+    def _add_blocked(self, process, reason):
+        '''
+        Marca o processo como bloqueado e o adiciona à fila FIFO da razão informada - O(1)
+        '''
+        self._transition(process, BLOCKED)
+        process.block_reason = reason
+        if reason not in self.blocked_queues:
+            self.blocked_queues[reason] = deque()
+            self.blocked_counts[reason] = 0
+        self.blocked_queues[reason].append((next(self.block_sequence), process))
+        self.blocked_counts[reason] += 1
+        self.blocked_count += 1
+    
     def unblock_process(self):
         '''
-        Desbloqueia o processo que está há mais tempo na fila de bloqueados (FIFO).
+        Desbloqueia o processo que está há mais tempo bloqueado (FIFO),
+        considerando todas as razões de bloqueio.
         '''
-        if not self.blocked_queue:
-            print("Nenhum processo bloqueado.")
+        if self.blocked_count == 0:
             return None
         
-        # Remove o primeiro processo da fila de bloqueados (FIFO)
-        process = self.blocked_queue.pop(0)
-        print(f"Processo {process.pid} desbloqueado.")
-        self.set_process_ready(process)
-        return process
+        # Entre as cabeças das filas de cada razão, escolhe a bloqueada há mais tempo
+        oldest_reason = None
+        oldest_sequence = None
+        for reason, queue in self.blocked_queues.items():
+            self._discard_terminated(queue)
+            if queue and (oldest_sequence is None or queue[0][0] < oldest_sequence):
+                oldest_reason = reason
+                oldest_sequence = queue[0][0]
+        
+        return self.unblock_by_reason(oldest_reason, 1)[0]
+    
+    def unblock_by_reason(self, reason, n=1):
+        '''
+        Desbloqueia, em ordem FIFO, até n processos bloqueados pela razão informada.
+        Retorna a lista de processos desbloqueados. Tempo: O(n)
+        '''
+        queue = self.blocked_queues.get(reason)
+        unblocked = []
+        while queue and len(unblocked) < n:
+            _, process = queue.popleft()  # Remove do início da fila - O(1)
+            # Descarta os processos terminados enquanto estavam bloqueados
+            if process.state != BLOCKED:
+                continue
+            self.blocked_counts[reason] -= 1
+            self.blocked_count -= 1
+            self.set_process_ready(process)
+            unblocked.append(process)
+        return unblocked
     
     def terminate_process(self, pid=None):
         '''
@@ -132,27 +772,76 @@ class ProcessManager:
             if self.running_process and self.running_process.pid == pid:
                 self.running_process = None
             
-            # Remove o processo da fila de prontos, se estiver nela
-            self.ready_queue = [p for p in self.ready_queue if p.pid != pid]
-            heapq.heapify(self.ready_queue)
+            # Remove o processo da fila de prontos, se estiver nela - O(log n)
+            if pid in self.ready_queue:
+                self.ready_queue.remove(pid)
             
-            # Remove o processo da fila de bloqueados, se estiver nela
-            self.blocked_queue = [p for p in self.blocked_queue if p.pid != pid]
+            # Processos bloqueados não são removidos da fila agora: ao serem marcados
+            # como terminados, viram "lápides" descartadas no desbloqueio (remoção preguiçosa)
+            if process.state == BLOCKED:
+                self.blocked_counts[process.block_reason] -= 1
+                self.blocked_count -= 1
+                self._transition(process, TERMINATED)
+                self._compact_blocked_queue(process.block_reason)
+                self._archive(process)
+                return True
         
         if process:
-            process.state = ProcessState.TERMINATED
-            print(f"Processo {process.pid} ({process.name}) terminado.")
+            self._transition(process, TERMINATED)
+            self._archive(process)
             return True
         else:
-            print(f"Erro: Processo com PID {pid} não encontrado.")
             return False
     
+    def _archive(self, process):
+        '''
+        Libera o estado do escalonador e move o processo terminado para a tabela
+        colunar, se o arquivamento estiver ativo.
+        '''
+        self._queue_of(process.pid).release(process.pid)
+        if self.archive_terminated:
+            del self.all_processes[process.pid]
+            self.terminated_table.append(process)
+    
+    def _discard_terminated(self, queue):
+        '''
+        Descarta as lápides no início de uma fila de bloqueados.
+        '''
+        while queue and queue[0][1].state != BLOCKED:
+            queue.popleft()
+    
+    def _compact_blocked_queue(self, reason):
+        '''
+        Remove as lápides da fila de bloqueados de uma razão quando elas passam
+        a ser maioria, mantendo o custo amortizado da terminação em O(1).
+        '''
+        queue = self.blocked_queues[reason]
+        if len(queue) > 2 * self.blocked_counts[reason] + 32:
+            self.blocked_queues[reason] = deque(
+                entry for entry in queue if entry[1].state == BLOCKED)
+    
+    def change_priority(self, pid, new_priority):
+        '''
+        Altera a prioridade de um processo. Se ele estiver na fila de prontos,
+        é reposicionado no heap em O(log n).
+        '''
+        if pid not in self.all_processes:
+            return False
+        
+        process = self.all_processes[pid]
+        process.priority = new_priority
+        if pid in self.ready_queue:
+            self.ready_queue.update(pid)
+        return True
+    
     def get_process_info(self, pid):
         '''
         Retorna informações sobre um processo específico.
         '''
         if pid in self.all_processes:
             return self.all_processes[pid]
+        if self.archive_terminated:
+            return self.terminated_table.find(pid)
         return None
     
     def list_all_processes(self):
@@ -161,6 +850,10 @@ class ProcessManager:
         '''
         for pid, process in self.all_processes.items():
             print(f"PID: {pid}, Nome: {process.name}, Estado: {process.state.value}, Prioridade: {process.priority}")
+        # Processos arquivados não guardam o nome
+        for index in range(len(self.terminated_table)):
+            record = self.terminated_table[index]
+            print(f"PID: {record.pid}, Nome: -, Estado: {record.state.value}, Prioridade: {record.priority}")
     
     def list_ready_processes(self):
         '''
@@ -170,31 +863,33 @@ class ProcessManager:
             print("Fila de processos prontos vazia.")
             return
         
-        # Cria uma cópia da fila para não afetar a original
-        ready_copy = self.ready_queue.copy()
         print("Processos prontos (ordenados por prioridade):")
-        while ready_copy:
-            process = heapq.heappop(ready_copy)
+        for process in self.ready_queue.ordered():
             print(f"  PID: {process.pid}, Nome: {process.name}, Prioridade: {process.priority}")
     
     def list_blocked_processes(self):
         '''
         Lista todos os processos na fila de bloqueados.
         '''
-        if not self.blocked_queue:
+        if self.blocked_count == 0:
             print("Fila de processos bloqueados vazia.")
             return
         
         print("Processos bloqueados (ordenados por tempo de bloqueio):")
-        for i, process in enumerate(self.blocked_queue):
+        # Intercala as filas de cada razão pela ordem global de bloqueio
+        blocked = (process for _, process in heapq.merge(*self.blocked_queues.values(),
+                                                         key=lambda entry: entry[0])
+                   if process.state == BLOCKED)
+        for i, process in enumerate(blocked):
             print(f"  {i+1}. PID: {process.pid}, Nome: {process.name}, Razão: {process.block_reason}")
 
 # Demonstração do uso do sistema de gerenciamento de processos
 def main():
     print("\n=== Sistema de Gerenciamento de Processos ===\n")
     
-    # Criar o gerenciador de processos
-    process_manager = ProcessManager()
+    # Criar o gerenciador de processos, exibindo as transições de estado via logging
+    logging.basicConfig(stream=sys.stdout, level=logging.INFO, format="%(message)s")
+    process_manager = ProcessManager(event_sink=LoggerEventSink())
     
     # Criar alguns processos com diferentes prioridades
     print("--- Criando processos ---")
@@ -238,6 +933,12 @@ def main():
     process_manager.unblock_process()
     print()
     
+    # Alterar a prioridade de um processo pronto
+    print("--- Alterando prioridade ---")
+    process_manager.change_priority(1, 4)
+    print("Prioridade do processo 1 alterada para 4.")
+    print()
+    
     # Listar processos prontos novamente
     process_manager.list_ready_processes()
     print()
@@ -256,6 +957,100 @@ def main():
         process_manager.terminate_process()
     
     print("\nTodos os processos foram executados e terminados.")
+    
+    # Criar um lote de processos e despachá-los em grupo
+    print("\n--- Criação e escalonamento em lote ---")
+    process_manager.create_processes([("Backup", 1), ("Indexador", 3), ("Compressor", 2), ("Sincronizador", 4)])
+    batch = process_manager.schedule_batch(2)
+    print(f"Processos despachados para 2 núcleos: {[process.name for process in batch]}")
+    for process in batch:
+        process_manager.terminate_process(process.pid)
+    while process_manager.ready_queue:
+        process_manager.schedule_next_process()
+        process_manager.terminate_process()
+    
+    # Escalonamento MLFQ com relógio manual e fatia de tempo
+    print("\n--- Escalonamento MLFQ ---")
+    clock = ManualClock()
+    mlfq_manager = ProcessManager(scheduler=MLFQScheduler(levels=3, base_quantum=1.0, boost_interval=20.0),
+                                  clock=clock)
+    cpu_bound = [mlfq_manager.create_process("Renderizador"), mlfq_manager.create_process("Compilador")]
+    for step in range(40):
+        if step == 20:
+            # Um processo novo entra no nível 0 e passa à frente dos processos rebaixados
+            cpu_bound.append(mlfq_manager.create_process("Editor"))
+        if mlfq_manager.running_process is None:
+            mlfq_manager.schedule_next_process()
+        clock.advance(0.5)
+        mlfq_manager.tick()
+    
+    for process in cpu_bound:
+        level = mlfq_manager.ready_queue.levels[process.pid]
+        print(f"{process.name}: nível {level}, execução {process.execution_time:.1f}, espera {process.wait_time:.1f}")
+    
+    # Registrar as transições em um buffer circular e consumi-las depois
+    print("\n--- Registro de eventos em buffer circular ---")
+    event_log = RingBufferEventSink(capacity=8)
+    silent_manager = ProcessManager(event_sink=event_log, archive_terminated=True)
+    compiler = silent_manager.create_process("Compilador", priority=1)
+    silent_manager.create_process("Terminal", priority=1)
+    silent_manager.create_process("Servidor Web", priority=1)
+    while silent_manager.ready_queue:
+        silent_manager.schedule_next_process()
+        silent_manager.terminate_process()
+    
+    print(f"Processos arquivados na tabela colunar: {len(silent_manager.terminated_table)}")
+    print(f"Registro arquivado do Compilador: {silent_manager.get_process_info(compiler.pid)}")
+    print(f"Eventos descartados por falta de espaço: {event_log.dropped}")
+    start = None
+    for timestamp, pid, from_state, to_state in event_log.drain():
+        start = start if start is not None else timestamp
+        origin = from_state.value if from_state else "-"
+        print(f"  +{(timestamp - start) * 1e6:8.1f} us  PID {pid}: {origin} -> {to_state.value}")
+
+# Comparação de desempenho do heap de prontos
+def benchmark_ready_heap(n=1000000, priorities=32):
+    '''
+    Compara heappush/heappop de objetos Process (comparados por Process.__lt__)
+    com tuplas (-prioridade, sequência, pid) e com a chave inteira usada pela
+    IndexedPriorityQueue, ambas comparadas em C.
+    '''
+    print(f"\n=== heappush/heappop com {n} entradas ===\n")
+    rng = random.Random(42)
+    processes = [Process("p", rng.randrange(priorities), creation_time=0.0) for _ in range(n)]
+    
+    heap = []
+    start = time.perf_counter()
+    for process in processes:
+        heapq.heappush(heap, process)
+    while heap:
+        heapq.heappop(heap)
+    elapsed = time.perf_counter() - start
+    print(f"Process.__lt__:                 {elapsed:.2f} s ({2 * n / elapsed / 1e6:.2f} M ops/s)")
+    
+    heap = []
+    sequence = itertools.count()
+    start = time.perf_counter()
+    for process in processes:
+        heapq.heappush(heap, (-process.priority, next(sequence), process.pid))
+    while heap:
+        heapq.heappop(heap)
+    elapsed = time.perf_counter() - start
+    print(f"Tuplas (-prioridade, seq, pid): {elapsed:.2f} s ({2 * n / elapsed / 1e6:.2f} M ops/s)")
+    
+    heap = []
+    sequence = itertools.count()
+    make_key = IndexedPriorityQueue.make_key
+    start = time.perf_counter()
+    for process in processes:
+        heapq.heappush(heap, make_key(process.priority, next(sequence), process.pid))
+    while heap:
+        heapq.heappop(heap)
+    elapsed = time.perf_counter() - start
+    print(f"Chave inteira codificada:       {elapsed:.2f} s ({2 * n / elapsed / 1e6:.2f} M ops/s)")
 
 if __name__ == "__main__":
-    main()
+    if "--benchmark" in sys.argv:
+        benchmark_ready_heap()
+    else:
+        main()